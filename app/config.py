@@ -17,6 +17,8 @@ INPUT_DIR = DATA_DIR / "input"
 TEMP_DIR = DATA_DIR / "temp"
 OUTPUT_DIR = DATA_DIR / "output"
 META_DIR = DATA_DIR / "meta"
+LLM_CACHE_DIR = DATA_DIR / "cache" / "llm"  # Claude 응답 캐시 (같은 요청 재실행 시 API 호출 생략)
+TTS_CACHE_DIR = DATA_DIR / "cache" / "tts"  # TTS 오디오 캐시 (같은 음성 + 같은 대본이면 합성 생략)
 
 # 임시 파일 디렉토리
 SLIDES_IMG_DIR = TEMP_DIR / "slides_img"
@@ -30,24 +32,46 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 
 # LLM 설정
 DEFAULT_LLM_MODEL = "claude-3-7-sonnet-20250219"  # Claude 3.7 Sonnet (최고 가성비!)
-LLM_TEMPERATURE = 0.7
+LLM_FAST_MODEL = os.getenv("LLM_FAST_MODEL", "claude-3-5-haiku-20241022")  # 내용이 적은 슬라이드용 빠른 모델
+LLM_FAST_MODEL_MAX_CHARS = int(os.getenv("LLM_FAST_MODEL_MAX_CHARS", "200"))  # 슬라이드 텍스트가 이보다 짧으면 빠른 모델 사용 (0이면 사용 안 함)
+LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.7"))  # 대본 생성 temperature (0이면 같은 입력에 같은 대본 → 재실행 시 응답 캐시와 결과가 일관됨)
 LLM_MAX_TOKENS = 4096
+LLM_SLIDES_PER_REQUEST = int(os.getenv("LLM_SLIDES_PER_REQUEST", "1"))  # 2 이상이면 여러 슬라이드 대본을 한 번의 요청으로 생성
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))  # 슬라이드 대본 동시 요청 수
+LLM_MAX_INFLIGHT = int(os.getenv("LLM_MAX_INFLIGHT", "8"))  # 동시 변환 작업 전체에서 동시에 보내는 Claude 요청 상한
+LLM_MAX_RETRIES = 4  # 속도 제한/타임아웃 시 재시도 횟수 (지수 백오프)
+LLM_MEMO_SIZE = 256  # Claude 응답 메모리 캐시 항목 수 (디스크 캐시 앞단)
+LLM_USE_BATCH_API = os.getenv("LLM_USE_BATCH_API", "false").lower() == "true"  # Message Batches API로 대본 일괄 생성 (비용 50% 절감, 대기 시간 증가)
+LLM_BATCH_API_MIN_SLIDES = 5  # 이보다 적은 슬라이드는 일반 요청으로 처리
+LLM_BATCH_API_TIMEOUT = int(os.getenv("LLM_BATCH_API_TIMEOUT", "3600"))  # 배치 완료 최대 대기 시간 (초)
+LLM_BATCH_API_POLL_INTERVAL = 10  # 배치 상태 확인 간격 (초)
+LLM_SEND_SLIDE_IMAGE = os.getenv("LLM_SEND_SLIDE_IMAGE", "false").lower() == "true"  # 대본 생성 시 슬라이드 이미지도 함께 전송
+
+# OCR 설정
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(min(2, max(1, (os.cpu_count() or 2) // 2)))))  # 슬라이드 OCR 프로세스 수 (워커마다 OCR 모델을 통째로 올리므로 기본 최대 2, 1이면 프로세스 풀 미사용)
 
 # TTS 설정
 TTS_PROVIDER = os.getenv("TTS_PROVIDER", "openai")  # "openai" or "elevenlabs"
 TTS_VOICE = os.getenv("TTS_VOICE", "alloy")  # OpenAI TTS voice
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "8"))  # 동시 TTS 요청 수
+TTS_MAX_INFLIGHT = int(os.getenv("TTS_MAX_INFLIGHT", "8"))  # 문장 분할 요청까지 합친 전체 TTS API 동시 요청 상한 (429 방지)
+TTS_CACHE_MAX_MB = int(os.getenv("TTS_CACHE_MAX_MB", "500"))  # TTS 오디오 캐시 최대 용량 (MB, 넘으면 오래 안 쓴 파일부터 삭제)
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY", "")
 
 # 비디오 설정
 VIDEO_WIDTH = 1920
 VIDEO_HEIGHT = 1080
 VIDEO_FPS = 30
-VIDEO_CODEC = "libx264"
+VIDEO_CODEC = os.getenv("VIDEO_CODEC", "auto")  # "auto"면 NVENC/QSV/VideoToolbox 중 동작하는 것, 없으면 libx264
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))  # 동시에 인코딩하는 슬라이드 클립 수 (FFmpeg 자체도 멀티스레드이므로 코어의 절반)
 AUDIO_CODEC = "aac"
 
 # FFmpeg 설정
 FFMPEG_PRESET = "medium"  # ultrafast, fast, medium, slow
 FFMPEG_CRF = 23  # 품질 설정 (0-51, 낮을수록 고품질)
 
+# UI 설정
+UI_LOG_TAIL_LINES = int(os.getenv("UI_LOG_TAIL_LINES", "200"))  # 진행 로그 화면에 보내는 최근 로그 줄 수 (0이면 전체)
+
 # 디버그 모드
 DEBUG = os.getenv("DEBUG", "false").lower() == "true"
@@ -6,6 +6,7 @@ import argparse
 from pathlib import Path
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent.parent
@@ -66,33 +67,43 @@ class PPTToVideoPipeline:
             parser = PPTParser(str(pptx_file))
             slides = parser.parse(slides_json, config.SLIDES_IMG_DIR)
 
-            # PPTX를 PNG 이미지로 변환
-            print("\nPPTX → PNG 변환 중...")
-            convert_pptx_to_images(pptx_file, config.SLIDES_IMG_DIR)
+            # PPTX를 PNG 이미지로 변환 (렌더링 단계에서만 필요하므로 대본/TTS 생성과 동시에 진행)
+            print("\nPPTX → PNG 변환 시작 (백그라운드)...")
+            image_executor = ThreadPoolExecutor(max_workers=1)
+            image_future = image_executor.submit(convert_pptx_to_images, pptx_file, config.SLIDES_IMG_DIR)
 
             # ===== 2단계: 대본 생성 =====
             self.print_step(2, total_steps, "AI 대본 생성")
 
             generator = ScriptGenerator(
                 api_key=config.ANTHROPIC_API_KEY,
-                model=config.DEFAULT_LLM_MODEL
+                model=config.DEFAULT_LLM_MODEL,
+                temperature=config.LLM_TEMPERATURE
             )
-            scripts = generator.generate_scripts(slides_json, scripts_json)
-
-            # ===== 3단계: TTS 생성 =====
-            self.print_step(3, total_steps, "TTS 음성 생성")
-
             tts = TTSClient(
                 provider=config.TTS_PROVIDER,
                 api_key=config.OPENAI_API_KEY,
-                voice=config.TTS_VOICE
-            )
-            audio_meta = tts.generate_audio(
-                scripts_json,
-                config.AUDIO_DIR,
-                audio_meta_json
+                voice=config.TTS_VOICE,
+                cache_dir=config.TTS_CACHE_DIR,
+                cache_max_mb=config.TTS_CACHE_MAX_MB,
+                max_inflight=config.TTS_MAX_INFLIGHT
             )
 
+            # 대본이 하나 나올 때마다 바로 TTS 시작 (대본 생성과 음성 합성을 겹쳐서 진행)
+            tts_futures = {}
+            with ThreadPoolExecutor(max_workers=config.TTS_CONCURRENCY) as tts_executor:
+                def start_tts(script_item):
+                    future = tts.submit_audio(tts_executor, script_item, config.AUDIO_DIR, audio_meta_json)
+                    tts_futures[future] = script_item
+
+                scripts = generator.generate_scripts(slides_json, scripts_json, on_script=start_tts)
+
+                # ===== 3단계: TTS 생성 =====
+                self.print_step(3, total_steps, "TTS 음성 생성")
+
+                # 대본 생성 중 이미 시작된 TTS 결과 수집
+                audio_meta = tts.collect_audio(tts_futures, audio_meta_json)
+
             # ===== 4단계: 강조 플랜 생성 (선택) =====
             if config.DEBUG:
                 self.print_step(4, total_steps, "강조 플랜 생성 (스킵)")
@@ -105,12 +116,19 @@ class PPTToVideoPipeline:
             # ===== 5단계: 영상 렌더링 =====
             self.print_step(5, total_steps, "영상 렌더링")
 
+            # 백그라운드 PPTX → PNG 변환 완료 대기 (실패 시 예외 그대로 전달)
+            try:
+                image_future.result()
+            finally:
+                image_executor.shutdown()
+
             renderer = FFmpegRenderer(
                 width=config.VIDEO_WIDTH,
                 height=config.VIDEO_HEIGHT,
                 fps=config.VIDEO_FPS,
                 preset=config.FFMPEG_PRESET,
-                crf=config.FFMPEG_CRF
+                crf=config.FFMPEG_CRF,
+                codec=config.VIDEO_CODEC
             )
 
             success = renderer.render_video(
@@ -119,7 +137,10 @@ class PPTToVideoPipeline:
                 config.SLIDES_IMG_DIR,
                 config.AUDIO_DIR,
                 config.CLIPS_DIR,
-                final_video
+                final_video,
+                slides=slides,
+                audio_meta=audio_meta,
+                max_workers=config.RENDER_WORKERS
             )
 
             if not success:
@@ -4,14 +4,117 @@
 """
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import subprocess
 import os
 import shutil
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from .font_utils import get_font_path_with_fallback
 
 
+# FFmpeg 실행 파일 경로 (import 시 한 번만 PATH 검색)
+FFMPEG_BIN = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE_BIN = shutil.which("ffprobe") or "ffprobe"
+# 인코딩 명령 공통 인자: 배너와 프레임마다 갱신되는 진행 통계를 stderr에 쓰지 않음
+# (capture_output으로 받는 파이프 I/O와 텍스트 디코딩량을 줄이고, 경고/에러 메시지는 그대로 남김)
+FFMPEG_QUIET_ARGS = ("-hide_banner", "-nostats")
+
+
+def _probe_ffmpeg(flag: str) -> str:
+    """ffmpeg 정보 출력 (-encoders, -hwaccels 등) 조회, 실패 시 빈 문자열"""
+    try:
+        result = subprocess.run(
+            [FFMPEG_BIN, "-hide_banner", flag],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return result.stdout
+    except Exception:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def get_ffmpeg_encoders() -> frozenset:
+    """사용 가능한 인코더 이름 집합 (최초 호출 시 한 번만 조회)"""
+    lines = _probe_ffmpeg("-encoders").splitlines()
+    # 헤더 설명 뒤 "------" 줄 이후가 실제 인코더 목록 (" V....D libx264  설명")
+    if any(line.strip() == "------" for line in lines):
+        lines = lines[[line.strip() for line in lines].index("------") + 1:]
+    return frozenset(
+        parts[1] for parts in (line.split() for line in lines) if len(parts) >= 2
+    )
+
+
+@lru_cache(maxsize=None)
+def get_ffmpeg_hwaccels() -> frozenset:
+    """사용 가능한 하드웨어 가속 방식 집합 (최초 호출 시 한 번만 조회)"""
+    lines = _probe_ffmpeg("-hwaccels").splitlines()
+    # 첫 줄은 "Hardware acceleration methods:" 헤더
+    return frozenset(line.strip() for line in lines[1:] if line.strip())
+
+
+# 자동 선택 시 시도할 H.264 하드웨어 인코더 (우선순위 순)
+HW_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox")
+# 소비자용 GPU의 동시 인코딩 세션 제한을 넘지 않도록 하드웨어 인코딩 시 동시 클립 수 상한
+HW_ENCODER_MAX_SESSIONS = 3
+# 슬라이드별 클립 렌더링에서 연속된 정지 슬라이드를 FFmpeg 한 번으로 묶어 인코딩할 최대 개수
+STILL_BATCH_SIZE = 8
+
+
+def _encoder_works(name: str) -> bool:
+    """인코더 목록에 있어도 GPU/드라이버가 없으면 실패하므로 짧은 테스트 인코딩으로 확인"""
+    try:
+        result = subprocess.run(
+            [
+                FFMPEG_BIN, "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                "-c:v", name, "-f", "null", "-"
+            ],
+            capture_output=True,
+            timeout=15
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=None)
+def available_video_codecs() -> Tuple[str, ...]:
+    """UI에서 고를 수 있는 비디오 인코더 목록 ("auto", libx264 + 이 FFmpeg 빌드에 포함된 하드웨어 인코더)"""
+    encoders = get_ffmpeg_encoders()
+    return ("auto", "libx264") + tuple(name for name in HW_ENCODERS if name in encoders)
+
+
+@lru_cache(maxsize=None)
+def _audio_result(audio_info) -> Optional[Dict]:
+    """
+    오디오 메타데이터 반환 (TTS Future가 넘어오면 해당 슬라이드 합성이 끝날 때까지 대기)
+
+    Returns:
+        오디오 메타데이터 딕셔너리 또는 None (TTS 실패 시)
+    """
+    if not isinstance(audio_info, Future):
+        return audio_info
+    try:
+        return audio_info.result()
+    except Exception as e:
+        print(f"  ⚠ TTS 실패로 슬라이드 제외: {e}")
+        return None
+
+
+def detect_hw_encoder() -> Optional[str]:
+    """실제로 동작하는 H.264 하드웨어 인코더 이름 (없으면 None, 최초 호출 시 한 번만 확인)"""
+    encoders = get_ffmpeg_encoders()
+    for name in HW_ENCODERS:
+        if name in encoders and _encoder_works(name):
+            print(f"🚀 하드웨어 인코더 사용 가능: {name}")
+            return name
+    return None
+
+
 class FFmpegRenderer:
     """FFmpeg를 사용하여 슬라이드를 영상으로 렌더링하는 클래스"""
 
@@ -21,7 +124,8 @@ class FFmpegRenderer:
         height: int = 1080,
         fps: int = 30,
         preset: str = "medium",
-        crf: int = 23
+        crf: int = 23,
+        codec: str = "auto"
     ):
         """
         Args:
@@ -30,14 +134,96 @@ class FFmpegRenderer:
             fps: 프레임 레이트
             preset: FFmpeg preset (ultrafast, fast, medium, slow)
             crf: 품질 설정 (0-51, 낮을수록 고품질)
+            codec: 비디오 인코더 ("auto"면 NVENC/QSV/VideoToolbox 중 동작하는 것, 없으면 libx264)
         """
         self.width = width
         self.height = height
         self.fps = fps
         self.preset = preset
         self.crf = crf
+        self.codec = codec
+        self._codec_lock = threading.Lock()  # 하드웨어 인코더 실패 시 codec 전환용
         self._nvenc_available = None  # 캐시
 
+    @property
+    def hw_encoder(self) -> Optional[str]:
+        """사용할 하드웨어 인코더 이름 (소프트웨어 인코딩이면 None)"""
+        if self.codec == "auto":
+            return detect_hw_encoder()
+        # 빌드에 없는 하드웨어 인코더를 지정하면 매 클립 실패 후 재시도하지 않도록 바로 libx264 사용
+        if self.codec in HW_ENCODERS and self.codec in get_ffmpeg_encoders():
+            return self.codec
+        return None
+
+    def video_codec_args(self, still_image: bool = False, software: bool = False) -> list:
+        """
+        비디오 인코더 인자 (하드웨어 인코더는 CRF 대신 각 인코더의 품질 옵션으로 변환)
+
+        Args:
+            still_image: 정지 이미지 위주 영상 여부 (libx264에서 -tune stillimage 적용)
+            software: True면 하드웨어 인코더가 있어도 libx264 사용
+
+        Returns:
+            FFmpeg 인자 리스트
+        """
+        encoder = None if software else self.hw_encoder
+        if encoder == "h264_nvenc":
+            quality = ["-preset", "p4", "-rc", "vbr", "-cq", str(self.crf), "-b:v", "0"]
+        elif encoder == "h264_qsv":
+            quality = ["-preset", "medium", "-global_quality", str(self.crf)]
+        elif encoder == "h264_videotoolbox":
+            # VideoToolbox 품질은 1~100 (높을수록 고품질) → CRF 23 ≈ 54
+            quality = ["-q:v", str(max(1, min(100, 100 - self.crf * 2)))]
+        else:
+            encoder = "libx264"
+            quality = ["-preset", self.preset, "-crf", str(self.crf)]
+            if still_image:
+                quality += ["-tune", "stillimage"]  # 정지 이미지 최적화 (중복 프레임이 거의 0바이트)
+
+        return [
+            "-c:v", encoder,
+            *quality,
+            "-profile:v", "main",  # H.264 프로파일 (호환성)
+            "-level", "4.0",  # H.264 레벨 (1080p 지원)
+            "-pix_fmt", "yuv420p",
+        ]
+
+    def _run_encode(self, build_cmd, still_image: bool = False, **run_kwargs) -> subprocess.CompletedProcess:
+        """
+        인코더 인자로 명령을 만드는 build_cmd를 실행 (하드웨어 인코더 실패 시 libx264로 전환해 재시도)
+
+        Args:
+            build_cmd: 인코더 인자 리스트를 받아 전체 FFmpeg 명령을 반환하는 함수
+            still_image: 정지 이미지 위주 영상 여부
+            **run_kwargs: subprocess.run 추가 인자 (cwd 등)
+
+        Returns:
+            subprocess.CompletedProcess (실패 시 CalledProcessError 발생)
+        """
+        # 실제로 시도한 인코더를 먼저 기록 (실패 후 self.codec을 다시 읽으면 다른 스레드가 이미
+        # libx264로 바꿔 놓았을 수 있어 하드웨어 실패를 재시도 없이 넘겨 버리게 됨)
+        codec_args = self.video_codec_args(still_image)
+        used_encoder = codec_args[codec_args.index("-c:v") + 1]
+        try:
+            return subprocess.run(
+                build_cmd(codec_args),
+                capture_output=True, text=True, check=True, **run_kwargs
+            )
+        except subprocess.CalledProcessError:
+            if used_encoder == "libx264":
+                raise
+            failed_encoder = used_encoder
+            # 클립마다 따로 판단하면 하드웨어/libx264 클립이 섞여 -c copy 연결 시 재생 오류가 나므로
+            # 한 번 실패하면 이 렌더러의 이후 인코딩은 모두 libx264로 고정
+            with self._codec_lock:
+                if self.codec != "libx264":
+                    self.codec = "libx264"
+                    print(f"  ⚠️  {failed_encoder} 인코딩 실패 → 이후 인코딩은 모두 libx264로 진행")
+            return subprocess.run(
+                build_cmd(self.video_codec_args(still_image, software=True)),
+                capture_output=True, text=True, check=True, **run_kwargs
+            )
+
     def is_nvenc_available(self) -> bool:
         """NVIDIA GPU 인코딩(NVENC) 사용 가능 여부 확인"""
         if self._nvenc_available is not None:
@@ -54,14 +240,8 @@ class FFmpegRenderer:
                 self._nvenc_available = False
                 return False
 
-            # ffmpeg에서 nvenc 인코더 확인
-            result = subprocess.run(
-                ["ffmpeg", "-hide_banner", "-encoders"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            self._nvenc_available = "h264_nvenc" in result.stdout
+            # ffmpeg에서 nvenc 인코더 확인 (프로세스 전체에서 한 번만 조회)
+            self._nvenc_available = "h264_nvenc" in get_ffmpeg_encoders()
             if self._nvenc_available:
                 print("🚀 NVIDIA GPU 인코딩(NVENC) 사용 가능 - 빠른 인코딩!")
             return self._nvenc_available
@@ -70,27 +250,8 @@ class FFmpegRenderer:
             return False
 
     def get_video_encoder_args(self) -> list:
-        """비디오 인코더 인자 반환 (NVENC 우선, 없으면 libx264)"""
-        if self.is_nvenc_available():
-            # NVENC 사용 (GPU 인코딩) - 훨씬 빠름
-            return [
-                "-c:v", "h264_nvenc",
-                "-preset", "p4",  # NVENC preset (p1~p7, p4가 균형)
-                "-cq", str(self.crf),  # 품질 설정
-                "-profile:v", "main",
-                "-level", "4.0",
-                "-pix_fmt", "yuv420p",
-            ]
-        else:
-            # CPU 인코딩 (기본)
-            return [
-                "-c:v", "libx264",
-                "-preset", self.preset,
-                "-crf", str(self.crf),
-                "-profile:v", "main",
-                "-level", "4.0",
-                "-pix_fmt", "yuv420p",
-            ]
+        """비디오 인코더 인자 반환 (하드웨어 인코더 우선, 없으면 libx264)"""
+        return self.video_codec_args()
 
     def create_slide_clip(
         self,
@@ -101,7 +262,8 @@ class FFmpegRenderer:
         keyword_overlays: Optional[List[Dict[str, Any]]] = None,
         enable_keyword_marking: bool = False,
         highlight: Optional[Dict[str, Any]] = None,
-        arrow_pointers: Optional[List[Dict[str, Any]]] = None
+        arrow_pointers: Optional[List[Dict[str, Any]]] = None,
+        threads: Optional[int] = None
     ) -> bool:
         """
         단일 슬라이드 클립 생성 (이미지 + 오디오 + 키워드 마킹 오버레이 + 하이라이트 + 화살표)
@@ -115,16 +277,21 @@ class FFmpegRenderer:
             enable_keyword_marking: 키워드 마킹 사용 여부
             highlight: 핵심 문구 하이라이트 {"text": "강조문구", "timing": 5.0}
             arrow_pointers: 화살표 포인터 리스트 [{"target_x": 100, "target_y": 200, "timing": 3.0}, ...]
+            threads: 인코더 스레드 수 (None이면 FFmpeg 기본값 - 코어 수 기준)
 
         Returns:
             성공 여부
         """
         try:
             # 기본 FFmpeg 명령 시작
+            # 정지 이미지는 항상 1fps로 읽고 fps 필터로 프레임만 복제
+            # (-loop 1은 매 프레임 PNG를 다시 디코딩하므로 디코딩을 초당 1회로 줄임)
+            # 시간 기반 오버레이는 fps 필터 이후 프레임 단위로 평가되므로 타이밍 정밀도는 동일
             cmd = [
-                "ffmpeg",
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
                 "-y",  # 덮어쓰기
                 "-loop", "1",  # 이미지 루프
+                "-framerate", "1",  # 입력 프레임레이트
                 "-i", str(image_path),  # 입력 이미지 (input 0)
             ]
 
@@ -143,7 +310,7 @@ class FFmpegRenderer:
                         print(f"      - 파일 존재: {path_exists}")
 
                         if path_exists:
-                            cmd.extend(["-loop", "1", "-i", str(overlay_path)])
+                            cmd.extend(["-loop", "1", "-framerate", "1", "-i", str(overlay_path)])
                             overlay_inputs.append(overlay_info)
                             print(f"      ✓ 오버레이 추가됨")
                         else:
@@ -165,7 +332,7 @@ class FFmpegRenderer:
                 arrow_png = Path(__file__).parent.parent / "assets" / "arrow_pointer.png"
                 if arrow_png.exists():
                     for arrow_info in arrow_pointers:
-                        cmd.extend(["-loop", "1", "-i", str(arrow_png)])
+                        cmd.extend(["-loop", "1", "-framerate", "1", "-i", str(arrow_png)])
                         arrow_inputs.append(arrow_info)
                         print(f"    🏹 화살표 추가: {arrow_info.get('keyword', '')} @{arrow_info.get('timing', 0):.1f}초")
                 else:
@@ -181,7 +348,7 @@ class FFmpegRenderer:
 
             if has_overlay or has_highlight or has_arrow:
                 # 복합 필터 구성
-                filter_complex = f"[0:v]format=yuv420p[base]"
+                filter_complex = f"[0:v]fps={self.fps},format=yuv420p[base]"
                 prev_label = "base"
                 final_label = "out"
 
@@ -298,25 +465,21 @@ class FFmpegRenderer:
                 audio_input_idx = 1 + len(overlay_inputs) + len(arrow_inputs)
                 cmd.extend(["-map", f"{audio_input_idx}:a"])  # 오디오 출력 매핑
             else:
-                # 오버레이/하이라이트 없음: 포맷 변환만 수행
-                cmd.extend(["-vf", "format=yuv420p"])
+                # 오버레이/하이라이트 없음: 1fps 입력을 출력 fps로 복제 + 포맷 변환
+                cmd.extend(["-vf", f"fps={self.fps},format=yuv420p"])
 
-            # 공통 인코딩 옵션 (Windows Media Player 호환)
-            cmd.extend([
-                "-c:v", "libx264",  # 비디오 코덱
-                "-profile:v", "main",  # H.264 프로파일 (호환성)
-                "-level", "4.0",  # H.264 레벨 (1080p 지원)
-                "-preset", self.preset,  # 인코딩 속도
-                "-crf", str(self.crf),  # 품질
+            # 공통 인코딩 옵션 (Windows Media Player 호환) - 비디오 인코더 인자는 실행 시 결정
+            output_args = [
                 "-c:a", "aac",  # 오디오 코덱
                 "-b:a", "192k",  # 오디오 비트레이트
                 "-ar", "44100",  # 샘플레이트
-                "-pix_fmt", "yuv420p",  # 픽셀 포맷
                 "-movflags", "+faststart",  # 웹 스트리밍 최적화
                 "-t", str(duration),  # 영상 길이
                 "-shortest",  # 짧은 입력에 맞춤
-                str(output_path)
-            ])
+            ]
+            if threads:
+                output_args.extend(["-threads", str(threads)])
+            output_args.append(str(output_path))
 
             # 디버그: FFmpeg 명령어 출력
             if overlay_inputs:
@@ -326,11 +489,9 @@ class FFmpegRenderer:
                 print(f"  - 오버레이 파일: {overlay_files}")
                 print(f"  - 타이밍: {timings}")
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
+            result = self._run_encode(
+                lambda codec_args: cmd + codec_args + output_args,
+                still_image=True
             )
 
             if result.stderr and "error" in result.stderr.lower():
@@ -357,8 +518,8 @@ class FFmpegRenderer:
         Returns:
             성공 여부
         """
-        # concat 파일 생성
-        concat_file = output_path.parent / "concat_list.txt"
+        # concat 파일 생성 (묶음 클립 재시도와 동시에 실행될 수 있어 출력 파일별로 이름 구분)
+        concat_file = output_path.parent / f"{output_path.stem}_concat_list.txt"
 
         with open(concat_file, 'w') as f:
             for clip_path in clip_paths:
@@ -366,12 +527,13 @@ class FFmpegRenderer:
 
         try:
             cmd = [
-                "ffmpeg",
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
                 "-y",
                 "-f", "concat",
                 "-safe", "0",
                 "-i", str(concat_file),
                 "-c", "copy",
+                "-movflags", "+faststart",  # moov를 앞으로 옮겨 브라우저가 바로 재생 (Gradio 재변환 방지)
                 str(output_path)
             ]
 
@@ -391,11 +553,81 @@ class FFmpegRenderer:
             print(f"✗ FFmpeg concat 에러: {e.stderr}")
             return False
 
+    def render_stills_single_pass(
+        self,
+        segments: List[Tuple[Path, Path, float]],
+        output_path: Path,
+        threads: Optional[int] = None
+    ) -> bool:
+        """
+        정지 슬라이드만 있는 영상을 FFmpeg 한 번으로 렌더링 (슬라이드별 클립 생성/연결 생략)
+
+        이미지와 오디오를 각각 concat demuxer 목록으로 만들어 인코더를 한 번만 초기화함
+        (오버레이/하이라이트/화살표/전환 효과가 없는 경우에만 사용)
+
+        Args:
+            segments: [(슬라이드 이미지 경로, 오디오 경로, 길이(초)), ...] (재생 순서)
+            output_path: 출력 영상 경로
+            threads: 인코더 스레드 수 (None이면 FFmpeg 기본값 - 코어 수 기준)
+
+        Returns:
+            성공 여부
+        """
+        def quote(path: Path) -> str:
+            # concat 목록의 작은따옴표 이스케이프
+            return str(path.absolute()).replace("'", "'\\''")
+
+        # 여러 묶음을 같은 폴더에서 동시에 렌더링할 수 있으므로 목록 파일 이름을 출력 파일별로 구분
+        image_list = output_path.parent / f"{output_path.stem}_images.txt"
+        audio_list = output_path.parent / f"{output_path.stem}_audio.txt"
+
+        with open(image_list, 'w', encoding='utf-8') as f:
+            for image_path, _, duration in segments:
+                f.write(f"file '{quote(image_path)}'\nduration {duration:.3f}\n")
+            # concat demuxer는 마지막 항목의 duration을 무시하므로 마지막 이미지를 한 번 더 기록
+            f.write(f"file '{quote(segments[-1][0])}'\n")
+
+        with open(audio_list, 'w', encoding='utf-8') as f:
+            for _, audio_path, _ in segments:
+                f.write(f"file '{quote(audio_path)}'\n")
+
+        total_duration = sum(duration for _, _, duration in segments)
+
+        try:
+            input_args = [
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
+                "-y",
+                "-f", "concat", "-safe", "0", "-i", str(image_list),
+                "-f", "concat", "-safe", "0", "-i", str(audio_list),
+                "-map", "0:v", "-map", "1:a",
+                "-vf", f"fps={self.fps},format=yuv420p",
+            ]
+            output_args = [
+                "-c:a", "aac",
+                "-b:a", "192k",
+                "-ar", "44100",
+                "-movflags", "+faststart",
+                "-t", f"{total_duration:.3f}",
+            ]
+            if threads:
+                output_args.extend(["-threads", str(threads)])
+            output_args.append(str(output_path))
+
+            self._run_encode(lambda codec_args: input_args + codec_args + output_args, still_image=True)
+            return True
+
+        except subprocess.CalledProcessError as e:
+            print(f"✗ FFmpeg 단일 패스 렌더링 에러: {e.stderr}")
+            return False
+        finally:
+            image_list.unlink(missing_ok=True)
+            audio_list.unlink(missing_ok=True)
+
     def get_video_duration(self, video_path: Path) -> float:
         """영상 길이 가져오기 (초)"""
         try:
             cmd = [
-                "ffprobe",
+                FFPROBE_BIN,
                 "-v", "error",
                 "-show_entries", "format=duration",
                 "-of", "default=noprint_wrappers=1:nokey=1",
@@ -454,7 +686,7 @@ class FFmpegRenderer:
                 clip_durations.append(clip_duration)
 
             # FFmpeg 명령 구성
-            cmd = ["ffmpeg", "-y"]
+            cmd = [FFMPEG_BIN, *FFMPEG_QUIET_ARGS, "-y"]
 
             # 모든 클립 입력
             for clip_path in clip_paths:
@@ -502,23 +734,14 @@ class FFmpegRenderer:
                 "-filter_complex", filter_complex,
                 "-map", "[outv]",
                 "-map", "[outa]",
-                "-c:v", "libx264",
-                "-profile:v", "main",  # H.264 프로파일 (호환성)
-                "-level", "4.0",  # H.264 레벨 (1080p 지원)
-                "-preset", self.preset,
-                "-crf", str(self.crf),
-                "-pix_fmt", "yuv420p",  # 픽셀 포맷
+            ])
+            output_args = [
                 "-c:a", "aac",
                 "-movflags", "+faststart",  # 웹 스트리밍 최적화
                 str(output_path)
-            ])
+            ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            self._run_encode(lambda codec_args: cmd + codec_args + output_args)
 
             return True
 
@@ -548,7 +771,7 @@ class FFmpegRenderer:
 
             # 방법 1: force_style로 한글 폰트 지정 (Windows 호환 인코딩)
             cmd = [
-                "ffmpeg",
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
                 "-i", str(input_video),
                 "-vf", f"subtitles={temp_subtitle.name}:force_style='FontName=Malgun Gothic,FontSize={font_size},PrimaryColour=&HFFFFFF&,OutlineColour=&H000000&,BorderStyle=3,Outline=2,Shadow=1,MarginV=30'",
                 "-c:v", "libx264",  # 비디오 코덱
@@ -582,10 +805,12 @@ class FFmpegRenderer:
 
                 # 방법 2: force_style 없이 기본 설정 사용
                 cmd_simple = [
-                    "ffmpeg",
+                    FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
                     "-i", str(input_video),
                     "-vf", f"subtitles={temp_subtitle.name}",
+                    "-pix_fmt", "yuv420p",
                     "-c:a", "copy",
+                    "-movflags", "+faststart",
                     "-y",
                     str(output_video)
                 ]
@@ -623,7 +848,8 @@ class FFmpegRenderer:
         audio_dir: Path,
         clips_dir: Path,
         scripts_data: Dict,
-        enable_keyword_marking: bool
+        enable_keyword_marking: bool,
+        threads: Optional[int] = None
     ) -> Optional[Path]:
         """
         단일 슬라이드 클립 생성 (병렬 처리용 헬퍼 함수)
@@ -636,6 +862,7 @@ class FFmpegRenderer:
             clips_dir: 클립 출력 디렉토리
             scripts_data: 대본 데이터 딕셔너리
             enable_keyword_marking: 키워드 마킹 사용 여부
+            threads: 클립 하나에 쓸 인코더 스레드 수
 
         Returns:
             생성된 클립 경로 또는 None (실패 시)
@@ -689,7 +916,8 @@ class FFmpegRenderer:
             keyword_overlays=keyword_overlays,
             enable_keyword_marking=enable_keyword_marking,
             highlight=highlight,
-            arrow_pointers=arrow_pointers
+            arrow_pointers=arrow_pointers,
+            threads=threads
         )
 
         if success:
@@ -699,78 +927,213 @@ class FFmpegRenderer:
             print(f"    ✗ 실패")
             return None
 
-    def render_video(
+    def _plain_still_segment(
         self,
-        slides_json_path: Path,
-        audio_meta_path: Path,
+        slide: Dict,
+        audio_info: Dict,
+        slides_img_dir: Path,
+        audio_dir: Path,
+        scripts_data: Dict,
+        enable_keyword_marking: bool
+    ) -> Optional[Tuple[Path, Path, float]]:
+        """
+        슬라이드가 정지 이미지+오디오뿐이면 단일 패스 렌더링용 구간 반환
+
+        Returns:
+            (이미지 경로, 오디오 경로, 길이) 또는 None (오버레이 등이 있거나 파일이 없으면)
+        """
+        index = slide["index"]
+        script = scripts_data.get(index, {})
+        if enable_keyword_marking and any(kw.get("found") for kw in script.get("keyword_overlays", [])):
+            return None
+        if (script.get("highlight") or {}).get("text") or script.get("arrow_pointers"):
+            return None
+
+        image_path = slides_img_dir / f"slide_{index:03d}.png"
+        audio_path = audio_dir / f"slide_{index:03d}.mp3"
+        if not image_path.exists() or not audio_path.exists():
+            return None
+        return image_path, audio_path, audio_info["duration"]
+
+    def _plain_still_segments(
+        self,
+        slides: List[Dict],
+        audio_meta: List[Dict],
+        slides_img_dir: Path,
+        audio_dir: Path,
+        scripts_data: Dict,
+        enable_keyword_marking: bool
+    ) -> Optional[List[Tuple[Path, Path, float]]]:
+        """
+        모든 슬라이드가 정지 이미지+오디오뿐이면 단일 패스 렌더링용 구간 목록 반환
+
+        Returns:
+            [(이미지 경로, 오디오 경로, 길이), ...] 또는 None (오버레이 등이 있거나 파일이 없는 슬라이드가 있으면)
+        """
+        segments = []
+        for slide, audio_info in zip(slides, audio_meta):
+            if audio_info is None:
+                return None
+            segment = self._plain_still_segment(
+                slide, audio_info, slides_img_dir, audio_dir, scripts_data, enable_keyword_marking
+            )
+            if segment is None:
+                return None
+            segments.append(segment)
+
+        if len(segments) != len(slides):
+            return None
+        return segments
+
+    def _render_still_batch(
+        self,
+        batch: List[Tuple[Dict, Dict, Tuple[Path, Path, float]]],
         slides_img_dir: Path,
         audio_dir: Path,
         clips_dir: Path,
-        output_video_path: Path,
-        scripts_json_path: Optional[Path] = None,
-        enable_keyword_marking: bool = False,
-        transition_effect: str = "fade",
-        transition_duration: float = 0.5,
-        subtitle_file: Optional[Path] = None,
-        subtitle_font_size: int = 18,
-        max_workers: int = 3
-    ) -> bool:
+        scripts_data: Dict,
+        enable_keyword_marking: bool,
+        threads: Optional[int] = None
+    ) -> Optional[Path]:
         """
-        전체 영상 렌더링 (병렬 처리)
+        연속된 정지 슬라이드 여러 장을 FFmpeg 한 번으로 하나의 클립으로 렌더링 (병렬 처리용 헬퍼 함수)
+
+        슬라이드마다 FFmpeg/인코더를 새로 띄우는 비용을 묶음 단위로 한 번만 치름.
+        묶음 렌더링이 실패하면 슬라이드별 클립으로 다시 만들어 하나로 연결
 
         Args:
-            slides_json_path: 슬라이드 정보 JSON
-            audio_meta_path: 오디오 메타데이터 JSON
+            batch: [(슬라이드 정보, 오디오 메타데이터, 단일 패스 구간), ...] (재생 순서)
             slides_img_dir: 슬라이드 이미지 디렉토리
             audio_dir: 오디오 디렉토리
-            clips_dir: 클립 임시 디렉토리
-            output_video_path: 최종 출력 영상 경로
-            scripts_json_path: 대본 정보 JSON (키워드 오버레이 포함)
+            clips_dir: 클립 출력 디렉토리
+            scripts_data: 대본 데이터 딕셔너리
             enable_keyword_marking: 키워드 마킹 사용 여부
-            subtitle_file: 자막 SRT 파일 경로 (선택적)
-            transition_effect: 슬라이드 전환 효과 ("none", "fade", "dissolve", "slide", "wipe")
-            transition_duration: 전환 효과 길이 (초)
-            max_workers: 최대 병렬 작업 수 (기본 3개, FFmpeg는 CPU 집약적이므로 낮게 설정)
+            threads: 클립 하나에 쓸 인코더 스레드 수
 
         Returns:
-            성공 여부
+            생성된 클립 경로 또는 None (실패 시)
         """
-        # 데이터 로드
-        with open(slides_json_path, 'r', encoding='utf-8') as f:
-            slides = json.load(f)
+        first_index = batch[0][0]["index"]
+        last_index = batch[-1][0]["index"]
+        clip_path = clips_dir / f"clip_{first_index:03d}_{last_index:03d}.mp4"
 
-        with open(audio_meta_path, 'r', encoding='utf-8') as f:
-            audio_meta = json.load(f)
+        print(f"  슬라이드 {first_index}~{last_index}: 정지 슬라이드 {len(batch)}개 묶음 클립 생성 중...")
+        if self.render_stills_single_pass([segment for _, _, segment in batch], clip_path, threads=threads):
+            print(f"    ✓ 완료 ({sum(segment[2] for _, _, segment in batch):.1f}초)")
+            return clip_path
 
-        # 대본 데이터 로드 (키워드 오버레이 포함)
-        scripts_data = {}
-        if scripts_json_path and scripts_json_path.exists():
-            with open(scripts_json_path, 'r', encoding='utf-8') as f:
-                scripts_list = json.load(f)
-                # index로 빠르게 검색할 수 있도록 딕셔너리로 변환
-                scripts_data = {s["index"]: s for s in scripts_list}
+        print(f"    → 슬라이드 {first_index}~{last_index}: 슬라이드별 클립으로 다시 시도합니다")
+        clip_paths = []
+        for slide, audio_info, _ in batch:
+            single_clip = self._render_single_clip(
+                slide, audio_info, slides_img_dir, audio_dir, clips_dir,
+                scripts_data, enable_keyword_marking, threads
+            )
+            if single_clip:
+                clip_paths.append(single_clip)
+        if clip_paths and self.concatenate_clips(clip_paths, clip_path):
+            return clip_path
+        return None
 
-        clips_dir.mkdir(parents=True, exist_ok=True)
+    def _render_clips_and_concat(
+        self,
+        slides: List[Dict],
+        audio_meta: List[Dict],
+        slides_img_dir: Path,
+        audio_dir: Path,
+        clips_dir: Path,
+        output_video_path: Path,
+        scripts_data: Dict,
+        enable_keyword_marking: bool,
+        transition_effect: str,
+        transition_duration: float,
+        max_workers: Optional[int]
+    ) -> bool:
+        """
+        슬라이드별 클립을 병렬로 만든 뒤 하나로 연결 (오버레이/전환 효과가 있는 경우)
 
-        print(f"영상 렌더링 시작: {len(slides)}개 슬라이드 (병렬 처리: {max_workers}개 동시)")
+        전환 효과가 없으면 오버레이 없는 연속 슬라이드는 STILL_BATCH_SIZE개씩 한 클립으로 묶어 인코딩
 
-        # 병렬 처리로 슬라이드별 클립 생성
+        Returns:
+            성공 여부
+        """
+        clips_dir.mkdir(parents=True, exist_ok=True)
+        started_with_hw = self.hw_encoder is not None
+
+        # 슬라이드 클립은 서로 독립적이므로 FFmpeg 프로세스를 동시에 실행
+        # (스레드는 subprocess 대기만 하므로 GIL 영향 없음, FFmpeg 자체도 멀티스레드라 기본은 코어의 절반)
+        if max_workers is None:
+            max_workers = (os.cpu_count() or 2) // 2
+        max_workers = max(1, min(max_workers, len(slides)))
+        if self.hw_encoder:
+            max_workers = min(max_workers, HW_ENCODER_MAX_SESSIONS)
+        # 동시에 도는 FFmpeg마다 코어 수만큼 스레드를 만들면 과할당되므로 코어를 나눠 가짐
+        clip_threads = max(2, (os.cpu_count() or 1) // max_workers)
+
+        print(f"영상 렌더링 시작: {len(slides)}개 슬라이드 (병렬 처리: {max_workers}개 동시, 클립당 스레드: {clip_threads})")
+
+        # 전환 효과가 없으면 연속된 정지 슬라이드를 STILL_BATCH_SIZE개씩 묶어 FFmpeg 한 번으로 인코딩
+        # (xfade 전환은 슬라이드 경계마다 클립이 따로 있어야 하므로 묶지 않음)
+        use_transition = transition_effect != "none" and transition_duration > 0
+        batch_size = 1 if use_transition else STILL_BATCH_SIZE
+
+        # 병렬 처리로 슬라이드별(또는 정지 슬라이드 묶음별) 클립 생성
         clip_results = []
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # 모든 작업 제출
             future_to_slide = {}
+            batch = []
+            batch_start = 0
+
+            def submit_batch():
+                # 한 장뿐인 묶음은 기존 슬라이드별 클립 생성과 동일하게 처리
+                if len(batch) == 1:
+                    slide, audio_info, _ = batch[0]
+                    future = executor.submit(
+                        self._render_single_clip, slide, audio_info, slides_img_dir, audio_dir,
+                        clips_dir, scripts_data, enable_keyword_marking, clip_threads
+                    )
+                else:
+                    future = executor.submit(
+                        self._render_still_batch, list(batch), slides_img_dir, audio_dir,
+                        clips_dir, scripts_data, enable_keyword_marking, clip_threads
+                    )
+                future_to_slide[future] = (batch_start, batch[0][0])
+                batch.clear()
+
+            # 모든 작업 제출 (TTS Future면 해당 슬라이드 음성이 나오는 대로 제출, 그동안 앞 슬라이드 클립은 인코딩 중)
             for i, slide in enumerate(slides):
+                audio_info = _audio_result(audio_meta[i])
+                if audio_info is None:
+                    continue
+                segment = None
+                if batch_size > 1:
+                    segment = self._plain_still_segment(
+                        slide, audio_info, slides_img_dir, audio_dir, scripts_data, enable_keyword_marking
+                    )
+                if segment is not None:
+                    if not batch:
+                        batch_start = i
+                    batch.append((slide, audio_info, segment))
+                    if len(batch) >= batch_size:
+                        submit_batch()
+                    continue
+
+                if batch:
+                    submit_batch()
                 future = executor.submit(
                     self._render_single_clip,
                     slide,
-                    audio_meta[i],
+                    audio_info,
                     slides_img_dir,
                     audio_dir,
                     clips_dir,
                     scripts_data,
-                    enable_keyword_marking
+                    enable_keyword_marking,
+                    clip_threads
                 )
                 future_to_slide[future] = (i, slide)
+            if batch:
+                submit_batch()
 
             # 완료되는 순서대로 결과 수집
             for future in as_completed(future_to_slide):
@@ -786,14 +1149,29 @@ class FFmpegRenderer:
         clip_results.sort(key=lambda x: x[0])
         clip_paths = [clip_path for _, clip_path in clip_results]
 
+        # 렌더링 도중 하드웨어 인코더가 실패해 libx264로 바뀌었으면 모든 클립을 libx264로 다시 만듦
+        # - -c copy 연결: 이미 하드웨어로 만든 클립과 섞이면 재생 오류
+        # - 전환 효과: 재인코딩하므로 섞여도 되지만 빠진 클립이 있으면 남은 클립만 이어 붙이지 않음
+        missing_clips = len(future_to_slide) - len(clip_paths)
+        if started_with_hw and self.hw_encoder is None and (
+            missing_clips > 0 or (not use_transition and len(clip_paths) > 1)
+        ):
+            print("  → 인코더가 섞이거나 빠진 클립이 없도록 모든 클립을 libx264로 다시 생성합니다")
+            return self._render_clips_and_concat(
+                slides, audio_meta, slides_img_dir, audio_dir, clips_dir, output_video_path,
+                scripts_data, enable_keyword_marking, transition_effect, transition_duration, max_workers
+            )
+
         if not clip_paths:
             print("✗ 생성된 클립이 없습니다.")
             return False
+        if missing_clips > 0:
+            print(f"  ⚠ 클립 {missing_clips}개 생성 실패 (해당 슬라이드 제외)")
 
         # 클립 연결
         print(f"\n클립 연결 중: {len(clip_paths)}개 클립")
 
-        if transition_effect != "none" and transition_duration > 0:
+        if use_transition:
             print(f"  - 전환 효과: {transition_effect} ({transition_duration}초)")
             success = self.concatenate_clips_with_transition(
                 clip_paths, output_video_path, transition_effect, transition_duration
@@ -801,34 +1179,137 @@ class FFmpegRenderer:
         else:
             success = self.concatenate_clips(clip_paths, output_video_path)
 
-        if success:
-            # 자막 추가 (선택적)
-            if subtitle_file and subtitle_file.exists():
-                print(f"\n자막 추가 중: {subtitle_file.name}")
-                temp_video = output_video_path.parent / f"{output_video_path.stem}_no_subs.mp4"
+        return success
 
-                try:
-                    # 원본을 임시 파일로 이동
-                    shutil.move(str(output_video_path), str(temp_video))
+    def add_subtitles(self, video_path: Path, subtitle_file: Path, font_size: int = 18) -> bool:
+        """
+        완성된 영상에 SRT 자막을 입혀 같은 경로에 덮어씀 (실패하면 자막 없는 원본 유지)
 
-                    subtitle_success = self.burn_subtitles(temp_video, subtitle_file, output_video_path, subtitle_font_size)
+        Args:
+            video_path: 영상 파일 (결과로 교체됨)
+            subtitle_file: SRT 자막 파일
+            font_size: 자막 폰트 크기
 
-                    if subtitle_success:
-                        print(f"  ✓ 자막 추가 완료")
-                        # 임시 파일 삭제
-                        if temp_video.exists():
-                            temp_video.unlink()
-                    else:
-                        print(f"  ✗ 자막 추가 실패, 자막 없는 영상 사용")
-                        # 실패 시 원본 복구
-                        if temp_video.exists():
-                            shutil.move(str(temp_video), str(output_video_path))
+        Returns:
+            자막 추가 성공 여부
+        """
+        if not subtitle_file.exists():
+            return False
 
-                except Exception as e:
-                    print(f"  ✗ 자막 처리 중 오류: {e}")
-                    # 오류 발생 시 원본 복구 시도
-                    if temp_video.exists() and not output_video_path.exists():
-                        shutil.move(str(temp_video), str(output_video_path))
+        print(f"\n자막 추가 중: {subtitle_file.name}")
+        temp_video = video_path.parent / f"{video_path.stem}_no_subs.mp4"
+
+        try:
+            # 원본을 임시 파일로 이동
+            shutil.move(str(video_path), str(temp_video))
+
+            subtitle_success = self.burn_subtitles(temp_video, subtitle_file, video_path, font_size)
+
+            if subtitle_success:
+                print(f"  ✓ 자막 추가 완료")
+                # 임시 파일 삭제
+                if temp_video.exists():
+                    temp_video.unlink()
+            else:
+                print(f"  ✗ 자막 추가 실패, 자막 없는 영상 사용")
+                # 실패 시 원본 복구
+                if temp_video.exists():
+                    shutil.move(str(temp_video), str(video_path))
+            return subtitle_success
+
+        except Exception as e:
+            print(f"  ✗ 자막 처리 중 오류: {e}")
+            # 오류 발생 시 원본 복구 시도
+            if temp_video.exists() and not video_path.exists():
+                shutil.move(str(temp_video), str(video_path))
+            return False
+
+    def render_video(
+        self,
+        slides_json_path: Path,
+        audio_meta_path: Path,
+        slides_img_dir: Path,
+        audio_dir: Path,
+        clips_dir: Path,
+        output_video_path: Path,
+        scripts_json_path: Optional[Path] = None,
+        enable_keyword_marking: bool = False,
+        transition_effect: str = "fade",
+        transition_duration: float = 0.5,
+        subtitle_file: Optional[Path] = None,
+        subtitle_font_size: int = 18,
+        max_workers: Optional[int] = None,
+        slides: Optional[List[Dict]] = None,
+        audio_meta: Optional[List[Dict]] = None,
+        scripts: Optional[List[Dict]] = None
+    ) -> bool:
+        """
+        전체 영상 렌더링 (병렬 처리)
+
+        Args:
+            slides_json_path: 슬라이드 정보 JSON
+            audio_meta_path: 오디오 메타데이터 JSON
+            slides_img_dir: 슬라이드 이미지 디렉토리
+            audio_dir: 오디오 디렉토리
+            clips_dir: 클립 임시 디렉토리
+            output_video_path: 최종 출력 영상 경로
+            scripts_json_path: 대본 정보 JSON (키워드 오버레이 포함)
+            enable_keyword_marking: 키워드 마킹 사용 여부
+            subtitle_file: 자막 SRT 파일 경로 (선택적)
+            transition_effect: 슬라이드 전환 효과 ("none", "fade", "dissolve", "slide", "wipe")
+            transition_duration: 전환 효과 길이 (초)
+            max_workers: 최대 병렬 작업 수 (None이면 CPU 코어 수의 절반, 슬라이드 수를 넘지 않음)
+            slides: 메모리에 있는 슬라이드 리스트 (주어지면 slides_json_path를 읽지 않음)
+            audio_meta: 메모리에 있는 오디오 메타데이터 (주어지면 audio_meta_path를 읽지 않음)
+                        항목이 TTS Future면 음성이 끝난 슬라이드부터 클립 렌더링을 시작 (TTS와 렌더링 겹침)
+            scripts: 메모리에 있는 대본 리스트 (주어지면 scripts_json_path를 읽지 않음)
+
+        Returns:
+            성공 여부
+        """
+        # 데이터 로드 (이전 단계에서 메모리로 전달받지 못한 경우에만 JSON 파싱)
+        if slides is None:
+            with open(slides_json_path, 'r', encoding='utf-8') as f:
+                slides = json.load(f)
+
+        if audio_meta is None:
+            with open(audio_meta_path, 'r', encoding='utf-8') as f:
+                audio_meta = json.load(f)
+
+        # 대본 데이터 로드 (키워드 오버레이 포함)
+        if scripts is None and scripts_json_path and scripts_json_path.exists():
+            with open(scripts_json_path, 'r', encoding='utf-8') as f:
+                scripts = json.load(f)
+
+        # index로 빠르게 검색할 수 있도록 딕셔너리로 변환
+        scripts_data = {s["index"]: s for s in scripts} if scripts else {}
+
+        # 오버레이/하이라이트/화살표/전환 효과가 전혀 없으면 슬라이드별 클립 없이 FFmpeg 한 번으로 렌더링
+        success = None
+        use_transition = transition_effect != "none" and transition_duration > 0
+        if not use_transition:
+            # 단일 패스/정지 묶음은 여러 슬라이드 길이가 함께 필요하므로 TTS가 모두 끝날 때까지 대기
+            audio_meta = [_audio_result(audio_info) for audio_info in audio_meta]
+            segments = self._plain_still_segments(
+                slides, audio_meta, slides_img_dir, audio_dir, scripts_data, enable_keyword_marking
+            )
+            if segments:
+                print(f"영상 렌더링 시작: {len(segments)}개 슬라이드 (단일 패스, 클립 생성 생략)")
+                success = self.render_stills_single_pass(segments, output_video_path)
+                if not success:
+                    print("  → 슬라이드별 클립 렌더링으로 다시 시도합니다")
+                    success = None
+
+        if success is None:
+            success = self._render_clips_and_concat(
+                slides, audio_meta, slides_img_dir, audio_dir, clips_dir, output_video_path,
+                scripts_data, enable_keyword_marking, transition_effect, transition_duration, max_workers
+            )
+
+        if success:
+            # 자막 추가 (선택적)
+            if subtitle_file:
+                self.add_subtitles(output_video_path, subtitle_file, subtitle_font_size)
 
             print(f"✓ 영상 렌더링 완료: {output_video_path}")
 
@@ -852,7 +1333,7 @@ class FFmpegRenderer:
             # cropdetect 필터로 검은 바 영역 감지
             # 영상 시작 부분(썸네일 있을 수 있음) 건너뛰고 60초 이후부터 샘플링
             cmd = [
-                "ffmpeg",
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
                 "-ss", "60",  # 60초부터 시작 (썸네일 없는 구간)
                 "-i", str(video_path),
                 "-t", str(sample_duration),  # 샘플 길이
@@ -894,7 +1375,7 @@ class FFmpegRenderer:
         """비디오 해상도(너비, 높이) 반환"""
         try:
             cmd = [
-                "ffprobe",
+                FFPROBE_BIN,
                 "-v", "error",
                 "-select_streams", "v:0",
                 "-show_entries", "stream=width,height",
@@ -1020,7 +1501,7 @@ class FFmpegRenderer:
             encoder_args = self.get_video_encoder_args()
 
             cmd = [
-                "ffmpeg",
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
                 "-y",
                 "-fflags", "+genpts",  # PTS 재생성 강제
                 "-i", str(input_video),
@@ -1057,7 +1538,7 @@ class FFmpegRenderer:
         """영상 정보 출력"""
         try:
             cmd = [
-                "ffprobe",
+                FFPROBE_BIN,
                 "-v", "error",
                 "-show_entries", "format=duration,size",
                 "-show_entries", "stream=width,height,codec_name",
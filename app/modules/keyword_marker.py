@@ -9,6 +9,8 @@ from typing import List, Dict, Tuple, Optional
 import fitz  # PyMuPDF
 from PIL import Image, ImageDraw, ImageFont
 import random
+import os
+from functools import lru_cache
 
 
 class KeywordMarker:
@@ -21,6 +23,8 @@ class KeywordMarker:
         """
         self.use_ocr = use_ocr
         self.ocr_reader = None
+        # OCR 결과 캐시: (이미지 경로, 수정 시각) 기준 - 같은 슬라이드는 한 번만 OCR
+        self._readtext_cached = lru_cache(maxsize=8)(self._readtext)
 
         if use_ocr:
             try:
@@ -31,6 +35,33 @@ class KeywordMarker:
                 print("   설치: pip install easyocr")
                 self.use_ocr = False
 
+    def _readtext(self, image_path: str, mtime_ns: int) -> List:
+        """OCR 실행 (mtime_ns는 캐시 키 용도 - 이미지가 바뀌면 다시 OCR)"""
+        return self.ocr_reader.readtext(image_path)
+
+    def ocr_image(self, slide_image_path: str) -> Optional[List]:
+        """
+        슬라이드 이미지 OCR (경로+수정 시각 기준으로 캐시)
+
+        키워드 마킹과 화살표 마커 검색이 같은 OCR 결과를 공유하도록
+        한 번 실행한 결과를 boxes 인자로 넘겨 재사용
+
+        Args:
+            slide_image_path: 슬라이드 이미지 경로
+
+        Returns:
+            EasyOCR 결과 [(bbox 4점, 텍스트, 신뢰도), ...] 또는 None (OCR 불가/실패)
+        """
+        if not self.use_ocr or self.ocr_reader is None:
+            return None
+
+        image_path = str(slide_image_path)
+        try:
+            return self._readtext_cached(image_path, os.stat(image_path).st_mtime_ns)
+        except Exception as e:
+            print(f"  ⚠️  OCR 실패: {e}")
+            return None
+
     def find_keyword_in_pdf(self, pdf_path: str, page_num: int, keyword: str) -> Optional[Tuple[float, float, float, float]]:
         """
         PDF 페이지에서 키워드의 bbox(좌표) 찾기
@@ -107,8 +138,8 @@ class KeywordMarker:
             return None
 
         try:
-            # OCR 수행
-            results = self.ocr_reader.readtext(image_path)
+            # OCR 수행 (캐시된 결과가 있으면 재사용)
+            results = self.ocr_image(image_path) or []
             return self._find_keyword_in_ocr_results(keyword, results)
 
         except Exception as e:
@@ -400,7 +431,8 @@ class KeywordMarker:
                                output_dir: Path, pdf_path: Optional[str] = None,
                                page_num: Optional[int] = None,
                                mark_style: str = "circle",
-                               create_overlay: bool = True) -> List[Dict]:
+                               create_overlay: bool = True,
+                               boxes: Optional[List] = None) -> List[Dict]:
         """
         슬라이드 이미지에 여러 키워드 마킹
 
@@ -412,6 +444,7 @@ class KeywordMarker:
             page_num: 페이지 번호 (PDF인 경우, 0부터 시작)
             mark_style: 마킹 스타일 ("circle" 또는 "underline")
             create_overlay: True이면 투명 오버레이 생성, False이면 직접 그리기
+            boxes: 미리 계산한 OCR 결과 (ocr_image 반환값, 없으면 필요할 때 OCR 실행)
 
         Returns:
             [{"keyword": "키워드", "timing": 2.5, "overlay_image": "path", "bbox": (x0,y0,x1,y1), "found": True}, ...]
@@ -431,14 +464,12 @@ class KeywordMarker:
         marked_bboxes = []
 
         # OCR 결과 캐싱: PPT인 경우(PDF 아닌 경우) 한 번만 OCR 실행
-        ocr_cache = None
-        if self.use_ocr and (pdf_path is None):
-            try:
-                print(f"🔍 OCR 실행 중 (1회만)...")
-                ocr_cache = self.ocr_reader.readtext(slide_image_path)
+        ocr_cache = boxes
+        if ocr_cache is None and self.use_ocr and (pdf_path is None):
+            print(f"🔍 OCR 실행 중 (1회만)...")
+            ocr_cache = self.ocr_image(slide_image_path)
+            if ocr_cache is not None:
                 print(f"  ✓ OCR 완료: {len(ocr_cache)}개 텍스트 블록 발견")
-            except Exception as e:
-                print(f"  ⚠️  OCR 실패: {e}")
 
         for i, kw in enumerate(keywords):
             keyword_text = kw.get("text", "")
@@ -574,7 +605,8 @@ class KeywordMarker:
         return results
 
     def find_text_position(self, slide_image_path: str, search_text: str,
-                           pdf_path: str = None, page_num: int = None) -> List[Dict]:
+                           pdf_path: str = None, page_num: int = None,
+                           boxes: Optional[List] = None) -> List[Dict]:
         """
         슬라이드에서 특정 텍스트의 위치를 찾아 반환 (화살표 포인터용)
 
@@ -583,6 +615,7 @@ class KeywordMarker:
             search_text: 찾을 텍스트 (예: "[1]", "[2]", "★1", "★2")
             pdf_path: PDF 파일 경로 (선택)
             page_num: 페이지 번호 (선택)
+            boxes: 미리 계산한 OCR 결과 (ocr_image 반환값, 없으면 OCR 실행)
 
         Returns:
             list: [{"x": 중심x, "y": 중심y, "bbox": (x0,y0,x1,y1), "text": 매칭된텍스트}, ...]
@@ -601,7 +634,7 @@ class KeywordMarker:
         # OCR로 찾기
         if self.use_ocr and self.ocr_reader:
             try:
-                ocr_results = self.ocr_reader.readtext(slide_image_path)
+                ocr_results = boxes if boxes is not None else (self.ocr_image(slide_image_path) or [])
 
                 # 정규화된 검색 텍스트
                 search_normalized = search_text.lower().strip()
@@ -948,6 +981,32 @@ class KeywordMarker:
         return output_path
 
 
+# ===== 프로세스 풀 OCR =====
+# OCR은 CPU 연산이라 스레드로는 GIL 때문에 병렬화되지 않으므로 프로세스별로 KeywordMarker를 하나씩 두고 사용
+_worker_marker = None
+
+
+def init_ocr_worker():
+    """ProcessPoolExecutor initializer: 워커 프로세스마다 OCR 리더를 한 번만 로드"""
+    global _worker_marker
+    _worker_marker = KeywordMarker(use_ocr=True)
+
+
+def ocr_worker(image_path: str) -> Optional[List]:
+    """
+    워커 프로세스에서 슬라이드 이미지 OCR
+
+    Args:
+        image_path: 슬라이드 이미지 경로
+
+    Returns:
+        KeywordMarker.ocr_image 결과 (EasyOCR 결과 리스트 또는 None)
+    """
+    if _worker_marker is None:
+        init_ocr_worker()
+    return _worker_marker.ocr_image(image_path)
+
+
 def remove_markers_from_slides(slides_dir: Path, arrow_pointers_by_slide: Dict, output_dir: Path = None):
     """
     여러 슬라이드에서 마커 제거 (유틸리티 함수)
@@ -0,0 +1,23 @@
+"""
+진행 로그 유틸리티 모듈
+리스트 로그 버퍼를 화면 표시용 문자열로 변환
+"""
+from typing import List
+
+
+def render_log_lines(log_lines: List[str], tail_lines: int = 0) -> str:
+    """
+    리스트 로그 버퍼를 화면 표시용 문자열로 변환 (yield 시점에만 한 번 join)
+
+    Args:
+        log_lines: 줄 단위 로그 버퍼
+        tail_lines: 최근 몇 줄만 보낼지 (0이면 전체)
+
+    Returns:
+        표시용 로그 문자열 (생략된 줄이 있으면 맨 앞에 생략 줄 수 표시)
+    """
+    if not log_lines:
+        return ""
+    if tail_lines and len(log_lines) > tail_lines:
+        return f"... (앞부분 로그 {len(log_lines) - tail_lines}줄 생략)\n" + "\n".join(log_lines[-tail_lines:]) + "\n"
+    return "\n".join(log_lines) + "\n"
@@ -5,8 +5,8 @@
 import json
 from pathlib import Path
 from typing import List, Dict, Any
-from anthropic import Anthropic
 import os
+from .script_generator import get_anthropic_client
 
 
 class OverlayPlanner:
@@ -20,7 +20,7 @@ class OverlayPlanner:
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = get_anthropic_client(self.api_key)
 
     def create_overlay_prompt(
         self,
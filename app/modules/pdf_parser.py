@@ -3,11 +3,38 @@
 PDF 파일에서 페이지별 텍스트, 이미지 정보를 추출하여 JSON으로 변환
 """
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import fitz  # PyMuPDF
 
 
+def render_pages_to_images(pdf_path: str, page_numbers: List[int], output_dir: str,
+                            target_width: int, target_height: int) -> int:
+    """
+    PDF의 지정한 페이지들을 PNG로 저장 (프로세스 풀 워커에서 실행)
+
+    PyMuPDF 문서 객체는 프로세스 간에 넘길 수 없으므로 워커마다 PDF를 직접 엶.
+    PDF 입력과 PPTX 입력(LibreOffice로 만든 PDF)이 모두 이 함수로 같은 크기/배치의 이미지를 만듦
+
+    Args:
+        pdf_path: PDF 파일 경로
+        page_numbers: 렌더링할 페이지 번호 리스트 (0부터 시작)
+        output_dir: 출력 디렉토리
+        target_width: 목표 너비
+        target_height: 목표 높이
+
+    Returns:
+        저장한 페이지 수
+    """
+    output_dir = Path(output_dir)
+    with fitz.open(pdf_path) as document:
+        for page_num in page_numbers:
+            PDFParser.save_page_as_image(document[page_num], page_num + 1, output_dir, target_width, target_height)
+    return len(page_numbers)
+
+
 class PDFParser:
     """PDF 파일을 파싱하여 페이지별 정보를 추출하는 클래스"""
 
@@ -68,7 +95,8 @@ class PDFParser:
             "notes": ""  # PDF에는 노트가 없음
         }
 
-    def save_page_as_image(self, page, page_num: int, output_dir: Path, target_width: int = 1920, target_height: int = 1080) -> Path:
+    @staticmethod
+    def save_page_as_image(page, page_num: int, output_dir: Path, target_width: int = 1920, target_height: int = 1080) -> Path:
         """
         PDF 페이지를 PNG 이미지로 저장 (목표 해상도에 맞춰 스케일+패딩)
 
@@ -85,29 +113,21 @@ class PDFParser:
         import cv2
         import numpy as np
 
-        # 페이지를 고해상도 이미지로 렌더링 (150 DPI)
-        mat = fitz.Matrix(150/72, 150/72)  # 72 DPI -> 150 DPI
-        pix = page.get_pixmap(matrix=mat)
-
-        # NumPy 배열로 변환
-        img_data = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
-
-        # RGB로 변환 (RGBA인 경우)
-        if pix.n == 4:
-            img = cv2.cvtColor(img_data, cv2.COLOR_RGBA2BGR)
-        else:
-            img = cv2.cvtColor(img_data, cv2.COLOR_RGB2BGR)
-
-        # 원본 크기
-        orig_height, orig_width = img.shape[:2]
+        # 원본 페이지 크기 (포인트 단위)
+        orig_width, orig_height = page.rect.width, page.rect.height
 
-        # 비율 유지하면서 목표 크기에 맞추기
+        # 비율을 유지하면서 목표 크기에 맞는 배율로 바로 렌더링 (고해상도 렌더링 후 축소하는 과정 생략)
         scale = min(target_width / orig_width, target_height / orig_height)
-        new_width = int(orig_width * scale)
-        new_height = int(orig_height * scale)
+        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
 
-        # 리사이즈
-        resized = cv2.resize(img, (new_width, new_height), interpolation=cv2.INTER_AREA)
+        # NumPy 배열로 변환 (알파 채널 없이 RGB로 렌더링)
+        img_data = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)[:, :pix.width * pix.n]
+        img_data = img_data.reshape(pix.height, pix.width, pix.n)
+        resized = cv2.cvtColor(img_data, cv2.COLOR_RGB2BGR)
+
+        # 렌더링 결과 크기 (반올림 오차로 목표보다 1픽셀 커지는 경우 잘라냄)
+        resized = resized[:target_height, :target_width]
+        new_height, new_width = resized.shape[:2]
 
         # 중앙 정렬을 위한 패딩 계산
         pad_x = (target_width - new_width) // 2
@@ -121,18 +141,31 @@ class PDFParser:
         output_path = output_dir / f"slide_{page_num:03d}.png"
         cv2.imwrite(str(output_path), result)
 
-        print(f"    📐 원본: {orig_width}x{orig_height} → 스케일: {new_width}x{new_height} → 패딩: {target_width}x{target_height}")
+        print(f"    📐 원본: {orig_width:.0f}x{orig_height:.0f}pt → 렌더링: {new_width}x{new_height} → 패딩: {target_width}x{target_height}")
         print(f"    📍 오프셋: X={pad_x}, Y={pad_y}")
 
         return output_path
 
-    def parse(self, output_json_path: Path, output_img_dir: Path) -> List[Dict[str, Any]]:
+    def parse(
+        self,
+        output_json_path: Path,
+        output_img_dir: Path,
+        target_width: int = 1920,
+        target_height: int = 1080,
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         PDF를 파싱하여 페이지 정보를 JSON으로 저장하고 이미지 추출
 
+        페이지 렌더링(PNG 인코딩 포함)은 CPU 작업이므로 페이지가 많으면 여러 프로세스에 나눠
+        텍스트 추출과 동시에 병렬로 처리합니다.
+
         Args:
             output_json_path: 출력 JSON 파일 경로
             output_img_dir: 페이지 이미지 저장 디렉토리
+            target_width: 페이지 이미지 너비 (영상 해상도)
+            target_height: 페이지 이미지 높이 (영상 해상도)
+            max_workers: 렌더링 프로세스 수 (None이면 CPU 코어 수)
 
         Returns:
             페이지 정보 리스트
@@ -144,26 +177,53 @@ class PDFParser:
 
         print(f"📄 PDF 파싱 시작: {page_count}개 페이지")
 
-        for page_num in range(page_count):
-            page = self.document[page_num]
-
-            # 텍스트 정보 추출
-            text_data = self.extract_text_from_page(page)
-
-            # 이미지로 저장
-            img_path = self.save_page_as_image(page, page_num + 1, output_img_dir)
+        # 페이지가 적으면 프로세스 시작 비용이 더 크므로 현재 프로세스에서 텍스트와 함께 렌더링
+        workers = min(max_workers or os.cpu_count() or 1, page_count)
+        executor = None
+        futures = []
+        if workers >= 2 and page_count >= 4:
+            print(f"  - 페이지 렌더링 병렬 처리 (프로세스: {workers}개)")
+            executor = ProcessPoolExecutor(max_workers=workers)
+            # 워커마다 페이지를 번갈아 배정해 앞/뒤 페이지 복잡도 차이를 고르게 분산
+            futures = [
+                executor.submit(
+                    render_pages_to_images, str(self.pdf_path), list(range(page_count))[w::workers],
+                    str(output_img_dir), target_width, target_height
+                )
+                for w in range(workers)
+            ]
 
-            page_info = {
-                "index": page_num + 1,
-                "title": text_data["title"],
-                "body": text_data["body"],
-                "notes": text_data["notes"],
-                "image": str(img_path.relative_to(output_json_path.parent.parent))
-            }
-
-            pages_data.append(page_info)
-
-            print(f"  - 페이지 {page_num + 1}/{page_count}: {text_data['title'][:50] if text_data['title'] else '(제목 없음)'}")
+        try:
+            for page_num in range(page_count):
+                page = self.document[page_num]
+
+                # 텍스트 정보 추출
+                text_data = self.extract_text_from_page(page)
+
+                # 이미지로 저장 (병렬 렌더링 중이면 경로만 계산)
+                if executor is None:
+                    img_path = self.save_page_as_image(page, page_num + 1, output_img_dir, target_width, target_height)
+                else:
+                    img_path = output_img_dir / f"slide_{page_num + 1:03d}.png"
+
+                page_info = {
+                    "index": page_num + 1,
+                    "title": text_data["title"],
+                    "body": text_data["body"],
+                    "notes": text_data["notes"],
+                    "image": str(img_path.relative_to(output_json_path.parent.parent))
+                }
+
+                pages_data.append(page_info)
+
+                print(f"  - 페이지 {page_num + 1}/{page_count}: {text_data['title'][:50] if text_data['title'] else '(제목 없음)'}")
+
+            # 병렬 렌더링 결과 확인 (워커에서 난 예외는 여기서 다시 발생)
+            for future in futures:
+                future.result()
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         # JSON 저장
         output_json_path.parent.mkdir(parents=True, exist_ok=True)
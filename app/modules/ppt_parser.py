@@ -4,17 +4,29 @@ PPT 파일에서 슬라이드 텍스트, 이미지 정보를 추출하여 JSON
 """
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 from pptx import Presentation
 from pptx.util import Inches
 import io
+import os
+import queue
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from functools import lru_cache
+from xml.etree import ElementTree
 from PIL import Image
 
+# OOXML 네임스페이스 (quick_outline에서 슬라이드 XML 직접 파싱용)
+_P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
 
 class PPTParser:
     """PPT 파일을 파싱하여 슬라이드 정보를 추출하는 클래스"""
 
-    def __init__(self, ppt_path: str):
+    def __init__(self, ppt_path: Union[str, Path]):
         """
         Args:
             ppt_path: PPT 파일 경로
@@ -22,6 +34,69 @@ class PPTParser:
         self.ppt_path = Path(ppt_path)
         self.presentation = Presentation(str(self.ppt_path))
 
+    @staticmethod
+    def quick_outline(ppt_path: Union[str, Path], body_chars: int = 200) -> List[Dict[str, Any]]:
+        """
+        python-pptx 객체 모델 없이 슬라이드 제목/본문 앞부분만 빠르게 추출 (맥락 분석용)
+
+        PPTX(zip)의 슬라이드 XML을 iterparse로 Shape 단위 스트리밍하며 텍스트만 모으고,
+        제목과 본문 body_chars자를 얻으면 해당 슬라이드의 나머지는 읽지 않음
+
+        Args:
+            ppt_path: PPTX 파일 경로
+            body_chars: 슬라이드당 수집할 본문 최대 글자 수
+
+        Returns:
+            [{"index": 1, "title": "...", "body": "..."}, ...] (발표 순서)
+        """
+        outline = []
+        with zipfile.ZipFile(str(ppt_path)) as zf:
+            # 발표 순서: presentation.xml의 sldIdLst → rels의 슬라이드 파일 경로
+            rels = ElementTree.fromstring(zf.read("ppt/_rels/presentation.xml.rels"))
+            targets = {rel.get("Id"): rel.get("Target") for rel in rels}
+            presentation = ElementTree.fromstring(zf.read("ppt/presentation.xml"))
+            slide_parts = []
+            for sld_id in presentation.findall("./{*}sldIdLst/{*}sldId"):
+                # 상대 경로("slides/slide1.xml")와 절대 경로("/ppt/slides/slide1.xml") 모두 처리
+                target = targets[sld_id.get(f"{{{_REL_NS}}}id")].lstrip("/")
+                if target.startswith("ppt/"):
+                    target = target[len("ppt/"):]
+                slide_parts.append("ppt/" + target)
+
+            for idx, part in enumerate(slide_parts, start=1):
+                title = ""
+                body_parts = []
+                body_len = 0
+                with zf.open(part) as f:
+                    for _, elem in ElementTree.iterparse(f, events=("end",)):
+                        if elem.tag != f"{{{_P_NS}}}sp":
+                            continue
+                        text = "\n".join(
+                            "".join(t.text or "" for t in para.iter(f"{{{_A_NS}}}t"))
+                            for para in elem.iter(f"{{{_A_NS}}}p")
+                        ).strip()
+                        ph = elem.find(f".//{{{_P_NS}}}ph")
+                        elem.clear()
+                        if not text:
+                            continue
+                        is_title_ph = ph is not None and ph.get("type") in ("title", "ctrTitle")
+                        # 제목 placeholder 우선, 없으면 extract_slide_text와 같이 첫 번째 짧은 텍스트
+                        if not title and (is_title_ph or len(text) < 100):
+                            title = text
+                        else:
+                            body_parts.append(text)
+                            body_len += len(text)
+                        if title and body_len >= body_chars:
+                            break
+
+                outline.append({
+                    "index": idx,
+                    "title": title,
+                    "body": "\n".join(body_parts)[:body_chars]
+                })
+
+        return outline
+
     def extract_text_from_shape(self, shape) -> str:
         """슬라이드 Shape에서 텍스트 추출"""
         if hasattr(shape, "text"):
@@ -116,15 +191,22 @@ class PPTParser:
         return slides_data
 
 
+@lru_cache(maxsize=1)
 def find_libreoffice_path():
     """
-    시스템에서 LibreOffice 실행 파일 경로 찾기
+    시스템에서 LibreOffice 실행 파일 경로 찾기 (프로세스당 한 번만 탐색)
 
     Returns:
         LibreOffice 실행 파일 경로 또는 None
     """
     import os
     import platform
+    import shutil
+
+    # PATH에 있으면 설치 경로 후보를 뒤지지 않고 바로 사용
+    on_path = shutil.which("soffice") or shutil.which("libreoffice")
+    if on_path:
+        return on_path
 
     system = platform.system()
 
@@ -150,19 +232,82 @@ def find_libreoffice_path():
         return "libreoffice"
 
 
-def convert_pptx_to_images(pptx_path: Path, output_dir: Path) -> None:
+# 사용 가능한 LibreOffice 사용자 프로필 디렉토리 (변환이 끝나면 반납해 다음 변환이 재사용)
+_LO_PROFILES: "queue.SimpleQueue[Path]" = queue.SimpleQueue()
+
+
+@contextmanager
+def _libreoffice_profile():
+    """
+    LibreOffice 사용자 프로필 디렉토리를 하나 빌려줌 (비어 있으면 새로 생성)
+
+    같은 프로필을 쓰는 soffice 프로세스는 동시에 실행될 수 없으므로
+    동시에 진행되는 변환마다 서로 다른 프로필을 사용
+    """
+    try:
+        profile_dir = _LO_PROFILES.get_nowait()
+    except queue.Empty:
+        profile_dir = Path(tempfile.mkdtemp(prefix="lo_profile_"))
+    try:
+        yield profile_dir
+    finally:
+        _LO_PROFILES.put(profile_dir)
+
+
+def warm_up_libreoffice() -> bool:
+    """
+    LibreOffice 사용자 프로필 하나를 미리 초기화해 프로필 풀에 넣어 둠 (앱 시작 시 백그라운드 호출용)
+
+    soffice 첫 실행의 프로필 생성/초기화 비용을 첫 변환 대신 시작 시점에 치름
+
+    Returns:
+        성공 여부 (LibreOffice가 없거나 실패하면 False)
+    """
+    import subprocess
+
+    libreoffice_path = find_libreoffice_path()
+    if not libreoffice_path:
+        return False
+
+    with _libreoffice_profile() as profile_dir:
+        try:
+            result = subprocess.run(
+                [
+                    libreoffice_path,
+                    f"-env:UserInstallation={profile_dir.as_uri()}",
+                    "--headless",
+                    "--terminate_after_init"
+                ],
+                capture_output=True, timeout=120
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+    return result.returncode == 0
+
+
+def convert_pptx_to_images(
+    pptx_path: Path,
+    output_dir: Path,
+    max_workers: Optional[int] = None,
+    target_width: int = 1920,
+    target_height: int = 1080
+) -> None:
     """
     LibreOffice를 사용하여 PPTX를 PNG 이미지로 변환
 
     LibreOffice는 먼저 PDF로 변환하고, 그 다음 각 페이지를 PNG로 변환합니다.
+    페이지 렌더링(PNG 인코딩 포함)은 CPU 작업이므로 여러 프로세스에 페이지를 나눠 병렬로 처리합니다.
 
     Args:
         pptx_path: PPTX 파일 경로
         output_dir: 출력 디렉토리
+        max_workers: 페이지 렌더링 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 처리)
+        target_width: 슬라이드 이미지 너비 (기본 1920)
+        target_height: 슬라이드 이미지 높이 (기본 1080)
     """
     import subprocess
-    import platform
     import time
+    from concurrent.futures import ProcessPoolExecutor
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -183,23 +328,28 @@ def convert_pptx_to_images(pptx_path: Path, output_dir: Path) -> None:
     print(f"🔄 STEP 1: PPTX → PDF 변환 중...")
     temp_pdf = output_dir / f"{pptx_path.stem}.pdf"
 
-    cmd_pdf = [
-        libreoffice_path,
-        "--headless",
-        "--convert-to", "pdf",
-        "--outdir", str(output_dir),
-        str(pptx_path)
-    ]
-
     try:
-        result = subprocess.run(cmd_pdf, capture_output=True, text=True, timeout=120)
+        # 동시에 도는 변환끼리 사용자 프로필을 나눠 써서 프로필 잠금으로 서로 막히지 않게 함
+        # (프로필은 재사용하므로 첫 변환 이후에는 프로필 초기화 비용이 없음)
+        with _libreoffice_profile() as profile_dir:
+            cmd_pdf = [
+                libreoffice_path,
+                f"-env:UserInstallation={profile_dir.as_uri()}",
+                "--headless",
+                "--convert-to", "pdf",
+                "--outdir", str(output_dir),
+                str(pptx_path)
+            ]
+            result = subprocess.run(cmd_pdf, capture_output=True, text=True, timeout=120)
 
         if result.returncode != 0:
             print(f"✗ PDF 변환 실패: {result.stderr}")
             raise RuntimeError(f"LibreOffice PDF 변환 실패: {result.stderr}")
 
-        # PDF 파일 생성 대기
-        time.sleep(2)
+        # PDF 파일 생성 대기 (이미 있으면 바로 진행)
+        deadline = time.monotonic() + 2
+        while not temp_pdf.exists() and time.monotonic() < deadline:
+            time.sleep(0.1)
 
         if not temp_pdf.exists():
             raise FileNotFoundError(f"PDF 파일이 생성되지 않았습니다: {temp_pdf}")
@@ -211,62 +361,32 @@ def convert_pptx_to_images(pptx_path: Path, output_dir: Path) -> None:
 
         try:
             import fitz  # PyMuPDF
+            # PDF 입력과 같은 렌더링 경로를 써서 두 입력의 슬라이드 이미지 크기/배치를 맞춤
+            from .pdf_parser import render_pages_to_images
 
-            # PDF 열기
-            pdf_document = fitz.open(str(temp_pdf))
-            page_count = pdf_document.page_count
+            # 페이지 수 확인
+            with fitz.open(str(temp_pdf)) as pdf_document:
+                page_count = pdf_document.page_count
 
             print(f"  - {page_count}개 페이지 발견")
 
-            # 각 페이지를 개별 PNG로 저장 (스케일+패딩 적용)
-            import cv2
-            import numpy as np
-
-            target_width = 1920
-            target_height = 1080
-
-            for page_num in range(page_count):
-                page = pdf_document[page_num]
-
-                # 페이지를 이미지로 렌더링 (150 DPI)
-                mat = fitz.Matrix(150/72, 150/72)  # 72 DPI -> 150 DPI
-                pix = page.get_pixmap(matrix=mat)
-
-                # NumPy 배열로 변환
-                img_data = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
-
-                # RGB로 변환 (RGBA인 경우)
-                if pix.n == 4:
-                    img = cv2.cvtColor(img_data, cv2.COLOR_RGBA2BGR)
-                else:
-                    img = cv2.cvtColor(img_data, cv2.COLOR_RGB2BGR)
-
-                # 원본 크기
-                orig_height, orig_width = img.shape[:2]
-
-                # 비율 유지하면서 목표 크기에 맞추기
-                scale = min(target_width / orig_width, target_height / orig_height)
-                new_width = int(orig_width * scale)
-                new_height = int(orig_height * scale)
-
-                # 리사이즈
-                resized = cv2.resize(img, (new_width, new_height), interpolation=cv2.INTER_AREA)
-
-                # 중앙 정렬을 위한 패딩 계산
-                pad_x = (target_width - new_width) // 2
-                pad_y = (target_height - new_height) // 2
-
-                # 검은색 배경에 이미지 배치 (1920x1080 보장)
-                result = np.zeros((target_height, target_width, 3), dtype=np.uint8)
-                result[pad_y:pad_y+new_height, pad_x:pad_x+new_width] = resized
-
-                # PNG로 저장
-                output_path = output_dir / f"slide_{page_num + 1:03d}.png"
-                cv2.imwrite(str(output_path), result)
-
-                print(f"  - 슬라이드 {page_num + 1} 저장: {output_path.name} (원본: {orig_width}x{orig_height} → {target_width}x{target_height})")
-
-            pdf_document.close()
+            # 페이지가 적으면 프로세스 시작 비용이 더 크므로 현재 프로세스에서 처리
+            workers = min(max_workers or os.cpu_count() or 1, page_count)
+            if workers < 2 or page_count < 4:
+                render_pages_to_images(str(temp_pdf), list(range(page_count)), str(output_dir), target_width, target_height)
+            else:
+                print(f"  - 페이지 렌더링 병렬 처리 (프로세스: {workers}개)")
+                # 워커마다 페이지를 번갈아 배정해 앞/뒤 페이지 복잡도 차이를 고르게 분산
+                page_groups = [list(range(page_count))[w::workers] for w in range(workers)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            render_pages_to_images, str(temp_pdf), pages, str(output_dir), target_width, target_height
+                        )
+                        for pages in page_groups
+                    ]
+                    for future in futures:
+                        future.result()
 
             print(f"✓ PPTX → PNG 변환 완료: {output_dir}")
             print(f"  - 총 {page_count}개 슬라이드 이미지 생성")
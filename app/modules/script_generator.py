@@ -2,25 +2,53 @@
 모듈 B: LLM 대본 생성기
 슬라이드 텍스트를 구어체 설명 대본으로 변환
 """
+import asyncio
 import json
+import random
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
-from anthropic import Anthropic
+from typing import List, Dict, Any, Callable, Optional
+import anthropic
+from anthropic import Anthropic, AsyncAnthropic
 import os
 
+# 일시적 오류 재시도 횟수 (지수 백오프: 2^n초 + 지터)
+MAX_RETRIES = 4
+
+
+@lru_cache(maxsize=None)
+def get_anthropic_client(api_key: str) -> Anthropic:
+    """
+    API 키별 동기 Anthropic 클라이언트 반환 (프로세스 내에서 한 번만 생성)
+
+    생성기 인스턴스가 작업마다 새로 만들어져도 같은 httpx 커넥션 풀을 재사용하므로
+    슬라이드/작업마다 TCP+TLS 핸드셰이크를 반복하지 않음
+    """
+    return Anthropic(api_key=api_key)
+
 
 class ScriptGenerator:
     """LLM을 사용하여 슬라이드별 설명 대본을 생성하는 클래스"""
 
-    def __init__(self, api_key: str = None, model: str = "claude-3-7-sonnet-20250219"):
+    def __init__(
+        self,
+        api_key: str = None,
+        model: str = "claude-3-7-sonnet-20250219",
+        temperature: float = 0.7,
+        max_tokens: int = 2048
+    ):
         """
         Args:
             api_key: Anthropic API 키
             model: 사용할 LLM 모델
+            temperature: 대본 생성 temperature (config.LLM_TEMPERATURE)
+            max_tokens: 슬라이드 하나의 대본 응답 최대 토큰 수
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model = model
-        self.client = Anthropic(api_key=self.api_key)
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.client = get_anthropic_client(self.api_key)
 
     def create_script_prompt(self, slide: Dict[str, Any], slide_context: str = "") -> str:
         """슬라이드 정보를 기반으로 대본 생성 프롬프트 작성"""
@@ -72,8 +100,8 @@ class ScriptGenerator:
         try:
             message = self.client.messages.create(
                 model=self.model,
-                max_tokens=2048,  # 강사 스타일의 자세한 설명을 위해 증가
-                temperature=0.7,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
                 messages=[
                     {
                         "role": "user",
@@ -90,19 +118,89 @@ class ScriptGenerator:
             # 폴백: 슬라이드 텍스트를 그대로 사용
             return f"{slide.get('title', '')}. {slide.get('body', '')}"
 
+    async def _generate_script_async(
+        self,
+        client: AsyncAnthropic,
+        slide: Dict[str, Any],
+        context: str,
+        semaphore: asyncio.Semaphore,
+        on_script: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> str:
+        """
+        단일 슬라이드 대본 비동기 생성 (동시 요청 수는 semaphore로 제한)
+
+        속도 제한/타임아웃/일시적 서버 오류는 지수 백오프로 재시도, 최종 실패 시 슬라이드 텍스트로 폴백
+        """
+        prompt = self.create_script_prompt(slide, context)
+        retryable = (
+            anthropic.RateLimitError,
+            anthropic.APITimeoutError,
+            anthropic.APIConnectionError,
+            anthropic.InternalServerError,
+        )
+
+        script = None
+        async with semaphore:
+            print(f"  슬라이드 {slide['index']}: {slide.get('title', '제목 없음')}")
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    message = await client.messages.create(
+                        model=self.model,
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature,
+                        messages=[{"role": "user", "content": prompt}]
+                    )
+                    script = message.content[0].text.strip()
+                    break
+                except retryable as e:
+                    if attempt == MAX_RETRIES:
+                        print(f"✗ LLM 대본 생성 실패 (슬라이드 {slide.get('index')}): {e}")
+                        break
+                    await asyncio.sleep(2 ** attempt + random.random())
+                except Exception as e:
+                    print(f"✗ LLM 대본 생성 실패 (슬라이드 {slide.get('index')}): {e}")
+                    break
+
+        if script is None:
+            # 폴백: 슬라이드 텍스트를 그대로 사용
+            script = f"{slide.get('title', '')}. {slide.get('body', '')}"
+
+        if on_script is not None:
+            on_script({"index": slide["index"], "script": script})
+        return script
+
+    async def _generate_all_async(
+        self,
+        slides: List[Dict[str, Any]],
+        context: str,
+        max_concurrency: int,
+        on_script: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[str]:
+        """모든 슬라이드 대본을 동시에 요청 (결과는 slides 순서 유지)"""
+        # 비동기 클라이언트는 이벤트 루프에 묶이므로 asyncio.run 호출마다 새로 열고 닫음
+        async with AsyncAnthropic(api_key=self.api_key) as client:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            return await asyncio.gather(
+                *(self._generate_script_async(client, slide, context, semaphore, on_script) for slide in slides)
+            )
+
     def generate_scripts(
         self,
         slides_json_path: Path,
         output_json_path: Path,
-        context: str = ""
+        context: str = "",
+        max_concurrency: int = 8,
+        on_script: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> List[Dict[str, Any]]:
         """
-        모든 슬라이드에 대한 설명 대본 생성
+        모든 슬라이드에 대한 설명 대본 생성 (asyncio로 병렬 요청)
 
         Args:
             slides_json_path: 슬라이드 정보 JSON 파일 경로
             output_json_path: 출력 대본 JSON 파일 경로
             context: 전체 프레젠테이션 맥락 (선택)
+            max_concurrency: 동시 Claude 요청 수 (기본 8개)
+            on_script: 슬라이드 대본이 완성될 때마다 {"index", "script"}로 호출 (TTS를 바로 시작하는 용도)
 
         Returns:
             대본 정보 리스트
@@ -111,22 +209,14 @@ class ScriptGenerator:
         with open(slides_json_path, 'r', encoding='utf-8') as f:
             slides = json.load(f)
 
-        scripts_data = []
-
-        print(f"대본 생성 시작: {len(slides)}개 슬라이드")
-
-        for slide in slides:
-            print(f"  슬라이드 {slide['index']}: {slide.get('title', '제목 없음')}")
-
-            # 대본 생성
-            script = self.generate_script(slide, context)
+        print(f"대본 생성 시작: {len(slides)}개 슬라이드 (동시 요청: {max_concurrency}개)")
 
-            script_info = {
-                "index": slide["index"],
-                "script": script
-            }
+        scripts = asyncio.run(self._generate_all_async(slides, context, max_concurrency, on_script))
 
-            scripts_data.append(script_info)
+        scripts_data = [
+            {"index": slide["index"], "script": script}
+            for slide, script in zip(slides, scripts)
+        ]
 
         # JSON 저장
         output_json_path.parent.mkdir(parents=True, exist_ok=True)
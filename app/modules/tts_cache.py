@@ -0,0 +1,83 @@
+"""
+TTS 오디오 디스크 캐시
+같은 음성 + 같은 대본이면 이전에 합성한 오디오를 재사용 (TTS API 호출/비용 생략)
+"""
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+class TTSCache:
+    """(모델, 음성, 무음 길이, 대본) 해시를 키로 합성 결과 MP3를 보관하는 디스크 캐시 (용량 초과 시 LRU 정리)"""
+
+    def __init__(self, cache_dir: Path, max_mb: int = 500):
+        """
+        Args:
+            cache_dir: 캐시 폴더
+            max_mb: 캐시 최대 용량 (MB, 넘으면 오래 안 쓴 파일부터 삭제, 0이면 제한 없음)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_mb * 1024 * 1024
+
+    @staticmethod
+    def key(model: str, voice: str, text: str, pause_duration: float) -> str:
+        """캐시 키 (합성 결과를 바꾸는 값만 포함)"""
+        return hashlib.blake2b(
+            f"{model}\0{voice}\0{pause_duration}\0{text}".encode("utf-8"),
+            digest_size=32
+        ).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.mp3"
+
+    def fetch(self, key: str, output_path: Path) -> bool:
+        """
+        캐시에 있으면 output_path로 복사
+
+        (하드링크는 다음 실행에서 FFmpeg가 output_path를 덮어쓸 때 캐시 원본까지 바뀌므로 복사)
+
+        Returns:
+            캐시 적중 여부
+        """
+        cached = self._path(key)
+        try:
+            shutil.copyfile(cached, output_path)
+            os.utime(cached)  # LRU 갱신
+            return True
+        except OSError:
+            return False
+
+    def store(self, key: str, audio_path: Path):
+        """합성한 오디오를 캐시에 저장 (임시 파일에 쓴 뒤 교체해 동시 저장에도 안전)"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cached = self._path(key)
+            tmp_path = cached.with_suffix(f".{threading.get_ident()}.tmp")
+            shutil.copyfile(audio_path, tmp_path)
+            os.replace(tmp_path, cached)
+            self._evict()
+        except OSError as e:
+            print(f"    ⚠️  TTS 캐시 저장 실패 (무시): {e}")
+
+    def _evict(self):
+        """캐시 용량이 max_bytes를 넘으면 최근 사용(mtime)이 오래된 파일부터 삭제"""
+        if not self.max_bytes:
+            return
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.mp3"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_bytes:
+                break
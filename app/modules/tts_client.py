@@ -4,11 +4,41 @@
 """
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
 import os
+import random
+import re
+import threading
+import time
+import openai
 from openai import OpenAI
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from .ffmpeg_renderer import FFMPEG_BIN, FFPROBE_BIN, FFMPEG_QUIET_ARGS
+from .tts_cache import TTSCache
+
+
+# OpenAI TTS 모델 ("tts-1-hd"면 고품질, 캐시 키에도 포함)
+OPENAI_TTS_MODEL = "tts-1"
+# 이 길이보다 긴 대본은 문장 묶음으로 나눠 병렬 합성 (첫 음성까지의 대기 시간 단축)
+SENTENCE_SPLIT_MIN_CHARS = 200
+# 슬라이드 하나당 최대 분할 수 (슬라이드 병렬 처리와 곱해져 동시 요청 수가 늘어나므로 작게 유지)
+MAX_SENTENCE_CHUNKS = 3
+# 속도 제한(429)/일시적 서버 오류(5xx) 재시도 횟수 (지수 백오프: 2^n초 + 지터)
+TTS_MAX_RETRIES = 4
+# 문장 끝 (마침표/물음표/느낌표 뒤 공백)
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?。！？])\s+')
+
+
+@lru_cache(maxsize=None)
+def _inflight_semaphore(limit: int) -> threading.BoundedSemaphore:
+    """
+    전체 TTS 요청 동시 실행 제한용 세마포어 (같은 상한이면 프로세스 안의 모든 TTSClient가 공유)
+
+    슬라이드 병렬 × 문장 묶음 병렬로 요청이 한꺼번에 몰려 429가 나지 않도록 함
+    """
+    return threading.BoundedSemaphore(max(1, limit))
 
 
 class TTSClient:
@@ -18,20 +48,30 @@ class TTSClient:
         self,
         provider: str = "openai",
         api_key: str = None,
-        voice: str = "alloy"
+        voice: str = "alloy",
+        http_client=None,
+        cache_dir: Optional[Path] = None,
+        cache_max_mb: int = 500,
+        max_inflight: int = 8
     ):
         """
         Args:
             provider: TTS 제공자 ("openai" or "elevenlabs")
             api_key: API 키
             voice: 음성 모델 이름
+            http_client: 공유 httpx.Client (주어지면 연결 풀을 다른 API 클라이언트와 함께 사용)
+            cache_dir: TTS 오디오 캐시 폴더 (None이면 캐시 사용 안 함)
+            cache_max_mb: 캐시 최대 용량 (MB)
+            max_inflight: 프로세스 전체에서 동시에 보낼 TTS 요청 수 상한
         """
         self.provider = provider.lower()
         self.voice = voice
+        self.cache = TTSCache(cache_dir, cache_max_mb) if cache_dir else None
+        self._inflight = _inflight_semaphore(max_inflight)
 
         if self.provider == "openai":
             self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = OpenAI(api_key=self.api_key, http_client=http_client)
         elif self.provider == "elevenlabs":
             self.api_key = api_key or os.getenv("ELEVENLABS_API_KEY")
             # ElevenLabs 클라이언트 초기화는 필요시 구현
@@ -51,16 +91,33 @@ class TTSClient:
             오디오 길이 (초) - 무음 포함
         """
         try:
-            # OpenAI TTS 호출
-            response = self.client.audio.speech.create(
-                model="tts-1",  # or "tts-1-hd" for higher quality
-                voice=self.voice,
-                input=text
-            )
+            # 같은 음성 + 같은 대본을 이전에 합성했으면 API 호출 없이 캐시에서 복사
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.key(OPENAI_TTS_MODEL, self.voice, text, pause_duration)
+                if self.cache.fetch(cache_key, output_path):
+                    print(f"    💾 TTS 캐시 사용: {output_path.name}")
+                    return self.get_audio_duration(output_path)
 
             # 임시 파일로 저장
             temp_path = output_path.parent / f"{output_path.stem}_temp{output_path.suffix}"
-            response.stream_to_file(str(temp_path))
+
+            chunks = self.split_into_sentence_chunks(text)
+            if len(chunks) == 1:
+                self._synthesize_openai(text, temp_path)
+            else:
+                # 긴 대본: 문장 묶음별로 동시에 합성한 뒤 순서대로 이어 붙임
+                part_paths = [
+                    output_path.parent / f"{output_path.stem}_part{i}{output_path.suffix}"
+                    for i in range(len(chunks))
+                ]
+                try:
+                    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                        list(executor.map(self._synthesize_openai, chunks, part_paths))
+                    self.concatenate_audio(part_paths, temp_path)
+                finally:
+                    for part_path in part_paths:
+                        part_path.unlink(missing_ok=True)
 
             # 무음 추가 (자연스러운 간격)
             if pause_duration > 0:
@@ -69,6 +126,9 @@ class TTSClient:
             else:
                 temp_path.rename(output_path)
 
+            if cache_key is not None:
+                self.cache.store(cache_key, output_path)
+
             # 오디오 길이 계산 (ffprobe 사용)
             duration = self.get_audio_duration(output_path)
 
@@ -78,6 +138,97 @@ class TTSClient:
             print(f"✗ OpenAI TTS 실패: {e}")
             raise
 
+    def _synthesize_openai(self, text: str, output_path: Path):
+        """OpenAI TTS 한 번 호출하여 결과를 파일로 저장 (429/5xx는 지수 백오프로 재시도)"""
+        retryable = (
+            openai.RateLimitError,
+            openai.APITimeoutError,
+            openai.APIConnectionError,
+            openai.InternalServerError,
+        )
+        for attempt in range(TTS_MAX_RETRIES + 1):
+            try:
+                # 응답을 받는 즉시 청크 단위로 기록 (전체 다운로드 대기 없음)
+                tmp_path = Path(output_path).with_suffix(".part")
+                # 요청 중에만 슬롯을 점유 (재시도 대기 중에는 다른 요청이 진행되도록 반납)
+                with self._inflight, self.client.audio.speech.with_streaming_response.create(
+                    model=OPENAI_TTS_MODEL,
+                    voice=self.voice,
+                    input=text
+                ) as response:
+                    with open(tmp_path, "wb") as f:
+                        for chunk in response.iter_bytes(chunk_size=4096):
+                            f.write(chunk)
+                os.replace(tmp_path, output_path)
+                return
+            except retryable as e:
+                if attempt == TTS_MAX_RETRIES:
+                    raise
+                delay = 2 ** attempt + random.random()
+                print(f"    ⚠️  TTS 재시도 {attempt + 1}/{TTS_MAX_RETRIES} ({type(e).__name__}) → {delay:.1f}초 후")
+                time.sleep(delay)
+
+    def split_into_sentence_chunks(self, text: str) -> List[str]:
+        """
+        긴 대본을 문장 경계에서 비슷한 길이의 묶음으로 분할
+
+        Args:
+            text: 대본 텍스트
+
+        Returns:
+            문장 묶음 리스트 (짧은 대본은 원문 하나만 담긴 리스트)
+        """
+        if len(text) < SENTENCE_SPLIT_MIN_CHARS:
+            return [text]
+
+        sentences = [sentence for sentence in _SENTENCE_END_RE.split(text.strip()) if sentence]
+        if len(sentences) < 2:
+            return [text]
+
+        # 문장을 순서대로 모아 목표 길이에 도달하면 다음 묶음으로 넘김
+        target_chars = len(text) / min(MAX_SENTENCE_CHUNKS, len(sentences))
+        chunks = []
+        current = []
+        current_len = 0
+        for sentence in sentences:
+            current.append(sentence)
+            current_len += len(sentence)
+            if current_len >= target_chars and len(chunks) < MAX_SENTENCE_CHUNKS - 1:
+                chunks.append(" ".join(current))
+                current = []
+                current_len = 0
+        if current:
+            chunks.append(" ".join(current))
+
+        return chunks
+
+    def concatenate_audio(self, input_paths: List[Path], output_path: Path):
+        """
+        여러 오디오 파일을 재인코딩 없이 순서대로 연결 (FFmpeg concat demuxer)
+
+        Args:
+            input_paths: 입력 오디오 파일 리스트 (순서대로)
+            output_path: 출력 오디오 파일
+        """
+        concat_file = output_path.parent / f"{output_path.stem}_concat.txt"
+        with open(concat_file, 'w', encoding='utf-8') as f:
+            for input_path in input_paths:
+                f.write(f"file '{input_path.absolute()}'\n")
+
+        try:
+            cmd = [
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
+                "-f", "concat",
+                "-safe", "0",
+                "-i", str(concat_file),
+                "-c", "copy",
+                "-y",
+                str(output_path)
+            ]
+            subprocess.run(cmd, capture_output=True, check=True)
+        finally:
+            concat_file.unlink(missing_ok=True)
+
     def add_silence_to_audio(self, input_path: Path, output_path: Path, silence_duration: float = 0.7) -> bool:
         """
         오디오 파일 끝에 무음 추가 (슬라이드 전환 시 자연스러운 간격)
@@ -97,7 +248,7 @@ class TTSClient:
             total_duration = original_duration + silence_duration
 
             cmd = [
-                "ffmpeg",
+                FFMPEG_BIN, *FFMPEG_QUIET_ARGS,
                 "-i", str(input_path),
                 "-af", f"apad=pad_dur={silence_duration}",
                 "-t", str(total_duration),
@@ -127,7 +278,7 @@ class TTSClient:
         """
         try:
             cmd = [
-                "ffprobe",
+                FFPROBE_BIN,
                 "-v", "error",
                 "-show_entries", "format=duration",
                 "-of", "default=noprint_wrappers=1:nokey=1",
@@ -208,58 +359,105 @@ class TTSClient:
         scripts_json_path: Path,
         output_audio_dir: Path,
         output_meta_path: Path,
-        max_workers: int = 5
+        max_workers: int = 8,
+        scripts: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """
         모든 대본에 대한 오디오 파일 생성 (병렬 처리)
 
         Args:
-            scripts_json_path: 대본 JSON 파일 경로
+            scripts_json_path: 대본 JSON 파일 경로 (scripts가 주어지면 읽지 않음)
             output_audio_dir: 출력 오디오 디렉토리
             output_meta_path: 오디오 메타데이터 JSON 파일 경로
-            max_workers: 최대 병렬 작업 수 (기본 5개)
+            max_workers: 최대 병렬 작업 수 (기본 8개)
+            scripts: 메모리에 있는 대본 리스트 (이전 단계 결과를 그대로 전달, JSON 재파싱 생략)
 
         Returns:
             오디오 메타데이터 리스트
         """
-        # 대본 로드
-        with open(scripts_json_path, 'r', encoding='utf-8') as f:
-            scripts = json.load(f)
-
-        output_audio_dir.mkdir(parents=True, exist_ok=True)
+        # 대본 로드 (메모리로 전달받지 못한 경우에만 파일에서 읽음)
+        if scripts is None:
+            with open(scripts_json_path, 'r', encoding='utf-8') as f:
+                scripts = json.load(f)
 
         print(f"TTS 생성 시작: {len(scripts)}개 대본 (병렬 처리: {max_workers}개 동시)")
 
         # 병렬 처리로 TTS 생성
-        audio_meta = []
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # 모든 작업 제출
             future_to_script = {
-                executor.submit(
-                    self._process_single_script,
-                    script,
-                    output_audio_dir,
-                    output_meta_path
-                ): script for script in scripts
+                self.submit_audio(executor, script, output_audio_dir, output_meta_path): script
+                for script in scripts
             }
 
             # 완료되는 순서대로 결과 수집
-            for future in as_completed(future_to_script):
-                script = future_to_script[future]
-                try:
-                    audio_info = future.result()
-                    audio_meta.append(audio_info)
-                except Exception as e:
-                    print(f"    ✗ 스레드 실행 오류 (슬라이드 {script['index']}): {e}")
-                    # 실패한 경우에도 더미 데이터 추가
-                    audio_meta.append({
-                        "index": script["index"],
-                        "audio": f"slide_{script['index']:03d}.mp3",
-                        "duration": 10.0,
-                        "script": script["script"],
-                        "error": str(e)
-                    })
+            return self.collect_audio(future_to_script, output_meta_path)
+
+    def submit_audio(
+        self,
+        executor: Executor,
+        script: Dict[str, Any],
+        output_audio_dir: Path,
+        output_meta_path: Path
+    ) -> Future:
+        """
+        대본 하나의 TTS 생성을 executor에 제출 (대본이 준비되는 대로 바로 합성 시작용)
 
+        Args:
+            executor: TTS 작업을 실행할 executor
+            script: 스크립트 딕셔너리 {"index": 1, "script": "텍스트"}
+            output_audio_dir: 출력 오디오 디렉토리
+            output_meta_path: 오디오 메타데이터 JSON 파일 경로
+
+        Returns:
+            오디오 메타데이터 딕셔너리를 돌려주는 Future
+        """
+        output_audio_dir.mkdir(parents=True, exist_ok=True)
+        return executor.submit(self._process_single_script, script, output_audio_dir, output_meta_path)
+
+    def iter_audio(
+        self,
+        future_to_script: Dict[Future, Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        제출된 TTS 작업 결과를 완료되는 순서대로 하나씩 반환 (슬라이드별 진행 표시용)
+
+        Args:
+            future_to_script: {submit_audio가 반환한 Future: 스크립트 딕셔너리}
+
+        Yields:
+            오디오 메타데이터 딕셔너리 (실패한 경우 error 키를 가진 더미 데이터)
+        """
+        for future in as_completed(future_to_script):
+            script = future_to_script[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                print(f"    ✗ 스레드 실행 오류 (슬라이드 {script['index']}): {e}")
+                # 실패한 경우에도 더미 데이터 추가
+                yield {
+                    "index": script["index"],
+                    "audio": f"slide_{script['index']:03d}.mp3",
+                    "duration": 10.0,
+                    "script": script["script"],
+                    "error": str(e)
+                }
+
+    def save_audio_meta(
+        self,
+        audio_meta: List[Dict[str, Any]],
+        output_meta_path: Path
+    ) -> List[Dict[str, Any]]:
+        """
+        오디오 메타데이터를 index 순으로 정렬해 JSON으로 저장
+
+        Args:
+            audio_meta: iter_audio로 모은 오디오 메타데이터 리스트
+            output_meta_path: 오디오 메타데이터 JSON 파일 경로
+
+        Returns:
+            오디오 메타데이터 리스트 (index 순)
+        """
         # index 순서대로 정렬
         audio_meta.sort(key=lambda x: x["index"])
 
@@ -272,6 +470,23 @@ class TTSClient:
 
         return audio_meta
 
+    def collect_audio(
+        self,
+        future_to_script: Dict[Future, Dict[str, Any]],
+        output_meta_path: Path
+    ) -> List[Dict[str, Any]]:
+        """
+        제출된 TTS 작업 결과를 모아 메타데이터 JSON으로 저장
+
+        Args:
+            future_to_script: {submit_audio가 반환한 Future: 스크립트 딕셔너리}
+            output_meta_path: 오디오 메타데이터 JSON 파일 경로
+
+        Returns:
+            오디오 메타데이터 리스트 (index 순)
+        """
+        return self.save_audio_meta(list(self.iter_audio(future_to_script)), output_meta_path)
+
 
 if __name__ == "__main__":
     # 테스트 코드
@@ -12,6 +12,7 @@ import shutil
 import gradio as gr
 
 from app import config
+from app.modules.log_utils import render_log_lines
 from .ppt_element_extractor import extract_ppt_elements
 from .html_generator import generate_html_with_animations
 from .puppeteer_recorder import record_html_to_video
@@ -24,10 +25,22 @@ class ReactantWorkflow:
         self.reactant_dir = config.TEMP_DIR / "reactant"
         self.reactant_dir.mkdir(parents=True, exist_ok=True)
 
-    def log(self, message: str, log_text: str = "") -> str:
-        """로그 메시지 누적"""
+    def log(self, message: str, log_text=""):
+        """
+        로그 메시지 누적
+
+        log_text가 리스트면 줄을 append만 하고 같은 리스트를 반환 (O(1)),
+        문자열이면 기존처럼 이어 붙인 새 문자열을 반환
+        """
+        if isinstance(log_text, list):
+            log_text.append(message)
+            return log_text
         return log_text + message + "\n"
 
+    def render_log(self, log_lines, full: bool = False) -> str:
+        """리스트 로그 버퍼를 화면 표시용 문자열로 변환 (진행 중에는 최근 config.UI_LOG_TAIL_LINES줄만, full=True면 전체)"""
+        return render_log_lines(log_lines, 0 if full else config.UI_LOG_TAIL_LINES)
+
     def convert_ppt_to_reactant_video(
         self,
         pptx_file,
@@ -53,16 +66,16 @@ class ReactantWorkflow:
         Yields:
             (log_output, output_path, html_preview_path)
         """
-        log_output = ""
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
 
         try:
             # ===== STEP 1: PPT 요소 추출 =====
             progress(0.1, desc="PPT 요소 추출 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("🎨 STEP 1: PPT 요소 추출 (Reactant 모드)", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("🎨 STEP 1: PPT 요소 추출 (Reactant 모드)", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # PPT 파일 경로
             pptx_path = Path(pptx_file.name)
@@ -71,36 +84,39 @@ class ReactantWorkflow:
             elements_json = self.reactant_dir / "elements.json"
             elements_dir = self.reactant_dir / "elements"
 
-            log_output = self.log(f"📄 PPT 파일: {pptx_path.name}", log_output)
-            log_output = self.log("🔍 텍스트, 이미지, 도형 추출 중...", log_output)
-            yield log_output, None, None
+            self.log(f"📄 PPT 파일: {pptx_path.name}", log_lines)
+            self.log("🔍 텍스트, 이미지, 도형 추출 중...", log_lines)
+            yield self.render_log(log_lines), None, None
 
             elements = extract_ppt_elements(pptx_path, elements_json, elements_dir)
 
-            log_output = self.log(f"✅ 요소 추출 완료: {len(elements['slides'])}개 슬라이드", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log(f"✅ 요소 추출 완료: {len(elements['slides'])}개 슬라이드", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # ===== STEP 2: 대본 생성 및 TTS =====
             progress(0.2, desc="AI 대본 생성 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("🤖 STEP 2: AI 대본 생성", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("🤖 STEP 2: AI 대본 생성", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # 슬라이드 텍스트로부터 대본 생성
             from app.modules.script_generator import ScriptGenerator
 
-            script_generator = ScriptGenerator(api_key=config.ANTHROPIC_API_KEY)
+            script_generator = ScriptGenerator(
+                api_key=config.ANTHROPIC_API_KEY,
+                temperature=config.LLM_TEMPERATURE
+            )
 
             scripts_data = []
             total_slides = len(elements['slides'])
             target_duration_per_slide = (total_duration_minutes * 60) / total_slides
 
             for i, slide_element in enumerate(elements['slides'], start=1):
-                log_output = self.log(f"  - 슬라이드 {i}/{total_slides}: 대본 생성 중...", log_output)
-                yield log_output, None, None
+                self.log(f"  - 슬라이드 {i}/{total_slides}: 대본 생성 중...", log_lines)
+                yield self.render_log(log_lines), None, None
 
                 # 슬라이드 텍스트 결합
                 slide_texts = [text_info["text"] for text_info in slide_element.get("texts", [])]
@@ -127,25 +143,25 @@ class ReactantWorkflow:
                     "script": script_text
                 })
 
-                log_output = self.log(f"    ✓ {len(script_text)}자 생성", log_output)
-                yield log_output, None, None
+                self.log(f"    ✓ {len(script_text)}자 생성", log_lines)
+                yield self.render_log(log_lines), None, None
 
             # 대본 JSON 저장
             scripts_json = self.reactant_dir / "scripts.json"
             with open(scripts_json, 'w', encoding='utf-8') as f:
                 json.dump(scripts_data, f, ensure_ascii=False, indent=2)
 
-            log_output = self.log(f"✅ 대본 생성 완료: {len(scripts_data)}개", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log(f"✅ 대본 생성 완료: {len(scripts_data)}개", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # ===== STEP 3: TTS 생성 =====
             progress(0.4, desc="TTS 음성 생성 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log(f"🔊 STEP 3: TTS 음성 생성 (음성: {voice_choice})", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log(f"🔊 STEP 3: TTS 음성 생성 (음성: {voice_choice})", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             from app.modules.tts_client import TTSClient
 
@@ -155,21 +171,24 @@ class ReactantWorkflow:
             tts_client = TTSClient(
                 provider=config.TTS_PROVIDER,
                 api_key=config.OPENAI_API_KEY,
-                voice=voice_choice
+                voice=voice_choice,
+                cache_dir=config.TTS_CACHE_DIR,
+                cache_max_mb=config.TTS_CACHE_MAX_MB,
+                max_inflight=config.TTS_MAX_INFLIGHT
             )
 
             audio_meta_json = self.reactant_dir / "audio_meta.json"
             audio_meta = tts_client.generate_audio(scripts_json, audio_dir, audio_meta_json)
 
             total_audio_duration = sum(item['duration'] for item in audio_meta)
-            log_output = self.log(f"✅ TTS 생성 완료: {len(audio_meta)}개 오디오 ({total_audio_duration:.1f}초)", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log(f"✅ TTS 생성 완료: {len(audio_meta)}개 오디오 ({total_audio_duration:.1f}초)", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # ===== STEP 4: 단어별 타이밍 계산 =====
             progress(0.5, desc="단어별 타이밍 계산 중...")
-            log_output = self.log("⏱️  단어별 타이밍 계산 중...", log_output)
-            yield log_output, None, None
+            self.log("⏱️  단어별 타이밍 계산 중...", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # 각 슬라이드의 대본과 TTS 길이를 매칭하여 단어별 타이밍 계산
             slides_with_timing = []
@@ -232,87 +251,87 @@ class ReactantWorkflow:
 
                 cumulative_time += audio_duration
 
-            log_output = self.log(f"✅ 타이밍 계산 완료: 총 {cumulative_time:.1f}초", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log(f"✅ 타이밍 계산 완료: 총 {cumulative_time:.1f}초", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # ===== STEP 5: HTML 생성 =====
             progress(0.6, desc="인터랙티브 HTML 생성 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("🌐 STEP 5: HTML + 애니메이션 생성", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("🌐 STEP 5: HTML + 애니메이션 생성", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             html_path = self.reactant_dir / "index.html"
 
-            log_output = self.log("🎬 TTS 싱크 텍스트 애니메이션 생성 중...", log_output)
-            yield log_output, None, None
+            self.log("🎬 TTS 싱크 텍스트 애니메이션 생성 중...", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # 실제 타이밍 데이터로 HTML 생성
             generate_html_with_animations(slides_with_timing, html_path, cumulative_time)
 
-            log_output = self.log(f"✅ HTML 생성 완료: {html_path}", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, None
+            self.log(f"✅ HTML 생성 완료: {html_path}", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, None
 
             # ===== STEP 6: 출력 형식에 따라 분기 =====
             if output_format == "html":
                 # HTML 플레이어 모드: ZIP 패키징
                 progress(0.8, desc="HTML 패키지 생성 중...")
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                log_output = self.log("📦 STEP 6: HTML 플레이어 패키징", log_output)
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                log_output = self.log("", log_output)
-                yield log_output, None, str(html_path)
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                self.log("📦 STEP 6: HTML 플레이어 패키징", log_lines)
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                self.log("", log_lines)
+                yield self.render_log(log_lines), None, str(html_path)
 
                 # ZIP 파일 생성
                 zip_path = config.OUTPUT_DIR / f"{output_name}_player.zip"
-                log_output = self.log("🗜️  ZIP 패키지 생성 중...", log_output)
-                yield log_output, None, str(html_path)
+                self.log("🗜️  ZIP 패키지 생성 중...", log_lines)
+                yield self.render_log(log_lines), None, str(html_path)
 
                 self._create_zip_package(html_path, zip_path)
 
-                log_output = self.log(f"✅ HTML 플레이어 패키지 완료!", log_output)
-                log_output = self.log(f"  📁 ZIP: {zip_path}", log_output)
-                log_output = self.log(f"  🌐 미리보기: 아래 플레이어에서 확인", log_output)
-                log_output = self.log("", log_output)
-                log_output = self.log("💡 사용법:", log_output)
-                log_output = self.log("  1. ZIP 다운로드 후 압축 해제", log_output)
-                log_output = self.log("  2. index.html을 브라우저로 열기", log_output)
-                log_output = self.log("  3. 재생 버튼 클릭!", log_output)
-                log_output = self.log("", log_output)
+                self.log(f"✅ HTML 플레이어 패키지 완료!", log_lines)
+                self.log(f"  📁 ZIP: {zip_path}", log_lines)
+                self.log(f"  🌐 미리보기: 아래 플레이어에서 확인", log_lines)
+                self.log("", log_lines)
+                self.log("💡 사용법:", log_lines)
+                self.log("  1. ZIP 다운로드 후 압축 해제", log_lines)
+                self.log("  2. index.html을 브라우저로 열기", log_lines)
+                self.log("  3. 재생 버튼 클릭!", log_lines)
+                self.log("", log_lines)
 
                 progress(1.0, desc="완료!")
-                yield log_output, str(zip_path), str(html_path)
+                yield self.render_log(log_lines, full=True), str(zip_path), str(html_path)
 
             else:
                 # MP4 모드: Puppeteer 녹화
                 progress(0.8, desc="웹 페이지 녹화 중...")
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                log_output = self.log("🎥 STEP 6: 웹 페이지 → MP4 녹화", log_output)
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                log_output = self.log("", log_output)
-                log_output = self.log(f"⏱️  예상 소요 시간: {cumulative_time * 1.5 / 60:.1f}분", log_output)
-                yield log_output, None, None
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                self.log("🎥 STEP 6: 웹 페이지 → MP4 녹화", log_lines)
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                self.log("", log_lines)
+                self.log(f"⏱️  예상 소요 시간: {cumulative_time * 1.5 / 60:.1f}분", log_lines)
+                yield self.render_log(log_lines), None, None
 
                 output_video = config.OUTPUT_DIR / f"{output_name}.mp4"
 
-                log_output = self.log("📹 Puppeteer로 브라우저 녹화 시작...", log_output)
-                log_output = self.log(f"  - 녹화 시간: {cumulative_time:.1f}초", log_output)
-                yield log_output, None, None
+                self.log("📹 Puppeteer로 브라우저 녹화 시작...", log_lines)
+                self.log(f"  - 녹화 시간: {cumulative_time:.1f}초", log_lines)
+                yield self.render_log(log_lines), None, None
 
                 record_html_to_video(html_path, output_video, duration=cumulative_time)
 
-                log_output = self.log(f"✅ 영상 생성 완료: {output_video}", log_output)
-                log_output = self.log("", log_output)
+                self.log(f"✅ 영상 생성 완료: {output_video}", log_lines)
+                self.log("", log_lines)
 
                 progress(1.0, desc="완료!")
-                yield log_output, str(output_video), None
+                yield self.render_log(log_lines, full=True), str(output_video), None
 
         except Exception as e:
-            log_output = self.log(f"❌ 오류 발생: {str(e)}", log_output)
-            yield log_output, None, None
+            self.log(f"❌ 오류 발생: {str(e)}", log_lines)
+            yield self.render_log(log_lines, full=True), None, None
             raise
 
     def _create_zip_package(self, html_path: Path, zip_path: Path):
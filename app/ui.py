@@ -2,40 +2,474 @@
 Gradio 웹 UI for PPT to Video Pipeline (개선 버전)
 Claude의 사고 과정을 실시간으로 보여주는 상세한 UI
 """
+import asyncio
 import gradio as gr
+import httpx
 from pathlib import Path
 import sys
+import base64
 import shutil
 import os
+import re
 import json
+import logging
+import hashlib
+import importlib.util
+import math
+import multiprocessing
+import random
 import subprocess
+import textwrap
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import traceback
+import queue
+import zipfile
+from xml.etree import ElementTree
+from functools import lru_cache, partial
+from itertools import accumulate
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pptx import Presentation
+import anthropic
+from openai import OpenAI
+
+try:
+    import orjson  # 선택 의존성: 설치되어 있으면 scripts.json 직렬화에 사용 (표준 json보다 수 배 빠름)
+except ImportError:
+    orjson = None
 
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from app import config
-from app.modules.ppt_parser import PPTParser, convert_pptx_to_images
+from app.modules.ppt_parser import PPTParser, convert_pptx_to_images, warm_up_libreoffice
 from app.modules.pdf_parser import PDFParser
 from app.modules.script_generator import ScriptGenerator
 from app.modules.tts_client import TTSClient
-from app.modules.ffmpeg_renderer import FFmpegRenderer
-from app.modules.keyword_marker import KeywordMarker
+from app.modules.ffmpeg_renderer import FFmpegRenderer, available_video_codecs
+from app.modules.keyword_marker import KeywordMarker, init_ocr_worker, ocr_worker
+from app.modules.log_utils import render_log_lines
 from app.modules.subtitle_generator import SubtitleGenerator
 
 
+# 출력 파일명에서 허용하지 않는 문자 (유니코드 문자/숫자, 공백, _, - 만 허용)
+_FILENAME_SANITIZE_RE = re.compile(r"[^\w \-]")
+
+# 해상도 드롭다운 값 → (너비, 높이)
+_RESOLUTIONS = {"1920x1080": (1920, 1080), "1280x720": (1280, 720), "3840x2160": (3840, 2160)}
+
+# 화살표 마커 패턴: "[1] 키워드" (권장) / "★1 키워드" (하위 호환)
+_ARROW_BRACKET_RE = re.compile(r'\[(\d{1,2})\]\s*([^\n,\[\]]+)')
+_ARROW_STAR_RE = re.compile(r'[★☆](\d{1,2})\s*([^\n,★☆]+)')
+
+# Claude 응답 태그 (한 번의 스캔으로 모든 태그 추출)
+_RESPONSE_TAG_RE = re.compile(r'<(thinking|keywords|highlight|script)>(.*?)</\1>', re.DOTALL)
+# 응답 태그 자체 (여닫는 태그 모두, 태그 없는 응답 정리용)
+_BARE_TAG_RE = re.compile(r'</?(?:thinking|keywords|highlight|script)>')
+
+# 키워드 줄: "- 키워드|2.5초" → (키워드, 2.5)
+_KEYWORD_LINE_RE = re.compile(r'^[ \t]*-*[ \t]*([^|\n]+?)[ \t]*\|[ \t]*(\d+(?:\.\d+)?)', re.M)
+
+# 배치 대본 응답에서 슬라이드별 블록 추출
+_SLIDE_OUT_RE = re.compile(r'<slide_out idx="(\d+)">(.*?)</slide_out>', re.DOTALL)
+
+
+# 대본 응답 출력 한도 상한 (목표 시간에 맞춘 한도로 응답이 잘리면 이 한도로 한 번 다시 요청)
+SCRIPT_MAX_TOKENS = 2048
+
+# 결과 영상 캐시 최대 보관 개수 (오래 사용하지 않은 항목부터 삭제)
+RESULT_CACHE_MAX_ENTRIES = 20
+
+
+# ===== 대본 생성 프롬프트 템플릿 (슬라이드마다 바뀌는 값만 format으로 채움) =====
+# 첫 슬라이드용 강사 역할 안내문
+_SCRIPT_INTRO_FIRST = """당신은 학생들을 가르치는 친절한 **강사**입니다.
+다음 슬라이드를 보면서 학생들에게 내용을 **가르쳐주세요**.
+단순히 텍스트를 읽는 것이 아니라, 강의실에서 학생들 앞에 서서
+자연스럽게 설명하듯이 말해야 합니다.
+
+**이것은 프레젠테이션의 첫 번째 슬라이드입니다.**
+간단한 인사말로 시작하고 바로 주제로 들어가세요.
+
+⚠️  **절대 금지 사항**:
+- ❌ "저는 교수 ○○○입니다", "제 이름은..." 같은 자기소개 금지
+- ❌ "이번 학기 이 과목을 가르칠..." 같은 역할 소개 금지
+- ✅ "안녕하세요, 오늘은 [주제]에 대해 알아보겠습니다" 식으로 바로 내용 시작"""
+
+# 두 번째 이후 슬라이드용 강사 역할 안내문 (slide_num, total_slides)
+_SCRIPT_INTRO_NEXT = """당신은 학생들을 가르치는 친절한 **강사**입니다.
+다음 슬라이드를 보면서 학생들에게 내용을 **가르쳐주세요**.
+단순히 텍스트를 읽는 것이 아니라, 강의실에서 학생들 앞에 서서
+자연스럽게 설명하듯이 말해야 합니다.
+
+**이것은 프레젠테이션의 {slide_num}번째 슬라이드입니다 (총 {total_slides}개).**
+이전 슬라이드에서 이어지는 내용이므로:
+- ❌ "안녕하세요", "반갑습니다" 같은 인사말 사용 금지
+- ❌ 주제를 처음 소개하듯이 말하지 말 것
+- ✅ 이전 내용에서 자연스럽게 이어지도록 작성
+- ✅ "다음으로~", "이어서~", "그럼 이제~" 같은 연결 표현 사용"""
+
+# 대본 작성 규칙 + 출력 형식 안내문 (target_duration, expected_chars)
+_SCRIPT_GUIDELINES = """【중요: 자연스러운 설명 방식】
+
+❌ 절대 하지 말아야 할 것:
+- 화면에 보이는 텍스트를 **그대로 읽지 마세요**
+- "이 슬라이드에서는...", "여기 보시면..." 같은 표현 자제
+- 슬라이드 제목을 그대로 반복하지 마세요
+
+✅ 반드시 해야 할 것:
+- 화면의 내용을 **다른 말로 풀어서** 설명하세요
+- 배경 지식, 이유, 맥락을 **덧붙여** 설명하세요
+- 학생들이 "왜?", "어떻게?"를 이해할 수 있도록 설명
+- "쉽게 말해서~", "이게 왜 중요하냐면~" 같은 자연스러운 연결
+
+예시:
+- 슬라이드: "반도체 8대 공정"
+- ❌ 나쁜 예: "반도체 8대 공정에 대해 알아보겠습니다"
+- ✅ 좋은 예: "반도체 하나가 만들어지려면 여덟 가지 핵심 과정을 거쳐야 하는데요"
+
+【형식 요구사항 - ⚠️ 글자 수 엄격 준수 ⚠️】
+- 자연스러운 구어체 (강의실에서 말하듯이)
+- ⚠️ **반드시** {target_duration}초 분량 = **정확히 {expected_chars}자** (±10자 이내)
+- TTS 속도: 초당 4글자 기준 (한국어)
+- 글자 수가 부족하면 예시/비유 추가, 초과하면 핵심만 남기기
+
+먼저 <thinking> 태그 안에:
+1. 이 슬라이드에서 학생들이 꼭 이해해야 할 핵심 내용
+2. 시각적 요소(그림, 도표, 차트 등)가 있다면 어떻게 설명할지
+3. {target_duration}초 안에 모든 내용을 어떻게 전달할지 전략
+4. 어떤 비유나 예시를 사용하여 쉽게 설명할지
+
+그 다음 <keywords> 태그 안에:
+- ⚠️  **매우 중요**: 슬라이드 본문에 **실제로 보이는 텍스트**만 키워드로 선택하세요
+- 슬라이드 제목이나 본문에 **정확히 있는 단어/구절**을 2-3개 선택
+- 개념을 설명하는 단어가 아니라, **화면에 표시된 그대로의 텍스트**를 선택
+- 예시:
+  - ✅ 좋은 예: "반도체 8대공정" (슬라이드에 실제로 있음)
+  - ❌ 나쁜 예: "공정 개요" (설명을 위해 만든 단어)
+- 각 키워드가 대본에서 언급되는 대략적인 시점(초)을 예측
+- 형식: "키워드|시점초" (예: "머신러닝|2.5")
+- 한 줄에 하나씩 작성
+
+그 다음 <highlight> 태그 안에 (선택적):
+- 이 슬라이드가 **전체 강의의 핵심 포인트**라면, 화면 중앙에 크게 표시할 문구 작성
+- 전체 슬라이드 중 약 30%만 하이라이트 대상 (핵심 개념, 중요 결론 등)
+- 일반적인 설명 슬라이드라면 이 태그를 **비워두세요**
+- 형식: "강조문구|시점초" (예: "미세공정이 핵심이다|5.0")
+- 강조 문구는 짧고 임팩트 있게 (5~15자)
+- 대본에서 해당 문구가 언급되는 시점에 맞춰 시점 지정
+
+마지막으로 <script> 태그 안에 **정확히 {expected_chars}자** (±10자)로
+마치 강의실에서 학생들에게 설명하듯이 자연스러운 구어체 강의 대본을 작성해주세요.
+⚠️ 글자 수를 반드시 지켜주세요! TTS 영상 길이가 이에 따라 결정됩니다."""
+
+
+@lru_cache(maxsize=16)
+def _render_script_guidelines(target_duration):
+    """대본 작성 규칙 (목표 시간이 같은 덱 전체에서 한 번만 만들어 재사용)"""
+    return _SCRIPT_GUIDELINES.format(
+        target_duration=target_duration,
+        expected_chars=int(target_duration * 4)
+    )
+
+
+def _script_max_tokens(target_duration):
+    """
+    슬라이드 하나의 응답(사고 과정 + 키워드 + 하이라이트 + 대본)에 필요한 max_tokens
+
+    목표 글자 수(초당 4글자)에 비례해 잡되, 한국어는 글자당 토큰이 많아 글자 수의 2배에
+    사고 과정/태그 여유분을 더함 (짧은 슬라이드는 1024, 긴 슬라이드도 상한 SCRIPT_MAX_TOKENS 이내)
+    """
+    expected_chars = int(target_duration * 4)
+    return min(SCRIPT_MAX_TOKENS, max(1024, expected_chars * 2 + 768))
+
+
+def _retime_keyword_overlays(script_text, keyword_overlays, actual_duration, marking_delay=0.5):
+    """
+    키워드 마킹 타이밍을 실제 TTS 길이 기준으로 재계산 (글자 위치 비례)
+
+    Args:
+        script_text: 슬라이드 대본
+        keyword_overlays: 키워드 오버레이 리스트 (timing이 제자리에서 갱신됨)
+        actual_duration: 실제 TTS 길이 (초)
+        marking_delay: TTS가 단어를 말한 직후 마킹을 띄우기 위한 딜레이 (초)
+
+    Returns:
+        변경 내역 [(키워드, 이전 타이밍, 새 타이밍, 키워드 글자 위치), ...]
+    """
+    seconds_per_char = actual_duration / max(len(script_text), 1)
+    # 대본 생성 때 구해 둔 위치(char_pos)가 있으면 그대로 쓰고,
+    # 없으면 같은 키워드가 여러 번 마킹돼도 대본 검색은 키워드당 한 번만
+    positions = {}
+    changes = []
+    for kw_overlay in keyword_overlays:
+        if not kw_overlay.get('found'):
+            continue
+
+        keyword_text = kw_overlay['keyword']
+        keyword_pos = kw_overlay.get('char_pos')
+        if keyword_pos is None:
+            keyword_pos = positions.get(keyword_text)
+        if keyword_pos is None:
+            keyword_pos = positions[keyword_text] = script_text.find(keyword_text)
+        if keyword_pos < 0:
+            continue
+
+        old_timing = kw_overlay['timing']
+        new_timing = keyword_pos * seconds_per_char + marking_delay
+        kw_overlay['timing'] = new_timing
+        changes.append((keyword_text, old_timing, new_timing, keyword_pos))
+    return changes
+
+
+def _remove_arrow_markers(scripts_data, slides_img_dir):
+    """
+    화살표 마커(★1, ★2 등) 영역을 슬라이드 이미지에서 제거 (영상에서 마커가 보이지 않도록)
+
+    마커 위치는 대본 생성 단계에서 이미 정해지고 오디오와는 무관하므로,
+    TTS 결과를 기다리는 동안 백그라운드에서 미리 처리할 수 있음
+
+    Args:
+        scripts_data: 대본 리스트 (arrow_pointers의 marker_bbox 사용)
+        slides_img_dir: 슬라이드 이미지 폴더 (원본을 덮어씀)
+
+    Returns:
+        제거한 마커 수
+    """
+    marker = None
+    removed = 0
+    for script_item in scripts_data:
+        bboxes = [arrow["marker_bbox"] for arrow in script_item.get("arrow_pointers", [])
+                  if arrow.get("marker_bbox")]
+        if not bboxes:
+            continue
+
+        slide_path = slides_img_dir / f"slide_{script_item.get('index', 0):03d}.png"
+        if not slide_path.exists():
+            continue
+
+        # KeywordMarker를 사용하여 마커 제거 (인페인팅, OCR 없이 한 번만 생성)
+        if marker is None:
+            marker = KeywordMarker(use_ocr=False)
+        marker.remove_markers_from_image(
+            str(slide_path),
+            bboxes,
+            output_path=str(slide_path),  # 원본 덮어쓰기
+            method="inpaint"
+        )
+        removed += len(bboxes)
+    return removed
+
+
+def _write_json(path, data):
+    """JSON 파일 저장 (들여쓰기 2칸, 한글 그대로) - orjson이 있으면 orjson으로 직렬화"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _append_ndjson(f, item):
+    """열린 바이너리 파일에 JSON 한 줄 추가 (중간 결과를 작업 도중 바로 남기는 용도)"""
+    if orjson is not None:
+        f.write(orjson.dumps(item, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE))
+    else:
+        f.write(json.dumps(item, ensure_ascii=False).encode('utf-8') + b"\n")
+    f.flush()
+
+
+def _preview(text, limit):
+    """로그/프롬프트용 미리보기 (limit자보다 길 때만 잘라서 '...' 표시, 짧으면 원문 그대로)"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _sanitize_output_name(output_name):
+    """출력 파일명 정리 (허용 문자만 남기고 공백은 _로, 비어 있으면 기본 이름)"""
+    return _FILENAME_SANITIZE_RE.sub("", output_name or "").strip().replace(' ', '_') or "output_video"
+
+
+def _parse_resolution(resolution_choice):
+    """해상도 문자열("1920x1080")을 (너비, 높이)로 변환 (드롭다운 값은 미리 만든 표에서 조회)"""
+    size = _RESOLUTIONS.get(resolution_choice)
+    if size is None:
+        width, height = map(int, resolution_choice.split('x'))
+        size = (width, height)
+    return size
+
+
+def _build_subtitle_timeline(audio_meta, transition_effect="none", transition_duration=0.0):
+    """
+    자막 생성용 타임라인 구성
+
+    전환 효과(xfade + acrossfade)를 쓰면 클립끼리 transition_duration만큼 겹치므로
+    시작 시각은 겹친 만큼 앞당기고, 표시 길이는 겹치는 쪽만큼 줄임
+    (첫/마지막 클립은 한쪽만 겹치므로 절반, 중간 클립은 전체)
+
+    Returns:
+        [{"script": 대본, "start_time": 시작(초), "duration": 표시 길이(초)}, ...]
+    """
+    durations = [item.get("duration", 0.0) for item in audio_meta]
+    overlap = transition_duration if transition_effect != "none" and transition_duration > 0 else 0.0
+    last = len(durations) - 1
+
+    # 각 클립 시작 시각 = 앞 클립들의 (길이 - 겹침) 누적합
+    starts = accumulate((duration - overlap for duration in durations[:-1]), initial=0.0)
+
+    timeline = []
+    for i, (item, start, clip_duration) in enumerate(zip(audio_meta, starts, durations)):
+        if overlap:
+            effective_duration = clip_duration - (overlap / 2 if i in (0, last) else overlap)
+        else:
+            effective_duration = clip_duration
+        timeline.append({
+            "script": item.get("script", ""),
+            "start_time": start,
+            "duration": max(0.5, effective_duration)  # 최소 0.5초
+        })
+    return timeline
+
+
+# 작업 디렉토리 생성 완료 여부 (GradioUI 인스턴스가 여러 번 만들어져도 한 번만 확인)
+_DIRS_READY = False
+
+
+@lru_cache(maxsize=32)
+def _count_slides_cached(file_path, mtime, size):
+    """
+    슬라이드 개수 (경로/수정시각/크기가 같으면 캐시된 값 반환)
+
+    전체 프레젠테이션을 파싱하지 않고 ppt/presentation.xml의 슬라이드 목록(sldIdLst)만 읽음
+    """
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            root = ElementTree.fromstring(zf.read("ppt/presentation.xml"))
+        return len(root.findall("./{*}sldIdLst/{*}sldId"))
+    except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        # 표준 구조가 아니면 python-pptx로 전체 파싱
+        return len(Presentation(file_path).slides)
+
+
+@lru_cache(maxsize=64)
+def _available_durations(slide_count):
+    """
+    슬라이드 개수별 영상 길이 옵션 (슬라이드 개수만으로 결정되는 순수 계산이라 캐시)
+
+    캐시된 값을 호출하는 쪽이 바꾸지 못하도록 옵션은 튜플로 반환
+    """
+    if slide_count == 0:
+        return ("1", "3", "5", "10", "15", "20"), "5", "PPT를 업로드하면 적정 시간을 추천해드립니다"
+
+    min_min, max_min, recommended_min = GradioUI.calculate_duration_range(slide_count)
+
+    # 모든 가능한 옵션
+    all_options = [1, 3, 5, 10, 15, 20]
+
+    # 범위 내의 옵션만 선택
+    available = [str(m) for m in all_options if min_min <= m <= max_min]
+
+    # 선택 가능한 옵션이 없으면 범위 확장
+    if not available:
+        if max_min < 1:
+            available = ["1"]
+        elif min_min > 20:
+            available = ["20"]
+        else:
+            available = [str(min_min)] if min_min not in all_options else [str(min(all_options, key=lambda x: abs(x - min_min)))]
+
+    # 기본값: 권장 시간과 가장 가까운 옵션
+    default_value = min(available, key=lambda x: abs(int(x) - recommended_min))
+
+    # 정보 메시지
+    info_message = (
+        f"📊 슬라이드 {slide_count}장 분석 완료\n"
+        f"적정 범위: {min_min}~{max_min}분\n"
+        f"권장: {recommended_min}분"
+    )
+
+    return tuple(available), default_value, info_message
+
+
+def _warmup():
+    """
+    외부 도구의 콜드 스타트 비용을 앱 시작 시 백그라운드에서 미리 치름 (첫 사용자의 변환 대기 단축)
+
+    - FFmpeg: 실행 파일 로딩 + 하드웨어 인코더 탐지 (결과는 프로세스 동안 캐시됨)
+    - LibreOffice: 변환에서 재사용할 사용자 프로필 초기화
+    """
+    try:
+        encoder = FFmpegRenderer(codec=config.VIDEO_CODEC).hw_encoder
+        print(f"🔥 FFmpeg 준비 완료 (인코더: {encoder or 'libx264'})")
+        if warm_up_libreoffice():
+            print("🔥 LibreOffice 준비 완료")
+    except Exception as e:
+        print(f"⚠️  사전 준비(warm-up) 실패 (변환 시 다시 시도): {e}")
+
+
+async def _update_duration_options(ui, pptx_file):
+    """
+    PPT 업로드 시 슬라이드 개수에 따라 영상 길이 옵션 업데이트
+
+    파일을 여는 슬라이드 카운트는 스레드에서 실행해 이벤트 루프를 막지 않음
+    (인터페이스를 만들 때마다 클로저를 새로 정의하지 않도록 모듈 함수로 두고 partial로 ui를 묶음)
+
+    Args:
+        ui: GradioUI 인스턴스
+        pptx_file: 업로드된 PPT 파일
+
+    Returns:
+        (영상 길이 드롭다운 업데이트, 슬라이드 개수)
+    """
+    loop = asyncio.get_running_loop()
+    slide_count = await loop.run_in_executor(None, ui.count_slides, pptx_file)
+    choices, value, info = ui.get_available_durations(slide_count)
+
+    return gr.Dropdown(choices=choices, value=value, info=info), slide_count
+
+
 class GradioUI:
     """Gradio UI 클래스 (상세 로깅 버전)"""
 
     def __init__(self):
-        """초기화: 필요한 디렉토리 생성"""
+        """초기화: 필요한 디렉토리 생성 및 공용 경로 준비"""
         self.ensure_directories()
 
+        # 매 클릭마다 다시 만들지 않도록 메타데이터 경로를 한 번만 계산
+        self.slides_json = config.META_DIR / "slides.json"
+        self.scripts_json = config.META_DIR / "scripts.json"
+        self.audio_meta_json = config.META_DIR / "audio_meta.json"
+
+        # API 클라이언트 캐시 (HTTP 연결/인증을 클릭마다 새로 만들지 않도록 재사용)
+        self._clients_lock = threading.Lock()
+        self._http_client = None  # Anthropic/OpenAI가 함께 쓰는 연결 풀 (TLS 핸드셰이크 재사용)
+        self._anthropic_client = None
+        self._openai_client = None
+        self._tts_clients = {}  # {voice: TTSClient}
+        # 의존성 체크는 시작 시 한 번만 수행 (세션 중 설치했다면 refresh_dependencies 호출)
+        self._deps_issues = self._compute_dependencies()
+        # 슬라이드 이미지 base64 캐시 {경로: (수정 시각, base64 문자열)} - 재시도/배치마다 다시 인코딩하지 않음
+        self._image_b64_cache = {}
+
+        # Claude 응답 메모리 캐시 {(종류, 요청 해시): 응답 텍스트} - 디스크 캐시 앞단의 LRU
+        self._llm_memo = OrderedDict()
+        self._llm_memo_lock = threading.Lock()
+
+        # 여러 변환 작업이 동시에 돌아도 Claude 동시 요청 수가 속도 제한을 넘지 않도록 전체 상한
+        self._llm_semaphore = threading.BoundedSemaphore(max(1, config.LLM_MAX_INFLIGHT))
+
+        # OCR 모델 로딩이 무거운 KeywordMarker 재사용 풀 (한 번에 한 스레드만 사용)
+        self._marker_pool = queue.SimpleQueue()
+
     def ensure_directories(self):
-        """필요한 디렉토리가 없으면 생성"""
+        """필요한 디렉토리가 없으면 생성 (프로세스당 한 번만 수행, UI를 다시 만들어도 생략)"""
+        global _DIRS_READY
+        if _DIRS_READY:
+            return
+
         directories = [
             config.INPUT_DIR,
             config.OUTPUT_DIR,
@@ -45,12 +479,342 @@ class GradioUI:
             config.CLIPS_DIR
         ]
         for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
+            if not directory.is_dir():
+                os.makedirs(directory, exist_ok=True)
+        _DIRS_READY = True
 
     def log(self, message, log_text=""):
-        """로그 메시지 누적"""
+        """
+        로그 메시지 누적
+
+        log_text가 리스트면 줄을 append만 하고 같은 리스트를 반환 (O(1)),
+        문자열이면 기존처럼 이어 붙인 새 문자열을 반환
+        """
+        if isinstance(log_text, list):
+            log_text.append(message)
+            return log_text
         return log_text + message + "\n"
 
+    def log_block(self, title, body, log_text=""):
+        """
+        여러 줄 텍스트(사고 과정, 대본 등)를 한 덩어리로 로그에 추가
+
+        줄마다 테두리를 그려 append하지 않고 블록 전체를 한 번만 추가
+        """
+        return self.log(f"--- {title} ---\n{body}\n---", log_text)
+
+    def _throttle_progress(self, progress, min_interval=0.1):
+        """
+        진행률 업데이트를 최대 초당 1/min_interval회로 합치는 래퍼 반환
+
+        병렬 작업 완료가 몰릴 때 progress 웹소켓 프레임이 연달아 나가지 않도록,
+        직전 전송 후 min_interval이 지나지 않은 업데이트는 건너뜀 (force=True면 항상 전송)
+        """
+        last_sent = [0.0]
+
+        def update(value, desc=None, force=False):
+            now = time.monotonic()
+            if force or now - last_sent[0] >= min_interval:
+                progress(value, desc=desc)
+                last_sent[0] = now
+
+        return update
+
+    def _wait_with_progress(self, future, progress, value, desc, interval=1.0):
+        """
+        오래 걸리는 백그라운드 작업을 기다리면서 진행률 설명에 경과 시간을 주기적으로 표시
+
+        렌더링처럼 중간 로그가 없는 단계에서도 화면이 멈춘 것처럼 보이지 않도록
+        interval초마다 progress만 갱신 (로그 전체를 다시 보내는 yield는 하지 않음)
+
+        Args:
+            future: 기다릴 Future
+            progress: Gradio progress
+            value: 표시할 진행률 (0~1)
+            desc: 진행률 설명
+            interval: 경과 시간 갱신 간격 (초)
+
+        Returns:
+            future.result() (작업 중 발생한 예외는 그대로 전달)
+        """
+        started = time.monotonic()
+        while True:
+            try:
+                return future.result(timeout=interval)
+            except FutureTimeoutError:
+                progress(value, desc=f"{desc} ({time.monotonic() - started:.0f}초 경과)")
+
+    def _run_with_progress(self, progress, value, desc, fn, *args, **kwargs):
+        """fn을 별도 스레드에서 실행하고 끝날 때까지 _wait_with_progress로 경과 시간 표시"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return self._wait_with_progress(executor.submit(fn, *args, **kwargs), progress, value, desc)
+
+    def _throttle_yield(self, min_interval=0.2):
+        """
+        로그 yield를 min_interval 간격으로 묶는 판정 함수 반환
+
+        슬라이드 완료처럼 짧은 간격으로 몰리는 로그는 버퍼에만 쌓아두고
+        마지막 yield 후 min_interval이 지났을 때만 화면으로 보냄 (force=True면 항상 True).
+        단계 경계의 yield는 이 판정 없이 그대로 보내 누락된 줄을 함께 내보냄
+        """
+        last_sent = [0.0]
+
+        def should_yield(force=False):
+            now = time.monotonic()
+            if force or now - last_sent[0] >= min_interval:
+                last_sent[0] = now
+                return True
+            return False
+
+        return should_yield
+
+    def _get_http_client(self):
+        """
+        공유 httpx.Client 반환 (호출하는 쪽에서 _clients_lock을 잡은 상태여야 함)
+
+        keep-alive 연결을 Claude/OpenAI 요청 전체가 재사용하고,
+        h2 패키지가 설치되어 있으면 HTTP/2로 같은 호스트 요청을 한 연결에 다중화
+        """
+        if self._http_client is None:
+            self._http_client = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                # SDK는 전달받은 http_client의 타임아웃을 그대로 쓰므로 SDK 기본값(600초)과 같은 읽기 타임아웃 유지
+                # (긴 오디오 Whisper 전사/전체 자막 교정 요청이 중간에 끊기지 않도록, 연결만 짧게 제한)
+                timeout=httpx.Timeout(600.0, connect=10.0)
+            )
+        return self._http_client
+
+    def _get_anthropic_client(self):
+        """공유 Anthropic 클라이언트 반환 (최초 호출 시 한 번만 생성)"""
+        with self._clients_lock:
+            if self._anthropic_client is None:
+                self._anthropic_client = anthropic.Anthropic(
+                    api_key=config.ANTHROPIC_API_KEY,
+                    http_client=self._get_http_client()
+                )
+            return self._anthropic_client
+
+    def _get_openai_client(self):
+        """공유 OpenAI 클라이언트 반환 (Whisper/맞춤법 교정용, 최초 호출 시 한 번만 생성)"""
+        with self._clients_lock:
+            if self._openai_client is None:
+                self._openai_client = OpenAI(
+                    api_key=config.OPENAI_API_KEY,
+                    http_client=self._get_http_client()
+                )
+            return self._openai_client
+
+    def _acquire_keyword_marker(self):
+        """OCR KeywordMarker 대여 (풀이 비어 있으면 새로 생성)"""
+        try:
+            return self._marker_pool.get_nowait()
+        except queue.Empty:
+            return KeywordMarker(use_ocr=True)
+
+    def _release_keyword_marker(self, marker):
+        """대여한 KeywordMarker 반납 (다음 슬라이드/다음 변환에서 재사용)"""
+        self._marker_pool.put(marker)
+
+    def _create_message(self, **kwargs):
+        """
+        Claude 메시지 생성 (공유 클라이언트 사용, 일시적 오류는 재시도)
+        """
+        client = self._get_anthropic_client()
+        return self._call_with_retry(lambda: client.messages.create(**kwargs))
+
+    def _stream_message_text(self, stop_marker=None, block_end=None, on_block=None, **kwargs):
+        """
+        Claude 응답을 스트리밍으로 받아 텍스트 반환 (공유 클라이언트 사용)
+
+        인자는 _stream_message와 같음 (종료 이유가 필요 없을 때 사용)
+        """
+        return self._stream_message(stop_marker, block_end, on_block, **kwargs)[0]
+
+    def _stream_message(self, stop_marker=None, block_end=None, on_block=None, **kwargs):
+        """
+        Claude 응답을 스트리밍으로 받아 (텍스트, 종료 이유) 반환 (공유 클라이언트 사용)
+
+        stop_marker가 나타나면 나머지 출력을 기다리지 않고 스트림을 닫음
+        (대본 응답은 </script>가 마지막 필수 태그이므로 이후 군더더기 생성 생략)
+
+        Args:
+            stop_marker: 이 문자열이 나오면 수신 중단 (None이면 끝까지 수신)
+            block_end: 응답 블록 끝 표시 (on_block과 함께 사용)
+            on_block: block_end가 나올 때마다 아직 전달하지 않은 완성된 블록 텍스트로 호출
+                      (응답 완료 전에 후속 처리를 시작하는 용도, 재시도 시 같은 블록이 다시 전달될 수 있음)
+
+        Returns:
+            (수신한 응답 텍스트, stop_reason) - stop_marker에서 끊었으면 stop_reason은 "stop_sequence",
+            출력 한도에 걸려 잘렸으면 "max_tokens"
+        """
+        client = self._get_anthropic_client()
+
+        def request():
+            chunks = []
+            tail = ""
+            pending = ""  # 마지막 block_end 이후 아직 전달하지 않은 텍스트
+            with client.messages.stream(**kwargs) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    if on_block is not None:
+                        pending += text
+                        end = pending.rfind(block_end)
+                        if end >= 0:
+                            end += len(block_end)
+                            on_block(pending[:end])
+                            pending = pending[end:]
+                    if stop_marker:
+                        # 청크 경계에 걸친 마커도 잡도록 직전 꼬리와 이어서 검사
+                        tail = tail[-(len(stop_marker) - 1):] + text
+                        if stop_marker in tail:
+                            stop_reason = "stop_sequence"
+                            break
+                else:
+                    stop_reason = stream.get_final_message().stop_reason
+            return "".join(chunks), stop_reason
+
+        return self._call_with_retry(request)
+
+    def _call_with_retry(self, request):
+        """
+        Claude 요청 실행
+
+        속도 제한/타임아웃/일시적 서버 오류는 지수 백오프(2^n초 + 지터)로
+        config.LLM_MAX_RETRIES회까지 재시도, 그 외 오류는 바로 전달.
+        요청 실행 중에만 전역 세마포어를 잡고 (대기 중에는 반납) 429 응답의 retry-after가 있으면 그만큼 기다림
+        """
+
+        retryable = (
+            anthropic.RateLimitError,
+            anthropic.APITimeoutError,
+            anthropic.APIConnectionError,
+            anthropic.InternalServerError,
+        )
+        for attempt in range(config.LLM_MAX_RETRIES + 1):
+            try:
+                with self._llm_semaphore:
+                    return request()
+            except retryable as e:
+                if attempt == config.LLM_MAX_RETRIES:
+                    raise
+                delay = 2 ** attempt + random.random()
+                response = getattr(e, "response", None)
+                retry_after = response.headers.get("retry-after") if response is not None else None
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                print(f"⚠️  Claude 요청 재시도 {attempt + 1}/{config.LLM_MAX_RETRIES} ({type(e).__name__}) → {delay:.1f}초 후")
+                time.sleep(delay)
+
+    def _encode_image(self, image_path):
+        """
+        슬라이드 이미지를 base64 문자열로 반환 (경로+수정 시각 기준 캐시)
+
+        Args:
+            image_path: PNG 이미지 경로
+
+        Returns:
+            base64 인코딩 문자열 (Claude 이미지 블록의 source.data 값)
+        """
+        image_path = Path(image_path)
+        mtime = image_path.stat().st_mtime_ns
+        cached = self._image_b64_cache.get(image_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        encoded = base64.b64encode(image_path.read_bytes()).decode("ascii")
+        self._image_b64_cache[image_path] = (mtime, encoded)
+        return encoded
+
+    def _cached_llm_text(self, kind, request, fetch):
+        """
+        Claude 응답 텍스트 디스크 캐시
+
+        같은 PPT를 음성/해상도만 바꿔 다시 변환할 때 맥락 분석과 대본 생성 요청을 다시 보내지 않도록,
+        요청 내용 전체(모델, 프롬프트, 파라미터)의 blake2b 해시를 키로 응답 텍스트를 저장
+        (이미지 base64가 포함된 큰 프롬프트도 빠르게 해시하도록 sha256 대신 blake2b 사용)
+
+        Args:
+            kind: 캐시 하위 디렉토리 이름 ("context", "script" 등)
+            request: 요청 파라미터 dict (키 계산용, JSON 직렬화 가능해야 함)
+            fetch: 캐시가 없을 때 (응답 텍스트, stop_reason)을 받아오는 함수
+                   (출력 한도에 걸려 잘린 응답("max_tokens")은 이번 실행에만 쓰고 캐시에 저장하지 않음)
+
+        Returns:
+            (응답 텍스트, 캐시 적중 여부)
+        """
+        key = hashlib.blake2b(
+            json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8"),
+            digest_size=32
+        ).hexdigest()
+        cache_path = config.LLM_CACHE_DIR / kind / f"{key}.json"
+
+        # 같은 프로세스에서 반복 실행하면 디스크를 읽지 않고 메모리 LRU에서 바로 반환
+        memo_key = (kind, key)
+        with self._llm_memo_lock:
+            text = self._llm_memo.get(memo_key)
+            if text is not None:
+                self._llm_memo.move_to_end(memo_key)
+                return text, True
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                text = json.load(f)["text"]
+            self._remember_llm_text(memo_key, text)
+            return text, True
+        except (OSError, ValueError, KeyError):
+            pass
+
+        text, stop_reason = fetch()
+        if stop_reason == "max_tokens":
+            return text, False
+        self._remember_llm_text(memo_key, text)
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"text": text}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+        return text, False
+
+    def _remember_llm_text(self, memo_key, text):
+        """Claude 응답 텍스트를 메모리 LRU에 저장 (config.LLM_MEMO_SIZE개 초과 시 오래된 것부터 제거)"""
+        with self._llm_memo_lock:
+            self._llm_memo[memo_key] = text
+            self._llm_memo.move_to_end(memo_key)
+            while len(self._llm_memo) > config.LLM_MEMO_SIZE:
+                self._llm_memo.popitem(last=False)
+
+    def _get_tts_client(self, voice):
+        """음성별 TTSClient 반환 (음성마다 한 번만 생성해 재사용)"""
+        with self._clients_lock:
+            tts = self._tts_clients.get(voice)
+            if tts is None:
+                tts = TTSClient(
+                    provider=config.TTS_PROVIDER,
+                    api_key=config.OPENAI_API_KEY,
+                    voice=voice,
+                    http_client=self._get_http_client(),
+                    cache_dir=config.TTS_CACHE_DIR,
+                    cache_max_mb=config.TTS_CACHE_MAX_MB,
+                    max_inflight=config.TTS_MAX_INFLIGHT
+                )
+                self._tts_clients[voice] = tts
+            return tts
+
+    def render_log(self, log_lines, full=False):
+        """
+        리스트 로그 버퍼를 화면 표시용 문자열로 변환 (yield 시점에만 한 번 join)
+
+        yield마다 로그 전체를 보내면 긴 작업에서 웹소켓 전송량이 줄 수의 제곱으로 늘어나므로
+        진행 중에는 최근 config.UI_LOG_TAIL_LINES줄만 보냄.
+        마지막(완료/오류/중단) yield와 상위 로그에 합쳐지는 하위 로그는 full=True로 전체를 보냄.
+        """
+        return render_log_lines(log_lines, 0 if full else config.UI_LOG_TAIL_LINES)
+
     def parse_arrow_pointers(self, custom_request):
         """
         사용자 요청에서 [숫자] 마커를 파싱하여 화살표 포인터 정보 추출
@@ -65,17 +829,15 @@ class GradioUI:
         Returns:
             list: [{"marker": "[1]", "keyword": "키워드1"}, ...]
         """
-        import re
-
-        if not custom_request:
+        # 마커 문자가 없으면 (대부분의 요청) 정규식을 돌리지 않고 바로 반환
+        if not custom_request or not ('[' in custom_request or '★' in custom_request or '☆' in custom_request):
             return []
 
         arrow_pointers = []
 
         # [숫자] 패턴 찾기 (권장): "[1] 키워드" 또는 "[1]키워드"
         # [1] ~ [99]까지 지원
-        bracket_pattern = r'\[(\d{1,2})\]\s*([^\n,\[\]]+)'
-        bracket_matches = re.findall(bracket_pattern, custom_request)
+        bracket_matches = _ARROW_BRACKET_RE.findall(custom_request)
 
         for num, keyword in bracket_matches:
             keyword = keyword.strip()
@@ -87,8 +849,7 @@ class GradioUI:
 
         # ★숫자 패턴 (하위 호환성): "★1 키워드"
         if not arrow_pointers:
-            star_pattern = r'[★☆](\d{1,2})\s*([^\n,★☆]+)'
-            star_matches = re.findall(star_pattern, custom_request)
+            star_matches = _ARROW_STAR_RE.findall(custom_request)
 
             for num, keyword in star_matches:
                 keyword = keyword.strip()
@@ -145,13 +906,15 @@ class GradioUI:
             # Gradio file object에서 경로 추출
             file_path = pptx_file.name if hasattr(pptx_file, 'name') else pptx_file
 
-            prs = Presentation(file_path)
-            return len(prs.slides)
+            # 같은 파일은 다시 파싱하지 않도록 (경로, 수정시각, 크기)로 캐시
+            stat = os.stat(file_path)
+            return _count_slides_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             print(f"슬라이드 카운트 실패: {e}")
             return 0
 
-    def calculate_duration_range(self, slide_count):
+    @staticmethod
+    def calculate_duration_range(slide_count):
         """
         슬라이드 개수에 따른 적정 영상 길이 범위 계산
 
@@ -199,72 +962,41 @@ class GradioUI:
             value: 기본 선택값
             info_message: 사용자에게 보여줄 정보 메시지
         """
-        if slide_count == 0:
-            return ["1", "3", "5", "10", "15", "20"], "5", "PPT를 업로드하면 적정 시간을 추천해드립니다"
-
-        min_min, max_min, recommended_min = self.calculate_duration_range(slide_count)
-
-        # 모든 가능한 옵션
-        all_options = [1, 3, 5, 10, 15, 20]
+        choices, value, info_message = _available_durations(slide_count)
+        return list(choices), value, info_message
 
-        # 범위 내의 옵션만 선택
-        available = [str(m) for m in all_options if min_min <= m <= max_min]
-
-        # 선택 가능한 옵션이 없으면 범위 확장
-        if not available:
-            if max_min < 1:
-                available = ["1"]
-            elif min_min > 20:
-                available = ["20"]
-            else:
-                available = [str(min_min)] if min_min not in all_options else [str(min(all_options, key=lambda x: abs(x - min_min)))]
-
-        # 기본값: 권장 시간과 가장 가까운 옵션
-        default_value = min(available, key=lambda x: abs(int(x) - recommended_min))
+    def check_dependencies(self):
+        """시스템 의존성 체크 (시작 시 계산해 둔 결과 반환)"""
+        return list(self._deps_issues)
 
-        # 정보 메시지
-        info_message = (
-            f"📊 슬라이드 {slide_count}장 분석 완료\n"
-            f"적정 범위: {min_min}~{max_min}분\n"
-            f"권장: {recommended_min}분"
-        )
+    def refresh_dependencies(self):
+        """세션 중 FFmpeg/LibreOffice를 설치한 경우 의존성 체크를 다시 수행"""
+        self._deps_issues = self._compute_dependencies()
+        return list(self._deps_issues)
 
-        return available, default_value, info_message
+    def _compute_dependencies(self):
+        """
+        시스템 의존성 체크 (프로세스 실행 없이 PATH 검색만 사용)
 
-    def check_dependencies(self):
-        """시스템 의존성 체크"""
+        Returns:
+            문제 메시지 리스트 (없으면 빈 리스트)
+        """
         issues = []
 
         # FFmpeg 체크
-        try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode != 0:
-                issues.append("❌ FFmpeg가 설치되지 않았습니다")
-        except Exception:
+        if shutil.which("ffmpeg") is None:
             issues.append("❌ FFmpeg가 설치되지 않았습니다")
 
         # LibreOffice 체크
         try:
-            # Windows
-            if os.name == 'nt':
+            found = shutil.which("libreoffice") is not None or shutil.which("soffice") is not None
+            # Windows는 기본 설치 경로가 PATH에 없는 경우가 많음
+            if not found and os.name == 'nt':
                 libreoffice_paths = [
                     r"C:\Program Files\LibreOffice\program\soffice.exe",
                     r"C:\Program Files (x86)\LibreOffice\program\soffice.exe"
                 ]
                 found = any(Path(p).exists() for p in libreoffice_paths)
-            else:
-                # Linux/Mac
-                result = subprocess.run(
-                    ["which", "libreoffice"],
-                    capture_output=True,
-                    text=True
-                )
-                found = result.returncode == 0
 
             if not found:
                 issues.append("⚠️  LibreOffice가 설치되지 않았습니다 (PPT → 이미지 변환 불가)")
@@ -284,37 +1016,33 @@ class GradioUI:
         1단계: PPT 전체 맥락 분석
         Claude가 전체 프레젠테이션을 먼저 이해
         """
-        log_output = ""
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
 
-        log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-        log_output = self.log("🧠 1단계: PPT 전체 맥락 분석", log_output)
-        log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-        log_output = self.log("", log_output)
+        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+        self.log("🧠 1단계: PPT 전체 맥락 분석", log_lines)
+        self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+        self.log("", log_lines)
 
         # 전체 슬라이드 제목 수집
         titles = [s.get('title', f'슬라이드 {s["index"]}') for s in slides]
-        log_output = self.log(f"📊 총 {len(slides)}개 슬라이드 발견:", log_output)
+        self.log(f"📊 총 {len(slides)}개 슬라이드 발견:", log_lines)
         for i, title in enumerate(titles, 1):
-            log_output = self.log(f"  {i}. {title}", log_output)
-        log_output = self.log("", log_output)
+            self.log(f"  {i}. {title}", log_lines)
+        self.log("", log_lines)
 
         # Claude에게 전체 맥락 분석 요청
-        log_output = self.log("🤔 Claude가 전체 프레젠테이션을 분석하고 있습니다...", log_output)
-        log_output = self.log("", log_output)
+        self.log("🤔 Claude가 전체 프레젠테이션을 분석하고 있습니다...", log_lines)
+        self.log("", log_lines)
 
         try:
-            from anthropic import Anthropic
-            client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
-
             # 전체 맥락 분석 프롬프트
             # Python 3.12+ 호환성: f-string 내부에 백슬래시 사용 불가
             newline = '\n'
-            titles_str = newline.join(f'{i+1}. {titles[i]}' for i in range(len(titles)))
-            slides_details = []
-            for s in slides[:5]:
-                slide_body = s.get("body", "")[:200]
-                slides_details.append(f'슬라이드 {s["index"]}: {s.get("title", "")}{newline}{slide_body}...')
-            slides_str = newline.join(slides_details)
+            titles_str = newline.join(f'{i}. {title}' for i, title in enumerate(titles, 1))
+            slides_str = newline.join(
+                f'슬라이드 {s["index"]}: {s.get("title") or ""}{newline}{_preview(s.get("body") or "", 200)}'
+                for s in slides[:5]
+            )
 
             context_prompt = f"""다음은 프레젠테이션의 모든 슬라이드입니다.
 
@@ -331,32 +1059,427 @@ class GradioUI:
 
 간단명료하게 답변해주세요."""
 
-            message = client.messages.create(
-                model=config.DEFAULT_LLM_MODEL,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": context_prompt}]
+            request = {
+                "model": config.DEFAULT_LLM_MODEL,
+                "max_tokens": 1024,
+                "messages": [{"role": "user", "content": context_prompt}]
+            }
+            def fetch_context():
+                message = self._create_message(**request)
+                return message.content[0].text.strip(), message.stop_reason
+
+            context_analysis, cache_hit = self._cached_llm_text("context", request, fetch_context)
+            if cache_hit:
+                self.log("♻️  이전 분석 결과 재사용 (같은 슬라이드 내용)", log_lines)
+
+            self.log("💡 Claude의 분석 결과:", log_lines)
+            self.log("─" * 60, log_lines)
+            for line in context_analysis.split('\n'):
+                self.log(f"  {line}", log_lines)
+            self.log("─" * 60, log_lines)
+            self.log("", log_lines)
+
+            return context_analysis, self.render_log(log_lines, full=True)
+
+        except Exception as e:
+            self.log(f"⚠️  맥락 분석 실패: {str(e)}", log_lines)
+            self.log("→ 기본 맥락으로 진행합니다", log_lines)
+            self.log("", log_lines)
+            return "", self.render_log(log_lines, full=True)
+
+    def _script_intro_instruction(self, slide_num, total_slides):
+        """슬라이드 위치(첫 슬라이드 여부)에 따른 강사 역할 안내문"""
+        if slide_num == 1:
+            return _SCRIPT_INTRO_FIRST
+        return _SCRIPT_INTRO_NEXT.format(slide_num=slide_num, total_slides=total_slides)
+
+    def _script_guidelines(self, target_duration):
+        """대본 작성 규칙 + 출력 형식(<thinking>/<keywords>/<highlight>/<script>) 안내문"""
+        return _render_script_guidelines(target_duration)
+
+    def _build_script_prompt(self, slide, context, slide_num, total_slides, target_duration, custom_request=""):
+        """
+        슬라이드 하나에 대한 대본 생성 프롬프트 구성
+
+        모든 슬라이드에 공통인 맥락/요청사항/작성 규칙을 앞 블록에 두고 프롬프트 캐시 지점으로 표시해,
+        두 번째 슬라이드부터는 슬라이드별 블록만 새로 처리되도록 함
+
+        Returns:
+            messages content 블록 리스트 [공통 블록(cache_control), 슬라이드별 블록]
+        """
+        shared = f"""【전체 프레젠테이션 맥락】
+{context}
+
+{f'''⚠️ 【사용자 요청사항 - 반드시 준수】 ⚠️
+다음 요청사항을 대본 작성 시 **최우선으로 반영**하세요:
+
+"{custom_request}"
+
+위 요청사항에 맞춰 설명 스타일, 어휘 수준, 강조점을 조정하세요.
+''' if custom_request and custom_request.strip() else ''}{self._get_arrow_keywords_instruction(custom_request)}
+{self._script_guidelines(target_duration)}"""
+
+        intro_instruction = self._script_intro_instruction(slide_num, total_slides)
+        notes = slide.get('notes') or ''
+        per_slide = f"""{intro_instruction}
+
+【이 슬라이드 정보】
+제목: {slide.get('title') or ''}
+본문:
+{slide.get('body') or ''}
+{f"발표자 노트: {notes}" if notes else ''}
+
+위 【전체 프레젠테이션 맥락】과 작성 규칙, 출력 형식에 맞춰 이 슬라이드의 대본을 작성하세요."""
+
+        return [
+            {"type": "text", "text": shared, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": per_slide},
+        ]
+
+    def _build_batch_script_prompt(self, numbered_slides, context, total_slides, target_duration, custom_request=""):
+        """
+        여러 슬라이드를 한 번에 요청하는 대본 생성 프롬프트 구성
+
+        Args:
+            numbered_slides: [(슬라이드 번호(1부터), 슬라이드 dict), ...]
+
+        Returns:
+            messages content 블록 리스트 [공통 블록(cache_control), 배치별 블록]
+        """
+        newline = '\n'
+        slide_blocks = []
+        for slide_num, slide in numbered_slides:
+            notes = slide.get('notes') or ''
+            notes_line = f"{newline}발표자 노트: {notes}" if notes else ''
+            slide_blocks.append(
+                f'<slide idx="{slide_num}">{newline}'
+                f"제목: {slide.get('title') or ''}{newline}"
+                f"본문:{newline}{slide.get('body') or ''}{notes_line}{newline}"
+                f'</slide>'
+            )
+        slide_nums = [slide_num for slide_num, _ in numbered_slides]
+        first_slide_rule = (
+            "1번 슬라이드는 간단한 인사말로 시작하고 바로 주제로 들어가세요 (자기소개 금지)."
+            if 1 in slide_nums else ""
+        )
+
+        # 여러 배치 요청에 공통인 맥락/요청사항/작성 규칙은 앞 블록에 두고 프롬프트 캐시 지점으로 표시
+        shared = f"""【전체 프레젠테이션 맥락】
+{context}
+
+{f'''⚠️ 【사용자 요청사항 - 반드시 준수】 ⚠️
+다음 요청사항을 대본 작성 시 **최우선으로 반영**하세요:
+
+"{custom_request}"
+
+위 요청사항에 맞춰 설명 스타일, 어휘 수준, 강조점을 조정하세요.
+''' if custom_request and custom_request.strip() else ''}{self._get_arrow_keywords_instruction(custom_request)}
+{self._script_guidelines(target_duration)}
+
+【배치 출력 형식】
+위 형식(<thinking>, <keywords>, <highlight>, <script>)을 **슬라이드마다 각각** 작성하고,
+각 슬라이드의 결과 전체를 <slide_out idx="슬라이드 번호"> ... </slide_out> 로 감싸 순서대로 출력하세요."""
+
+        per_batch = f"""당신은 학생들을 가르치는 친절한 **강사**입니다.
+아래 슬라이드들(총 {total_slides}개 중 {slide_nums[0]}~{slide_nums[-1]}번)을 순서대로 보면서 학생들에게 내용을 **가르쳐주세요**.
+단순히 텍스트를 읽는 것이 아니라, 강의실에서 학생들 앞에 서서
+자연스럽게 설명하듯이 말해야 합니다.
+{first_slide_rule}
+1번이 아닌 슬라이드는 이전 슬라이드에서 이어지는 내용이므로 인사말 없이 "다음으로~", "이어서~" 같은 연결 표현을 사용하세요.
+
+【슬라이드 정보】
+{newline.join(slide_blocks)}
+
+위 【전체 프레젠테이션 맥락】과 작성 규칙, 배치 출력 형식에 맞춰 각 슬라이드의 대본을 작성하세요."""
+
+        return [
+            {"type": "text", "text": shared, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": per_batch},
+        ]
+
+    def _pick_script_model(self, slide):
+        """
+        슬라이드 대본 생성 모델 선택
+
+        제목/본문/노트를 합친 텍스트가 LLM_FAST_MODEL_MAX_CHARS보다 짧은 슬라이드(표지, 이미지 위주 등)는
+        빠른 모델로, 나머지는 기본 모델로 생성 (슬라이드 이미지를 함께 보내는 경우는 항상 기본 모델)
+        """
+        if config.LLM_FAST_MODEL_MAX_CHARS <= 0 or config.LLM_SEND_SLIDE_IMAGE:
+            return config.DEFAULT_LLM_MODEL
+        text_len = sum(len(slide.get(field) or "") for field in ("title", "body", "notes"))
+        if text_len < config.LLM_FAST_MODEL_MAX_CHARS:
+            return config.LLM_FAST_MODEL
+        return config.DEFAULT_LLM_MODEL
+
+    def submit_message_batch(self, numbered_slides, context, total_slides, target_duration, custom_request=""):
+        """
+        슬라이드별 대본 요청을 Message Batches API로 한 번에 제출
+
+        Args:
+            numbered_slides: [(슬라이드 번호(1부터), 슬라이드 dict), ...]
+            context: 전체 맥락 분석 결과
+            total_slides: 전체 슬라이드 수
+            target_duration: 슬라이드당 목표 시간 (초)
+            custom_request: 사용자 요청사항
+
+        Returns:
+            배치 ID (messages.batches.retrieve로 진행 상황 확인)
+        """
+        client = self._get_anthropic_client()
+        requests = [
+            {
+                "custom_id": f"slide_{slide_num}",
+                "params": {
+                    "model": self._pick_script_model(slide),
+                    "max_tokens": _script_max_tokens(target_duration),
+                    "temperature": config.LLM_TEMPERATURE,
+                    "messages": [{
+                        "role": "user",
+                        "content": self._build_script_prompt(
+                            slide, context, slide_num, total_slides, target_duration, custom_request
+                        )
+                    }]
+                }
+            }
+            for slide_num, slide in numbered_slides
+        ]
+        batch = self._call_with_retry(lambda: client.messages.batches.create(requests=requests))
+        return batch.id
+
+    def collect_message_batch(self, batch_id):
+        """
+        완료된 Message Batch 결과 수집
+
+        Returns:
+            {슬라이드 번호: 응답 텍스트} (실패/만료된 요청은 포함되지 않음)
+        """
+        client = self._get_anthropic_client()
+        responses = {}
+        for entry in client.messages.batches.results(batch_id):
+            if entry.result.type != "succeeded":
+                continue
+            # 토큰 한도에서 잘린 대본은 버림 (해당 슬라이드는 단건 요청으로 다시 생성)
+            if entry.result.message.stop_reason == "max_tokens":
+                continue
+            slide_num = int(entry.custom_id[len("slide_"):])
+            responses[slide_num] = entry.result.message.content[0].text.strip()
+        return responses
+
+    def _run_message_batch(self, slides, context, target_duration, custom_request, progress, log_lines, responses):
+        """
+        전체 슬라이드를 Message Batches API로 제출하고 완료될 때까지 폴링 (config.LLM_USE_BATCH_API)
+
+        로그가 바뀔 때마다 yield하므로 호출하는 핸들러는 그때마다 화면을 갱신하면 됨.
+        실패/시간 초과 시에는 responses를 비워둔 채 끝나고, 호출 측은 일반 요청으로 진행.
+
+        Args:
+            slides: 슬라이드 리스트
+            context: 전체 맥락 분석 결과
+            target_duration: 슬라이드당 목표 시간 (초)
+            custom_request: 사용자 요청사항
+            progress: Gradio 진행 표시
+            log_lines: 로그 버퍼
+            responses: 결과를 채울 dict ({슬라이드 번호: 응답 텍스트})
+        """
+        try:
+            batch_id = self.submit_message_batch(
+                list(enumerate(slides, 1)), context, len(slides), target_duration, custom_request
+            )
+            self.log(f"📦 Message Batches API 제출: {batch_id} ({len(slides)}개 슬라이드)", log_lines)
+            yield
+
+            deadline = time.monotonic() + config.LLM_BATCH_API_TIMEOUT
+            last_done = -1
+            while True:
+                batch = self._get_anthropic_client().messages.batches.retrieve(batch_id)
+                if batch.processing_status == "ended":
+                    break
+                if time.monotonic() > deadline:
+                    self._get_anthropic_client().messages.batches.cancel(batch_id)
+                    raise TimeoutError(f"{config.LLM_BATCH_API_TIMEOUT}초 안에 배치가 끝나지 않음")
+
+                counts = batch.request_counts
+                done = counts.succeeded + counts.errored + counts.canceled + counts.expired
+                if done != last_done:
+                    last_done = done
+                    progress(0.2 + 0.2 * done / len(slides), desc=f"배치 대본 생성 대기 중... ({done}/{len(slides)})")
+                    self.log(f"  ⏳ 배치 처리 중: {done}/{len(slides)}개 완료", log_lines)
+                    yield
+                time.sleep(config.LLM_BATCH_API_POLL_INTERVAL)
+
+            responses.update(self.collect_message_batch(batch_id))
+            self.log(f"  ✓ 배치 결과 수신: {len(responses)}/{len(slides)}개", log_lines)
+        except Exception as e:
+            self.log(f"  ⚠️ Message Batches API 실패: {e} → 일반 요청으로 진행", log_lines)
+        self.log("", log_lines)
+        yield
+
+    def generate_scripts_batch(self, numbered_slides, context, total_slides, target_duration, custom_request="",
+                               on_slide=None):
+        """
+        여러 슬라이드의 대본을 Claude 요청 한 번으로 생성 (스트리밍 수신)
+
+        Args:
+            numbered_slides: [(슬라이드 번호(1부터), 슬라이드 dict), ...]
+            context: 전체 맥락 분석 결과
+            total_slides: 전체 슬라이드 수
+            target_duration: 슬라이드당 목표 시간 (초)
+            custom_request: 사용자 요청사항
+            on_slide: 슬라이드 블록(</slide_out>)이 끝날 때마다 (슬라이드 번호, 응답 블록 텍스트)로 호출
+                      (전체 응답을 기다리지 않고 앞 슬라이드의 후속 처리를 시작하는 용도)
+
+        Returns:
+            {슬라이드 번호: 응답 블록 텍스트} (응답에서 누락된 슬라이드는 포함되지 않음)
+        """
+        prompt = self._build_batch_script_prompt(
+            numbered_slides, context, total_slides, target_duration, custom_request
+        )
+        requested = {slide_num for slide_num, _ in numbered_slides}
+
+        def deliver(block_text):
+            for match in _SLIDE_OUT_RE.finditer(block_text):
+                if int(match.group(1)) in requested:
+                    on_slide(int(match.group(1)), match.group(2).strip())
+
+        response_text = self._stream_message_text(
+            block_end="</slide_out>",
+            on_block=deliver if on_slide is not None else None,
+            model=config.DEFAULT_LLM_MODEL,
+            # 슬라이드당 단건 요청과 같은 출력 여유를 주되 모델 출력 한도 내로 제한
+            max_tokens=min(_script_max_tokens(target_duration) * len(numbered_slides), 8192),
+            temperature=config.LLM_TEMPERATURE,
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        return {
+            int(match.group(1)): match.group(2).strip()
+            for match in _SLIDE_OUT_RE.finditer(response_text)
+            if int(match.group(1)) in requested
+        }
+
+    def _run_script_batch(self, numbered_slides, slots, context, total_slides, target_duration, custom_request=""):
+        """
+        배치 대본 요청을 실행하며 슬라이드별 응답으로 slots의 Future를 완료 (스레드에서 실행)
+
+        응답 스트림에서 슬라이드 블록이 끝나는 즉시 해당 Future를 완료해 그 슬라이드의 키워드 마킹/TTS가
+        배치의 나머지 슬라이드를 기다리지 않고 시작되게 함.
+        응답에서 빠졌거나 요청이 실패한 슬라이드는 None으로 완료 (개별 요청으로 다시 생성)
+
+        Args:
+            numbered_slides: [(슬라이드 번호(1부터), 슬라이드 dict), ...]
+            slots: {슬라이드 번호: Future}
+        """
+        def fill(slide_num, text):
+            # 재시도로 같은 블록이 다시 와도 처음 받은 응답을 유지 (이 배치 스레드만 채우므로 잠금 불필요)
+            if not slots[slide_num].done():
+                slots[slide_num].set_result(text)
+
+        batch_range = f"{numbered_slides[0][0]}~{numbered_slides[-1][0]}"
+        try:
+            responses = self.generate_scripts_batch(
+                numbered_slides, context, total_slides, target_duration, custom_request, on_slide=fill
+            )
+            for slide_num, text in responses.items():
+                fill(slide_num, text)
+            print(f"  ✓ 슬라이드 {batch_range} 배치 응답 수신 ({len(responses)}/{len(numbered_slides)}개)")
+        except Exception as e:
+            print(f"  ⚠️ 슬라이드 {batch_range} 배치 요청 실패: {e} → 개별 요청으로 진행")
+        finally:
+            for slide_num in slots:
+                fill(slide_num, None)
+
+    def _submit_script_batches(self, slides, context, target_duration, custom_request, log_lines):
+        """
+        config.LLM_SLIDES_PER_REQUEST개씩 묶은 배치 대본 요청을 백그라운드에서 시작
+
+        배치 요청은 기다리지 않고 바로 다음 단계로 넘어감: 응답 스트림에서 슬라이드 블록이 끝나는 대로
+        해당 슬라이드 Future가 완료되어 후속 처리(키워드 마킹/TTS)가 배치 전체를 기다리지 않고 시작됨
+
+        Args:
+            slides: 슬라이드 리스트
+            context: 전체 맥락 분석 결과
+            target_duration: 슬라이드당 목표 시간 (초)
+            custom_request: 사용자 요청사항
+            log_lines: 로그 버퍼
+
+        Returns:
+            {슬라이드 번호: Future(응답 블록 텍스트 또는 None)} (배치를 쓰지 않으면 빈 dict)
+        """
+        batch_size = config.LLM_SLIDES_PER_REQUEST
+        if batch_size <= 1 or len(slides) <= 1:
+            return {}
+
+        numbered_slides = list(enumerate(slides, 1))
+        batches = [numbered_slides[k:k + batch_size] for k in range(0, len(numbered_slides), batch_size)]
+        self.log(f"📦 배치 대본 생성: {len(batches)}개 요청 (요청당 최대 {batch_size}개 슬라이드, 슬라이드별 응답 도착 즉시 처리)", log_lines)
+        self.log("", log_lines)
+
+        streamed_responses = {}
+        batch_executor = ThreadPoolExecutor(max_workers=min(config.LLM_CONCURRENCY, len(batches)))
+        for batch in batches:
+            slots = {slide_num: Future() for slide_num, _ in batch}
+            streamed_responses.update(slots)
+            batch_executor.submit(
+                self._run_script_batch, batch, slots,
+                context, len(slides), target_duration, custom_request
             )
+        batch_executor.shutdown(wait=False)
+        return streamed_responses
 
-            context_analysis = message.content[0].text.strip()
+    def _submit_slide_ocr(self, slides, needs_ocr, log_lines):
+        """
+        슬라이드 OCR을 프로세스 풀에서 미리 시작
 
-            log_output = self.log("💡 Claude의 분석 결과:", log_output)
-            log_output = self.log("─" * 60, log_output)
-            for line in context_analysis.split('\n'):
-                log_output = self.log(f"  {line}", log_output)
-            log_output = self.log("─" * 60, log_output)
-            log_output = self.log("", log_output)
+        OCR은 CPU 작업이라 스레드 대신 프로세스에서 돌리고, Claude 요청(I/O 대기)과 동시에 진행해
+        각 슬라이드 처리 시 결과만 받아 사용 (config.OCR_WORKERS가 1이면 풀을 쓰지 않음)
 
-            return context_analysis, log_output
+        Args:
+            slides: 슬라이드 리스트
+            needs_ocr: OCR이 필요한지 여부 (키워드 마킹/화살표 포인터)
+            log_lines: 로그 버퍼
 
-        except Exception as e:
-            log_output = self.log(f"⚠️  맥락 분석 실패: {str(e)}", log_output)
-            log_output = self.log("→ 기본 맥락으로 진행합니다", log_output)
-            log_output = self.log("", log_output)
-            return "", log_output
+        Returns:
+            (프로세스 풀 또는 None, {슬라이드 인덱스(0부터): Future})
+        """
+        if not needs_ocr or config.OCR_WORKERS <= 1:
+            return None, {}
+
+        slide_images = {
+            i: config.SLIDES_IMG_DIR / f"slide_{slide['index']:03d}.png"
+            for i, slide in enumerate(slides)
+        }
+        slide_images = {i: path for i, path in slide_images.items() if path.exists()}
+        if not slide_images:
+            return None, {}
+
+        ocr_processes = min(config.OCR_WORKERS, len(slide_images))
+        # Gradio/torch 스레드가 도는 프로세스를 fork하면 잠금 상태가 복제되어 워커가 멈출 수 있으므로 spawn 사용
+        ocr_executor = ProcessPoolExecutor(
+            max_workers=ocr_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_ocr_worker
+        )
+        ocr_futures = {i: ocr_executor.submit(ocr_worker, str(path)) for i, path in slide_images.items()}
+        self.log(f"🔍 슬라이드 OCR 병렬 시작 (프로세스: {ocr_processes}개)", log_lines)
+        return ocr_executor, ocr_futures
+
+    @staticmethod
+    def _shutdown_slide_ocr(ocr_executor, ocr_futures):
+        """
+        슬라이드 OCR 프로세스 풀 종료
+
+        오류로 중단된 경우에도 아직 시작하지 않은 OCR 작업은 취소하고 워커 프로세스(각각 OCR 모델 보유)를 정리
+        (Python 3.8 호환을 위해 shutdown(cancel_futures=True) 대신 직접 취소)
+        """
+        if ocr_executor is None:
+            return
+        for future in ocr_futures.values():
+            future.cancel()
+        ocr_executor.shutdown()
 
     def generate_script_with_thinking(self, slide, context, slide_num, total_slides, target_duration, progress, log_output,
                                      custom_request="", slide_image_path=None, pdf_path=None, page_num=None, enable_keyword_marking=True, keyword_mark_style="circle",
-                                     keyword_marker=None):
+                                     keyword_marker=None, response_text=None, ocr_boxes=None):
         """
         개별 슬라이드 대본 생성 (사고 과정 포함)
 
@@ -366,233 +1489,139 @@ class GradioUI:
             pdf_path: PDF 파일 경로 (PDF인 경우)
             page_num: 페이지 번호 (0부터 시작)
             enable_keyword_marking: 키워드 마킹 활성화 여부
-            keyword_marker: KeywordMarker 인스턴스 (재사용용, None이면 새로 생성)
+            keyword_marker: KeywordMarker 인스턴스 (None이면 필요할 때 공용 풀에서 대여, 스레드당 하나씩 사용)
+            response_text: 배치 요청으로 미리 받은 Claude 응답 (있으면 API 호출 생략)
+            ocr_boxes: 미리 계산한 슬라이드 OCR 결과 (있으면 OCR 생략)
         """
-        from anthropic import Anthropic
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
+        # 자주 쓰는 슬라이드 필드는 한 번만 꺼내 둠
+        title = slide.get('title') or ''
+        body = slide.get('body') or ''
 
-        log_output = self.log(f"━━━ 슬라이드 {slide_num}/{total_slides}: {slide.get('title', '제목 없음')} ━━━", log_output)
-        log_output = self.log("", log_output)
+        self.log(f"━━━ 슬라이드 {slide_num}/{total_slides}: {title or '제목 없음'} ━━━", log_lines)
+        self.log("", log_lines)
 
         # 슬라이드 내용 표시
-        log_output = self.log("📄 슬라이드 내용:", log_output)
-        log_output = self.log(f"  제목: {slide.get('title', '')}", log_output)
-        body_preview = slide.get('body', '')[:150]
-        log_output = self.log(f"  본문: {body_preview}...", log_output)
-        log_output = self.log(f"  목표 시간: {target_duration}초", log_output)
-        log_output = self.log("", log_output)
+        self.log("📄 슬라이드 내용:", log_lines)
+        self.log(f"  제목: {title}", log_lines)
+        self.log(f"  본문: {_preview(body, 150)}", log_lines)
+        self.log(f"  목표 시간: {target_duration}초", log_lines)
+        self.log("", log_lines)
 
         # Claude에게 슬라이드 분석 요청
-        log_output = self.log("🤔 Claude가 이 슬라이드를 분석하고 있습니다...", log_output)
+        self.log("🤔 Claude가 이 슬라이드를 분석하고 있습니다...", log_lines)
 
         try:
-            client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
-
-            # 슬라이드 위치에 따른 프롬프트 조정
-            if slide_num == 1:
-                intro_instruction = """당신은 학생들을 가르치는 친절한 **강사**입니다.
-다음 슬라이드를 보면서 학생들에게 내용을 **가르쳐주세요**.
-단순히 텍스트를 읽는 것이 아니라, 강의실에서 학생들 앞에 서서
-자연스럽게 설명하듯이 말해야 합니다.
-
-**이것은 프레젠테이션의 첫 번째 슬라이드입니다.**
-간단한 인사말로 시작하고 바로 주제로 들어가세요.
-
-⚠️  **절대 금지 사항**:
-- ❌ "저는 교수 ○○○입니다", "제 이름은..." 같은 자기소개 금지
-- ❌ "이번 학기 이 과목을 가르칠..." 같은 역할 소개 금지
-- ✅ "안녕하세요, 오늘은 [주제]에 대해 알아보겠습니다" 식으로 바로 내용 시작"""
-            else:
-                intro_instruction = f"""당신은 학생들을 가르치는 친절한 **강사**입니다.
-다음 슬라이드를 보면서 학생들에게 내용을 **가르쳐주세요**.
-단순히 텍스트를 읽는 것이 아니라, 강의실에서 학생들 앞에 서서
-자연스럽게 설명하듯이 말해야 합니다.
-
-**이것은 프레젠테이션의 {slide_num}번째 슬라이드입니다 (총 {total_slides}개).**
-이전 슬라이드에서 이어지는 내용이므로:
-- ❌ "안녕하세요", "반갑습니다" 같은 인사말 사용 금지
-- ❌ 주제를 처음 소개하듯이 말하지 말 것
-- ✅ 이전 내용에서 자연스럽게 이어지도록 작성
-- ✅ "다음으로~", "이어서~", "그럼 이제~" 같은 연결 표현 사용"""
-
-            prompt = f"""{intro_instruction}
-
-【전체 프레젠테이션 맥락】
-{context}
-
-【이 슬라이드 정보】
-제목: {slide.get('title', '')}
-본문:
-{slide.get('body', '')}
-{f"발표자 노트: {slide.get('notes', '')}" if slide.get('notes') else ''}
-
-{f'''⚠️ 【사용자 요청사항 - 반드시 준수】 ⚠️
-다음 요청사항을 대본 작성 시 **최우선으로 반영**하세요:
-
-"{custom_request}"
-
-위 요청사항에 맞춰 설명 스타일, 어휘 수준, 강조점을 조정하세요.
-''' if custom_request and custom_request.strip() else ''}{self._get_arrow_keywords_instruction(custom_request)}
-【중요: 자연스러운 설명 방식】
+            if response_text is None:
+                content = self._build_script_prompt(
+                    slide, context, slide_num, total_slides, target_duration, custom_request
+                )
 
-❌ 절대 하지 말아야 할 것:
-- 화면에 보이는 텍스트를 **그대로 읽지 마세요**
-- "이 슬라이드에서는...", "여기 보시면..." 같은 표현 자제
-- 슬라이드 제목을 그대로 반복하지 마세요
+                if config.LLM_SEND_SLIDE_IMAGE and slide_image_path:
+                    # 슬라이드 이미지를 함께 전송 (인코딩 결과는 캐시에서 재사용)
+                    # 공통 블록 뒤에 넣어 프롬프트 캐시 접두부가 슬라이드마다 달라지지 않게 함
+                    content.insert(1, {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "image/png",
+                            "data": self._encode_image(slide_image_path)
+                        }
+                    })
 
-✅ 반드시 해야 할 것:
-- 화면의 내용을 **다른 말로 풀어서** 설명하세요
-- 배경 지식, 이유, 맥락을 **덧붙여** 설명하세요
-- 학생들이 "왜?", "어떻게?"를 이해할 수 있도록 설명
-- "쉽게 말해서~", "이게 왜 중요하냐면~" 같은 자연스러운 연결
+                model = self._pick_script_model(slide)
+                if model != config.DEFAULT_LLM_MODEL:
+                    self.log(f"⚡ 내용이 짧은 슬라이드 → 빠른 모델 사용 ({model})", log_lines)
 
-예시:
-- 슬라이드: "반도체 8대 공정"
-- ❌ 나쁜 예: "반도체 8대 공정에 대해 알아보겠습니다"
-- ✅ 좋은 예: "반도체 하나가 만들어지려면 여덟 가지 핵심 과정을 거쳐야 하는데요"
+                request = {
+                    "model": model,
+                    "max_tokens": _script_max_tokens(target_duration),  # 목표 시간에 맞춘 출력 한도
+                    "temperature": config.LLM_TEMPERATURE,
+                    "messages": [{"role": "user", "content": content}]
+                }
+                def fetch_script():
+                    text, stop_reason = self._stream_message(stop_marker="</script>", **request)
+                    # 사고 과정/키워드가 길어 </script> 전에 한도에 걸리면 태그 없는 응답 전체가 TTS로
+                    # 넘어가므로 기존 상한(SCRIPT_MAX_TOKENS)으로 한 번 더 요청
+                    if stop_reason == "max_tokens" and request["max_tokens"] < SCRIPT_MAX_TOKENS:
+                        self.log(f"⚠️  응답이 출력 한도({request['max_tokens']} 토큰)에서 잘림 → {SCRIPT_MAX_TOKENS} 토큰으로 재요청", log_lines)
+                        text, stop_reason = self._stream_message(
+                            stop_marker="</script>", **{**request, "max_tokens": SCRIPT_MAX_TOKENS}
+                        )
+                    return text.strip(), stop_reason
 
-【형식 요구사항 - ⚠️ 글자 수 엄격 준수 ⚠️】
-- 자연스러운 구어체 (강의실에서 말하듯이)
-- ⚠️ **반드시** {target_duration}초 분량 = **정확히 {int(target_duration * 4)}자** (±10자 이내)
-- TTS 속도: 초당 4글자 기준 (한국어)
-- 글자 수가 부족하면 예시/비유 추가, 초과하면 핵심만 남기기
+                response_text, cache_hit = self._cached_llm_text("script", request, fetch_script)
+                if cache_hit:
+                    self.log("♻️  이전에 생성한 대본 재사용 (같은 슬라이드/맥락/요청사항)", log_lines)
+            else:
+                self.log("📦 배치 요청으로 받은 응답 사용", log_lines)
 
-먼저 <thinking> 태그 안에:
-1. 이 슬라이드에서 학생들이 꼭 이해해야 할 핵심 내용
-2. 시각적 요소(그림, 도표, 차트 등)가 있다면 어떻게 설명할지
-3. {target_duration}초 안에 모든 내용을 어떻게 전달할지 전략
-4. 어떤 비유나 예시를 사용하여 쉽게 설명할지
+            # 디버깅: Claude 응답 확인
+            self.log(f"📡 Claude 응답 받음 (길이: {len(response_text)}자)", log_lines)
 
-그 다음 <keywords> 태그 안에:
-- ⚠️  **매우 중요**: 슬라이드 본문에 **실제로 보이는 텍스트**만 키워드로 선택하세요
-- 슬라이드 제목이나 본문에 **정확히 있는 단어/구절**을 2-3개 선택
-- 개념을 설명하는 단어가 아니라, **화면에 표시된 그대로의 텍스트**를 선택
-- 예시:
-  - ✅ 좋은 예: "반도체 8대공정" (슬라이드에 실제로 있음)
-  - ❌ 나쁜 예: "공정 개요" (설명을 위해 만든 단어)
-- 각 키워드가 대본에서 언급되는 대략적인 시점(초)을 예측
-- 형식: "키워드|시점초" (예: "머신러닝|2.5")
-- 한 줄에 하나씩 작성
+            # thinking, keywords, highlight, script 분리 (응답 전체를 한 번만 스캔, 태그별 첫 번째 블록 사용)
+            tags = {}
+            for tag_match in _RESPONSE_TAG_RE.finditer(response_text):
+                tags.setdefault(tag_match.group(1), tag_match.group(2).strip())
 
-그 다음 <highlight> 태그 안에 (선택적):
-- 이 슬라이드가 **전체 강의의 핵심 포인트**라면, 화면 중앙에 크게 표시할 문구 작성
-- 전체 슬라이드 중 약 30%만 하이라이트 대상 (핵심 개념, 중요 결론 등)
-- 일반적인 설명 슬라이드라면 이 태그를 **비워두세요**
-- 형식: "강조문구|시점초" (예: "미세공정이 핵심이다|5.0")
-- 강조 문구는 짧고 임팩트 있게 (5~15자)
-- 대본에서 해당 문구가 언급되는 시점에 맞춰 시점 지정
+            # 태그 존재 여부도 파싱 결과로 판단 (응답을 태그마다 다시 검색하지 않음)
+            for tag_name in ("thinking", "keywords", "script"):
+                self.log(f"  - <{tag_name}> 태그: {'✓' if tag_name in tags else '✗'}", log_lines)
+            self.log("", log_lines)
 
-마지막으로 <script> 태그 안에 **정확히 {int(target_duration * 4)}자** (±10자)로
-마치 강의실에서 학생들에게 설명하듯이 자연스러운 구어체 강의 대본을 작성해주세요.
-⚠️ 글자 수를 반드시 지켜주세요! TTS 영상 길이가 이에 따라 결정됩니다."""
+            thinking = tags.get("thinking", "")
+            keywords = []
+            highlight = None  # 핵심 문구 하이라이트 (화면 중앙 표시용)
 
-            message = client.messages.create(
-                model=config.DEFAULT_LLM_MODEL,
-                max_tokens=2048,  # 강사 스타일의 자세한 설명을 위해 증가
-                temperature=0.7,
-                messages=[{"role": "user", "content": prompt}]
-            )
+            # 키워드 파싱: "키워드|시점" 형식
+            for keyword_text, timing in _KEYWORD_LINE_RE.findall(tags.get("keywords", "")):
+                keywords.append({"text": keyword_text.strip(), "timing": float(timing)})
 
-            response_text = message.content[0].text.strip()
+            # 하이라이트 파싱: "강조문구|시점" 형식 (키워드와 같은 패턴, 첫 번째 줄만 사용)
+            highlight_match = _KEYWORD_LINE_RE.match(tags.get("highlight", ""))
+            if highlight_match:
+                highlight = {
+                    "text": highlight_match.group(1).strip(),
+                    "timing": float(highlight_match.group(2))
+                }
 
-            # 디버깅: Claude 응답 확인
-            log_output = self.log(f"📡 Claude 응답 받음 (길이: {len(response_text)}자)", log_output)
-            has_thinking = "<thinking>" in response_text
-            has_keywords = "<keywords>" in response_text
-            has_script = "<script>" in response_text
-            log_output = self.log(f"  - <thinking> 태그: {'✓' if has_thinking else '✗'}", log_output)
-            log_output = self.log(f"  - <keywords> 태그: {'✓' if has_keywords else '✗'}", log_output)
-            log_output = self.log(f"  - <script> 태그: {'✓' if has_script else '✗'}", log_output)
-            log_output = self.log("", log_output)
-
-            # thinking, keywords, highlight, script 분리
-            thinking = ""
-            keywords = []
-            highlight = None  # 핵심 문구 하이라이트 (화면 중앙 표시용)
-            script = ""
-
-            if "<thinking>" in response_text and "</thinking>" in response_text:
-                thinking_start = response_text.find("<thinking>") + len("<thinking>")
-                thinking_end = response_text.find("</thinking>")
-                thinking = response_text[thinking_start:thinking_end].strip()
-
-            if "<keywords>" in response_text and "</keywords>" in response_text:
-                keywords_start = response_text.find("<keywords>") + len("<keywords>")
-                keywords_end = response_text.find("</keywords>")
-                keywords_text = response_text[keywords_start:keywords_end].strip()
-
-                # 키워드 파싱: "키워드|시점" 형식
-                for line in keywords_text.split('\n'):
-                    line = line.strip().lstrip('-').strip()
-                    if '|' in line:
-                        parts = line.split('|')
-                        keyword_text = parts[0].strip()
-                        try:
-                            timing = float(parts[1].strip().replace('초', ''))
-                            keywords.append({"text": keyword_text, "timing": timing})
-                        except:
-                            pass
-
-            # 하이라이트 파싱: "강조문구|시점" 형식
-            if "<highlight>" in response_text and "</highlight>" in response_text:
-                highlight_start = response_text.find("<highlight>") + len("<highlight>")
-                highlight_end = response_text.find("</highlight>")
-                highlight_text = response_text[highlight_start:highlight_end].strip()
-
-                if highlight_text and '|' in highlight_text:
-                    # 첫 번째 줄만 사용
-                    first_line = highlight_text.split('\n')[0].strip().lstrip('-').strip()
-                    if '|' in first_line:
-                        parts = first_line.split('|')
-                        try:
-                            highlight = {
-                                "text": parts[0].strip(),
-                                "timing": float(parts[1].strip().replace('초', ''))
-                            }
-                        except:
-                            pass
-
-            if "<script>" in response_text and "</script>" in response_text:
-                script_start = response_text.find("<script>") + len("<script>")
-                script_end = response_text.find("</script>")
-                script = response_text[script_start:script_end].strip()
+            if "script" in tags:
+                script = tags["script"]
             else:
                 # 태그가 없으면 전체를 script로 사용
-                script = response_text.replace("<thinking>", "").replace("</thinking>", "").replace("<keywords>", "").replace("</keywords>", "").replace("<script>", "").replace("</script>", "").strip()
+                script = _BARE_TAG_RE.sub("", response_text).strip()
 
             # Claude의 사고 과정 표시
             if thinking:
-                log_output = self.log("💭 Claude의 사고 과정:", log_output)
-                log_output = self.log("┌─────────────────────────────────────────┐", log_output)
-                for line in thinking.split('\n'):
-                    log_output = self.log(f"│ {line[:40]:<40} │", log_output)
-                log_output = self.log("└─────────────────────────────────────────┘", log_output)
-                log_output = self.log("", log_output)
+                self.log_block("💭 Claude의 사고 과정", thinking, log_lines)
+                self.log("", log_lines)
 
             # 핵심 키워드 표시 및 타이밍 자동 보정
             if keywords:
-                log_output = self.log("🔑 핵심 키워드 (텍스트 애니메이션):", log_output)
+                self.log("🔑 핵심 키워드 (텍스트 애니메이션):", log_lines)
 
                 # 타이밍 자동 계산: 대본에서 키워드가 실제로 나오는 위치 기반 (글자 수 기준 - 한국어에 더 정확)
                 total_chars = len(script)
                 # 한국어 TTS 평균 속도: 초당 약 4-5글자 (여유있게 4글자로 계산)
                 estimated_duration = total_chars / 4.0
+                seconds_per_char = estimated_duration / max(total_chars, 1)
 
                 # TTS보다 마킹이 먼저 나오면 안됨 → 딜레이 추가
                 # 마킹이 TTS 발화 직후에 나타나도록 (TTS 뒤 0.3~0.5초)
                 MARKING_DELAY = 0.5
 
                 for kw in keywords:
-                    # 대본에서 키워드 위치 찾기
+                    # 대본에서 키워드 위치 찾기 (TTS 후 타이밍 재조정에서 재사용하도록 저장)
                     keyword_text = kw['text'].strip()
                     keyword_pos = script.find(keyword_text)
+                    kw['char_pos'] = keyword_pos
 
                     if keyword_pos >= 0:
                         # 글자 수 기반 타이밍 계산 (한국어에 더 정확)
                         chars_before = keyword_pos
 
                         # 글자 비율로 타이밍 계산
-                        char_ratio = chars_before / max(total_chars, 1)
-                        calculated_timing = char_ratio * estimated_duration
+                        calculated_timing = chars_before * seconds_per_char
 
                         # 딜레이 추가: TTS가 해당 단어를 말한 직후 마킹 표시
                         adjusted_timing = calculated_timing + MARKING_DELAY
@@ -602,170 +1631,183 @@ class GradioUI:
                         diff = abs(adjusted_timing - original_timing)
 
                         if diff > 1.0:
-                            log_output = self.log(f"  - {kw['text']}: {original_timing:.1f}초 → {adjusted_timing:.1f}초 (글자 {chars_before}/{total_chars}, 보정됨)", log_output)
+                            self.log(f"  - {kw['text']}: {original_timing:.1f}초 → {adjusted_timing:.1f}초 (글자 {chars_before}/{total_chars}, 보정됨)", log_lines)
                         else:
-                            log_output = self.log(f"  - {kw['text']} @ {adjusted_timing:.1f}초 (글자 {chars_before}/{total_chars})", log_output)
+                            self.log(f"  - {kw['text']} @ {adjusted_timing:.1f}초 (글자 {chars_before}/{total_chars})", log_lines)
 
                         kw['timing'] = adjusted_timing
                     else:
                         # 대본에서 찾지 못한 경우 원래 타이밍에 딜레이 추가
                         kw['timing'] = kw['timing'] + MARKING_DELAY
-                        log_output = self.log(f"  - {kw['text']} ({kw['timing']:.1f}초) ⚠️ 대본에서 미발견", log_output)
+                        self.log(f"  - {kw['text']} ({kw['timing']:.1f}초) ⚠️ 대본에서 미발견", log_lines)
 
-                log_output = self.log("", log_output)
+                self.log("", log_lines)
             else:
-                log_output = self.log("⚠️  키워드가 추출되지 않았습니다 (텍스트 애니메이션 없음)", log_output)
-                log_output = self.log("", log_output)
+                self.log("⚠️  키워드가 추출되지 않았습니다 (텍스트 애니메이션 없음)", log_lines)
+                self.log("", log_lines)
 
             # 핵심 문구 하이라이트 표시
             if highlight:
-                log_output = self.log("🌟 핵심 문구 (화면 중앙 강조):", log_output)
-                log_output = self.log(f"  「{highlight['text']}」 @ {highlight['timing']:.1f}초", log_output)
-                log_output = self.log("", log_output)
+                self.log("🌟 핵심 문구 (화면 중앙 강조):", log_lines)
+                self.log(f"  「{highlight['text']}」 @ {highlight['timing']:.1f}초", log_lines)
+                self.log("", log_lines)
 
             # 최종 대본 표시
-            log_output = self.log("📝 생성된 대본:", log_output)
-            log_output = self.log("┌─────────────────────────────────────────┐", log_output)
-            for line in script.split('\n'):
-                log_output = self.log(f"│ {line[:40]:<40} │", log_output)
-            log_output = self.log("└─────────────────────────────────────────┘", log_output)
-            log_output = self.log("", log_output)
+            self.log_block("📝 생성된 대본", script, log_lines)
+            self.log("", log_lines)
 
             # 검증 (TTS 속도: 초당 4글자 기준)
-            log_output = self.log("✅ 대본 검증:", log_output)
+            self.log("✅ 대본 검증:", log_lines)
             word_count = len(script)
             expected_chars = int(target_duration * 4)  # 초당 4글자
             estimated_duration = word_count / 4.0  # 초당 4글자
 
-            log_output = self.log(f"  - 글자 수: {word_count}자 (목표: {expected_chars}자)", log_output)
-            log_output = self.log(f"  - 예상 시간: {estimated_duration:.1f}초 (목표: {target_duration}초)", log_output)
+            self.log(f"  - 글자 수: {word_count}자 (목표: {expected_chars}자)", log_lines)
+            self.log(f"  - 예상 시간: {estimated_duration:.1f}초 (목표: {target_duration}초)", log_lines)
 
             # 목표 시간의 ±20% 이내면 OK (더 엄격하게)
-            if estimated_duration < target_duration * 0.8:
-                log_output = self.log(f"  ⚠️  너무 짧습니다 ({estimated_duration:.1f}초 < {target_duration * 0.8:.1f}초)", log_output)
-            elif estimated_duration > target_duration * 1.2:
-                log_output = self.log(f"  ⚠️  너무 깁니다 ({estimated_duration:.1f}초 > {target_duration * 1.2:.1f}초)", log_output)
+            tolerance_low = target_duration * 0.8
+            tolerance_high = target_duration * 1.2
+            if estimated_duration < tolerance_low:
+                self.log(f"  ⚠️  너무 짧습니다 ({estimated_duration:.1f}초 < {tolerance_low:.1f}초)", log_lines)
+            elif estimated_duration > tolerance_high:
+                self.log(f"  ⚠️  너무 깁니다 ({estimated_duration:.1f}초 > {tolerance_high:.1f}초)", log_lines)
             else:
-                log_output = self.log(f"  ✓ 목표 시간에 적합합니다 (±20% 이내)", log_output)
+                self.log(f"  ✓ 목표 시간에 적합합니다 (±20% 이내)", log_lines)
 
-            log_output = self.log("", log_output)
+            self.log("", log_lines)
 
             # 키워드 마킹 수행
             keyword_overlays = []
-
-            # KeywordMarker 초기화 - 전달받은 인스턴스 재사용 또는 새로 생성
-            if keyword_marker is None:
-                marker = KeywordMarker(use_ocr=True)
-            else:
-                marker = keyword_marker
-
-            if enable_keyword_marking and keywords and slide_image_path:
-                try:
-                    log_output = self.log("🎯 키워드 마킹 시작:", log_output)
-
-                    # 마킹 결과 저장 디렉토리
-                    overlay_dir = config.META_DIR / f"overlays_slide_{slide_num:03d}"
-
-                    # 키워드 마킹 수행
-                    keyword_overlays = marker.mark_keywords_on_slide(
-                        slide_image_path=str(slide_image_path),
-                        keywords=keywords,
-                        output_dir=overlay_dir,
-                        pdf_path=pdf_path,
-                        page_num=page_num,
-                        mark_style=keyword_mark_style,  # UI에서 선택한 스타일
-                        create_overlay=True  # 투명 오버레이 생성
-                    )
-
-                    # 결과 로깅
-                    found_count = sum(1 for kw in keyword_overlays if kw.get("found"))
-                    log_output = self.log(f"  ✓ 키워드 마킹 완료: {found_count}/{len(keywords)}개 찾음", log_output)
-                    log_output = self.log("", log_output)
-
-                except Exception as e:
-                    log_output = self.log(f"  ⚠️  키워드 마킹 실패: {str(e)}", log_output)
-                    log_output = self.log("  → 키워드 마킹 없이 진행합니다", log_output)
-                    log_output = self.log("", log_output)
-                    keyword_overlays = []
-
-            # ★숫자 화살표 포인터 처리
             arrow_pointers = []
             parsed_arrows = self.parse_arrow_pointers(custom_request)
 
-            # 디버그: 화살표 포인터 파싱 결과 확인
-            print(f"    🔎 [디버그] custom_request: '{custom_request[:100] if custom_request else 'None'}...'")
-            print(f"    🔎 [디버그] parsed_arrows: {parsed_arrows}")
-            print(f"    🔎 [디버그] slide_image_path: {slide_image_path}")
+            # KeywordMarker - 전달받은 인스턴스 재사용, 없으면 실제로 필요할 때만 공용 풀에서 대여
+            marker = keyword_marker
+            borrowed_marker = None
+            needs_marker = bool(slide_image_path) and bool((enable_keyword_marking and keywords) or parsed_arrows)
+            if marker is None and needs_marker:
+                marker = borrowed_marker = self._acquire_keyword_marker()
 
-            if parsed_arrows and slide_image_path:
-                try:
-                    log_output = self.log("🏹 화살표 포인터 처리:", log_output)
+            try:
+                # 슬라이드 OCR은 한 번만 실행해 키워드 마킹과 화살표 마커 검색에서 공유
+                # (PDF 원본은 키워드를 PDF에서 직접 찾으므로 화살표가 있을 때만 필요)
+                if ocr_boxes is None and needs_marker and (parsed_arrows or pdf_path is None):
+                    ocr_boxes = marker.ocr_image(str(slide_image_path))
+
+                if enable_keyword_marking and keywords and slide_image_path:
+                    try:
+                        self.log("🎯 키워드 마킹 시작:", log_lines)
 
-                    # 위에서 생성된 marker 인스턴스 재사용 (KeywordMarker)
-                    for arrow_info in parsed_arrows:
-                        arrow_marker = arrow_info["marker"]  # ★1, ★2, ...
-                        arrow_keyword = arrow_info["keyword"]
+                        # 마킹 결과 저장 디렉토리
+                        overlay_dir = config.META_DIR / f"overlays_slide_{slide_num:03d}"
 
-                        # ★숫자 마커 위치 찾기 (OCR)
-                        marker_results = marker.find_text_position(
+                        # 키워드 마킹 수행
+                        keyword_overlays = marker.mark_keywords_on_slide(
                             slide_image_path=str(slide_image_path),
-                            search_text=arrow_marker,
+                            keywords=keywords,
+                            output_dir=overlay_dir,
                             pdf_path=pdf_path,
-                            page_num=page_num
+                            page_num=page_num,
+                            mark_style=keyword_mark_style,  # UI에서 선택한 스타일
+                            create_overlay=True,  # 투명 오버레이 생성
+                            boxes=ocr_boxes
                         )
 
-                        if marker_results:
-                            # 마커 위치 (첫 번째 매칭 사용)
-                            marker_pos = marker_results[0]
-                            marker_x = marker_pos.get("x", 0)
-                            marker_y = marker_pos.get("y", 0)
-                            marker_bbox = marker_pos.get("bbox", None)  # (x0, y0, x1, y1)
-
-                            # 대본에서 키워드 위치로 타이밍 계산 (글자 수 기반)
-                            keyword_pos = script.lower().find(arrow_keyword.lower())
-                            if keyword_pos >= 0:
-                                total_chars = len(script)
-                                chars_before = keyword_pos
-                                # 글자 비율로 타이밍 계산 (한국어 TTS: 초당 약 4글자)
-                                char_ratio = chars_before / max(total_chars, 1)
-                                arrow_estimated_duration = total_chars / 4.0
-                                # 딜레이 추가: TTS가 해당 단어를 말한 직후 화살표 표시
-                                timing = char_ratio * arrow_estimated_duration + 0.5
-
-                                arrow_pointers.append({
-                                    "marker": arrow_marker,
-                                    "keyword": arrow_keyword,
-                                    "target_x": marker_x,
-                                    "target_y": marker_y,
-                                    "timing": timing,
-                                    "marker_bbox": marker_bbox  # 마커 제거용 bbox
-                                })
-                                log_output = self.log(f"  ✓ {arrow_marker} '{arrow_keyword}' → 화살표 @{timing:.1f}초 (위치: {marker_x}, {marker_y})", log_output)
+                        # 대본 속 키워드 위치를 오버레이에도 붙여 둠 (타이밍 재조정 시 대본 재검색 생략)
+                        char_positions = {kw['text']: kw.get('char_pos') for kw in keywords}
+                        for overlay in keyword_overlays:
+                            overlay['char_pos'] = char_positions.get(overlay.get('keyword'))
+
+                        # 결과 로깅
+                        found_count = sum(1 for kw in keyword_overlays if kw.get("found"))
+                        self.log(f"  ✓ 키워드 마킹 완료: {found_count}/{len(keywords)}개 찾음", log_lines)
+                        self.log("", log_lines)
+
+                    except Exception as e:
+                        self.log(f"  ⚠️  키워드 마킹 실패: {str(e)}", log_lines)
+                        self.log("  → 키워드 마킹 없이 진행합니다", log_lines)
+                        self.log("", log_lines)
+                        keyword_overlays = []
+
+                # ★숫자 화살표 포인터 처리 (마커가 없으면 OCR/디버그 출력 모두 생략)
+                if parsed_arrows and slide_image_path:
+                    # 디버그: 화살표 포인터 파싱 결과 확인
+                    print(f"    🔎 [디버그] custom_request: '{custom_request[:100]}...'")
+                    print(f"    🔎 [디버그] parsed_arrows: {parsed_arrows}")
+                    print(f"    🔎 [디버그] slide_image_path: {slide_image_path}")
+
+                    try:
+                        self.log("🏹 화살표 포인터 처리:", log_lines)
+
+                        # 위에서 생성된 marker 인스턴스 재사용 (KeywordMarker)
+                        for arrow_info in parsed_arrows:
+                            arrow_marker = arrow_info["marker"]  # ★1, ★2, ...
+                            arrow_keyword = arrow_info["keyword"]
+
+                            # ★숫자 마커 위치 찾기 (공유 OCR 결과에서 검색)
+                            marker_results = marker.find_text_position(
+                                slide_image_path=str(slide_image_path),
+                                search_text=arrow_marker,
+                                pdf_path=pdf_path,
+                                page_num=page_num,
+                                boxes=ocr_boxes
+                            )
+
+                            if marker_results:
+                                # 마커 위치 (첫 번째 매칭 사용)
+                                marker_pos = marker_results[0]
+                                marker_x = marker_pos.get("x", 0)
+                                marker_y = marker_pos.get("y", 0)
+                                marker_bbox = marker_pos.get("bbox", None)  # (x0, y0, x1, y1)
+
+                                # 대본에서 키워드 위치로 타이밍 계산 (글자 수 기반)
+                                keyword_pos = script.lower().find(arrow_keyword.lower())
+                                if keyword_pos >= 0:
+                                    total_chars = len(script)
+                                    chars_before = keyword_pos
+                                    # 글자 비율로 타이밍 계산 (한국어 TTS: 초당 약 4글자)
+                                    char_ratio = chars_before / max(total_chars, 1)
+                                    arrow_estimated_duration = total_chars / 4.0
+                                    # 딜레이 추가: TTS가 해당 단어를 말한 직후 화살표 표시
+                                    timing = char_ratio * arrow_estimated_duration + 0.5
+
+                                    arrow_pointers.append({
+                                        "marker": arrow_marker,
+                                        "keyword": arrow_keyword,
+                                        "target_x": marker_x,
+                                        "target_y": marker_y,
+                                        "timing": timing,
+                                        "marker_bbox": marker_bbox  # 마커 제거용 bbox
+                                    })
+                                    self.log(f"  ✓ {arrow_marker} '{arrow_keyword}' → 화살표 @{timing:.1f}초 (위치: {marker_x}, {marker_y})", log_lines)
+                                else:
+                                    self.log(f"  ⚠️ '{arrow_keyword}'가 대본에서 발견되지 않음", log_lines)
                             else:
-                                log_output = self.log(f"  ⚠️ '{arrow_keyword}'가 대본에서 발견되지 않음", log_output)
-                        else:
-                            log_output = self.log(f"  ⚠️ {arrow_marker} 마커가 슬라이드에서 발견되지 않음", log_output)
+                                self.log(f"  ⚠️ {arrow_marker} 마커가 슬라이드에서 발견되지 않음", log_lines)
 
-                    log_output = self.log("", log_output)
+                        self.log("", log_lines)
 
-                except Exception as e:
-                    log_output = self.log(f"  ⚠️ 화살표 포인터 처리 실패: {str(e)}", log_output)
-                    log_output = self.log("", log_output)
+                    except Exception as e:
+                        self.log(f"  ⚠️ 화살표 포인터 처리 실패: {str(e)}", log_lines)
+                        self.log("", log_lines)
+            finally:
+                if borrowed_marker is not None:
+                    self._release_keyword_marker(borrowed_marker)
 
-            return script, keywords, keyword_overlays, highlight, arrow_pointers, log_output
+            return script, keywords, keyword_overlays, highlight, arrow_pointers, log_output + self.render_log(log_lines, full=True)
 
         except Exception as e:
-            log_output = self.log(f"❌ 대본 생성 실패: {str(e)}", log_output)
-            import traceback
+            self.log(f"❌ 대본 생성 실패: {str(e)}", log_lines)
             error_details = traceback.format_exc()
-            log_output = self.log(f"상세 에러:\n{error_details}", log_output)
+            self.log(f"상세 에러:\n{error_details}", log_lines)
 
             # 폴백: 슬라이드 텍스트 사용
-            fallback_script = f"{slide.get('title', '')}. {slide.get('body', '')[:100]}"
-            log_output = self.log(f"⚠️  경고: 폴백 대본 사용 (PPT 원문)", log_output)
-            log_output = self.log(f"→ {fallback_script[:50]}...", log_output)
-            log_output = self.log("", log_output)
-            return fallback_script, [], [], None, [], log_output
+            fallback_script = f"{title}. {body[:100]}"
+            self.log(f"⚠️  경고: 폴백 대본 사용 (PPT 원문)", log_lines)
+            self.log(f"→ {_preview(fallback_script, 50)}", log_lines)
+            self.log("", log_lines)
+            return fallback_script, [], [], None, [], log_output + self.render_log(log_lines, full=True)
 
     def generate_scripts_only(
         self,
@@ -780,22 +1822,22 @@ class GradioUI:
         """
         1단계: PPT에서 대본만 생성 (TTS/영상 생성 없이)
         """
-        import threading
-        log_output = ""
+        log_lines = []  # 로그 버퍼 (줄 단위 append, yield 시에만 join)
+        ocr_executor, ocr_futures = None, {}  # 슬라이드 OCR 프로세스 풀 (finally에서 정리)
 
         try:
             # 의존성 체크
-            log_output = self.log("🔍 시스템 의존성 체크 중...", log_output)
+            self.log("🔍 시스템 의존성 체크 중...", log_lines)
             issues = self.check_dependencies()
 
             if issues:
                 for issue in issues:
-                    log_output = self.log(issue, log_output)
-                log_output = self.log("", log_output)
+                    self.log(issue, log_lines)
+                self.log("", log_lines)
 
             if pptx_file is None:
-                log_output = self.log("❌ PPT 파일을 업로드해주세요.", log_output)
-                yield log_output, "", gr.update(interactive=False)
+                self.log("❌ PPT 파일을 업로드해주세요.", log_lines)
+                yield self.render_log(log_lines, full=True), "", gr.update(interactive=False)
                 return
 
             if not output_name or output_name.strip() == "":
@@ -809,34 +1851,76 @@ class GradioUI:
 
             # PPT 파싱
             progress(0.1, desc="PPT 분석 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("📂 STEP 1: PPT 파싱", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            yield log_output, "", gr.update(interactive=False)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("📂 STEP 1: PPT 파싱", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            yield self.render_log(log_lines), "", gr.update(interactive=False)
+
 
-            from app.modules.ppt_parser import PPTParser
+            # 업로드된 파일 가져오기 (하드링크 우선, 복사할 때는 해시를 함께 계산)
+            upload_path = Path(pptx_file.name if hasattr(pptx_file, 'name') else pptx_file)
+            pptx_path = config.INPUT_DIR / upload_path.name
+            self._ingest_upload(upload_path, pptx_path)
+
+            # PPT → 이미지 변환 (PPTX만 해당)
+            # LibreOffice 변환은 오래 걸리는 외부 프로세스라 백그라운드에서 먼저 시작하고,
+            # 텍스트 파싱과 맥락 분석을 진행한 뒤 슬라이드 이미지가 필요한 시점에 기다림
+            image_future = None
+            image_executor = None
+            if pptx_path.suffix.lower() == '.pptx':
+                image_executor = ThreadPoolExecutor(max_workers=1)
+                image_future = image_executor.submit(convert_pptx_to_images, pptx_path, config.SLIDES_IMG_DIR)
+                self.log("🖼️  PPT → PNG 이미지 변환 시작 (백그라운드)", log_lines)
+
+            # 맥락 분석은 슬라이드 제목/본문 앞부분만 쓰므로 PPTX는 가벼운 개요(quick_outline)로
+            # 먼저 시작해 python-pptx 전체 파싱과 겹쳐 진행 (개요 추출이 안 되는 파일은 파싱 후 분석)
+            context_future = None
+            if pptx_path.suffix.lower() == '.pptx':
+                try:
+                    outline = PPTParser.quick_outline(pptx_path)
+                except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+                    outline = None
+                if outline:
+                    context_executor = ThreadPoolExecutor(max_workers=1)
+                    context_future = context_executor.submit(self.analyze_ppt_context, outline, progress)
+                    context_executor.shutdown(wait=False)
 
             # PPT 파싱 (PDF 또는 PPTX)
-            pptx_path = Path(pptx_file.name if hasattr(pptx_file, 'name') else pptx_file)
-            slides_json = config.META_DIR / "slides.json"
+            slides_json = self.slides_json
 
             if pptx_path.suffix.lower() == '.pdf':
-                from app.modules.pdf_parser import PDFParser
-                pdf_parser = PDFParser()
-                slides = pdf_parser.parse(pptx_path, config.SLIDES_IMG_DIR)
-                self.current_pdf_path = pptx_path
+                pdf_parser = PDFParser(str(pptx_path))
+                slides = pdf_parser.parse(slides_json, config.SLIDES_IMG_DIR)
+                self.current_pdf_path = str(pptx_path)
             else:
                 parser = PPTParser(str(pptx_path))
                 slides = parser.parse(slides_json, config.SLIDES_IMG_DIR)
                 self.current_pdf_path = None
 
-            log_output = self.log(f"📊 총 {len(slides)}개 슬라이드 발견", log_output)
-            yield log_output, "", gr.update(interactive=False)
+            self.log(f"📊 총 {len(slides)}개 슬라이드 발견", log_lines)
+            yield self.render_log(log_lines), "", gr.update(interactive=False)
 
-            # 맥락 분석
+            # 맥락 분석 (이미지 변환과 동시에 진행)
             progress(0.15, desc="전체 맥락 분석 중...")
-            context_analysis, log_output = self.analyze_ppt_context(slides, progress)
-            yield log_output, "", gr.update(interactive=False)
+            if context_future is not None:
+                context_analysis, context_log = context_future.result()
+            else:
+                context_analysis, context_log = self.analyze_ppt_context(slides, progress)
+            self.log(context_log.rstrip("\n"), log_lines)
+            yield self.render_log(log_lines), "", gr.update(interactive=False)
+
+            # 슬라이드 이미지가 필요한 대본 생성(이미지 첨부/OCR/키워드 마킹) 전에 변환 완료 대기
+            if image_future is not None:
+                progress(0.18, desc="PPT → 이미지 변환 마무리 중...")
+                try:
+                    self._wait_with_progress(image_future, progress, 0.18, "PPT → 이미지 변환 마무리 중...")
+                    self.log("✅ 이미지 변환 완료", log_lines)
+                except Exception as e:
+                    self.log(f"⚠️  이미지 변환 실패: {str(e)}", log_lines)
+                    self.log("💡 LibreOffice를 설치하세요: https://www.libreoffice.org/download/download/", log_lines)
+                finally:
+                    image_executor.shutdown()
+                yield self.render_log(log_lines), "", gr.update(interactive=False)
 
             # 시간 계획 (TTS pause_duration 고려)
             PAUSE_DURATION = 0.7  # TTS에서 슬라이드당 추가되는 무음 시간
@@ -845,44 +1929,82 @@ class GradioUI:
             speech_duration = total_duration_seconds - pause_total  # 실제 대본 시간
             slides_per_duration = speech_duration / len(slides)  # 슬라이드당 대본 시간
 
-            log_output = self.log("", log_output)
-            log_output = self.log("⏱️  영상 시간 계획:", log_output)
-            log_output = self.log(f"  - 전체 목표 시간: {total_duration_minutes}분 ({total_duration_seconds}초)", log_output)
-            log_output = self.log(f"  - 슬라이드 수: {len(slides)}개", log_output)
-            log_output = self.log(f"  - 슬라이드 간 무음: {PAUSE_DURATION}초 × {len(slides)} = {pause_total:.1f}초", log_output)
-            log_output = self.log(f"  - 슬라이드당 대본 시간: {slides_per_duration:.1f}초", log_output)
-            yield log_output, "", gr.update(interactive=False)
+            self.log("", log_lines)
+            self.log("⏱️  영상 시간 계획:", log_lines)
+            self.log(f"  - 전체 목표 시간: {total_duration_minutes}분 ({total_duration_seconds}초)", log_lines)
+            self.log(f"  - 슬라이드 수: {len(slides)}개", log_lines)
+            self.log(f"  - 슬라이드 간 무음: {PAUSE_DURATION}초 × {len(slides)} = {pause_total:.1f}초", log_lines)
+            self.log(f"  - 슬라이드당 대본 시간: {slides_per_duration:.1f}초", log_lines)
 
             # 대본 생성
             progress(0.2, desc="AI 대본 생성 중...")
-            log_output = self.log("", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("🤖 STEP 2: AI 대본 생성", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            yield log_output, "", gr.update(interactive=False)
+            self.log("", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("🤖 STEP 2: AI 대본 생성", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            yield self.render_log(log_lines), "", gr.update(interactive=False)
 
             scripts_data = []
             pdf_file_path = getattr(self, 'current_pdf_path', None)
 
+            # 슬라이드 OCR을 프로세스 풀에서 미리 시작 (아래 Claude 요청과 동시에 진행)
+            needs_ocr = (enable_keyword_marking and pdf_file_path is None) or bool(self.parse_arrow_pointers(custom_request))
+            ocr_executor, ocr_futures = self._submit_slide_ocr(slides, needs_ocr, log_lines)
+
+            # Message Batches API: 전체 슬라이드를 하나의 배치 작업으로 제출하고 완료까지 폴링
+            # (응답에서 누락된 슬라이드는 아래 슬라이드별 처리에서 단건 요청으로 보완)
+            batch_responses = {}  # {슬라이드 번호: 응답 텍스트}
+            if config.LLM_USE_BATCH_API and len(slides) >= config.LLM_BATCH_API_MIN_SLIDES:
+                for _ in self._run_message_batch(
+                    slides, context_analysis, slides_per_duration, custom_request, progress, log_lines, batch_responses
+                ):
+                    yield self.render_log(log_lines), "", gr.update(interactive=False)
+
+            # Message Batches API 결과가 없으면 여러 슬라이드를 한 요청으로 묶어 스트리밍
+            # (슬라이드 블록이 도착하는 대로 해당 슬라이드 처리 시작)
+            streamed_responses = {}  # {슬라이드 번호: Future(응답 블록 텍스트 또는 None)}
+            if not batch_responses:
+                streamed_responses = self._submit_script_batches(
+                    slides, context_analysis, slides_per_duration, custom_request, log_lines
+                )
+
             # 병렬 처리
             results_lock = threading.Lock()
             completed_count = [0]
             all_results = {}
             all_logs = {}
 
+            # 완성된 대본을 한 줄씩 바로 기록 (중단되더라도 그때까지의 대본이 남음, 완료 후 scripts.json으로 대체)
+            scripts_json = self.scripts_json
+            partial_scripts_path = scripts_json.with_name("scripts.partial.ndjson")
+
             def process_slide(slide_info):
                 i, slide = slide_info
                 slide_image_path = config.SLIDES_IMG_DIR / f"slide_{slide['index']:03d}.png"
-                thread_marker = KeywordMarker(use_ocr=True)
                 thread_log = ""
 
+                # 프로세스 풀에서 미리 돌린 OCR 결과 (실패하면 None → 스레드에서 직접 OCR)
+                ocr_boxes = None
+                if i in ocr_futures:
+                    try:
+                        ocr_boxes = ocr_futures[i].result()
+                    except Exception as e:
+                        print(f"⚠️  슬라이드 {i + 1} OCR 프로세스 실패: {e}")
+
+                # 배치 응답 스트림에서 이 슬라이드 블록이 끝날 때까지 대기 (실패/누락이면 None → 개별 요청)
+                response_text = batch_responses.get(i + 1)
+                if response_text is None and (i + 1) in streamed_responses:
+                    response_text = streamed_responses[i + 1].result()
+
                 script, keywords, keyword_overlays, highlight, arrow_pointers, thread_log = self.generate_script_with_thinking(
                     slide, context_analysis, i + 1, len(slides), slides_per_duration,
                     progress, thread_log, custom_request=custom_request,
                     slide_image_path=slide_image_path if slide_image_path.exists() else None,
                     pdf_path=pdf_file_path, page_num=i,
                     enable_keyword_marking=enable_keyword_marking,
-                    keyword_mark_style=keyword_mark_style, keyword_marker=thread_marker
+                    keyword_mark_style=keyword_mark_style,
+                    response_text=response_text,
+                    ocr_boxes=ocr_boxes
                 )
 
                 result = {
@@ -898,34 +2020,41 @@ class GradioUI:
                     all_results[i] = result
                     all_logs[i] = thread_log
                     completed_count[0] += 1
+                    _append_ndjson(partial_scripts_file, result)
 
                 return i
 
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            max_workers = min(2, len(slides))
-            log_output = self.log(f"⚡ 병렬 처리 시작 (워커: {max_workers}개, 슬라이드: {len(slides)}개)", log_output)
-            yield log_output, "", gr.update(interactive=False)
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {executor.submit(process_slide, (i, slide)): i for i, slide in enumerate(slides)}
-                for future in as_completed(futures):
-                    slide_idx = futures[future]
-                    progress_pct = 0.2 + (completed_count[0] / len(slides)) * 0.5
-                    progress(progress_pct, desc=f"대본 생성 중... ({completed_count[0]}/{len(slides)})")
-                    log_output = self.log(f"  ✓ 슬라이드 {slide_idx + 1} 완료", log_output)
-                    yield log_output, "", gr.update(interactive=False)
+            max_workers = min(config.LLM_CONCURRENCY, len(slides))
+            self.log(f"⚡ 병렬 처리 시작 (워커: {max_workers}개, 슬라이드: {len(slides)}개)", log_lines)
+            yield self.render_log(log_lines), "", gr.update(interactive=False)
+
+            update_progress = self._throttle_progress(progress)
+            should_yield = self._throttle_yield()
+            with open(partial_scripts_path, 'wb') as partial_scripts_file:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {executor.submit(process_slide, (i, slide)): i for i, slide in enumerate(slides)}
+                    for future in as_completed(futures):
+                        slide_idx = futures[future]
+                        progress_pct = 0.2 + (completed_count[0] / len(slides)) * 0.5
+                        update_progress(progress_pct, desc=f"대본 생성 중... ({completed_count[0]}/{len(slides)})",
+                                        force=completed_count[0] == len(slides))
+                        self.log(f"  ✓ 슬라이드 {slide_idx + 1} 완료", log_lines)
+                        if should_yield(force=completed_count[0] == len(slides)):
+                            yield self.render_log(log_lines), "", gr.update(interactive=False)
+
+            # 모든 슬라이드가 OCR 결과를 받아갔으므로 워커 프로세스 종료
+            self._shutdown_slide_ocr(ocr_executor, ocr_futures)
 
             # 결과 정렬
             for i in range(len(slides)):
                 scripts_data.append(all_results[i])
 
-            # 대본 저장
-            scripts_json = config.META_DIR / "scripts.json"
-            with open(scripts_json, 'w', encoding='utf-8') as f:
-                json.dump(scripts_data, f, ensure_ascii=False, indent=2)
+            # 대본 저장 (전체 저장이 끝났으므로 중간 기록 파일은 삭제)
+            _write_json(scripts_json, scripts_data)
+            partial_scripts_path.unlink(missing_ok=True)
 
-            log_output = self.log("", log_output)
-            log_output = self.log(f"💾 대본 저장 완료: {scripts_json}", log_output)
+            self.log("", log_lines)
+            self.log(f"💾 대본 저장 완료: {scripts_json}", log_lines)
 
             # 대본 포맷팅 (UI 표시용)
             scripts_formatted = ""
@@ -933,21 +2062,23 @@ class GradioUI:
                 scripts_formatted += f"━━━ 슬라이드 {i+1} ━━━\n"
                 scripts_formatted += f"{script_item.get('script', '')}\n\n"
 
-            log_output = self.log("", log_output)
-            log_output = self.log("✅ 대본 생성 완료!", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("👆 위 대본을 확인하고 필요하면 수정하세요.", log_output)
-            log_output = self.log("👉 수정 완료 후 '2단계: 영상 생성' 버튼을 클릭하세요.", log_output)
+            self.log("", log_lines)
+            self.log("✅ 대본 생성 완료!", log_lines)
+            self.log("", log_lines)
+            self.log("👆 위 대본을 확인하고 필요하면 수정하세요.", log_lines)
+            self.log("👉 수정 완료 후 '2단계: 영상 생성' 버튼을 클릭하세요.", log_lines)
 
             progress(0.7, desc="대본 생성 완료!")
-            yield log_output, scripts_formatted, gr.update(interactive=True)
+            yield self.render_log(log_lines, full=True), scripts_formatted, gr.update(interactive=True)
 
         except Exception as e:
             error_msg = f"\n\n❌ 오류 발생: {str(e)}"
-            log_output = self.log(error_msg, log_output)
-            import traceback
+            self.log(error_msg, log_lines)
             traceback.print_exc()
-            yield log_output, "", gr.update(interactive=False)
+            yield self.render_log(log_lines, full=True), "", gr.update(interactive=False)
+        finally:
+            # 오류로 중단돼도 OCR 워커 프로세스가 남지 않도록 정리
+            self._shutdown_slide_ocr(ocr_executor, ocr_futures)
 
     def generate_video_from_scripts(
         self,
@@ -964,26 +2095,27 @@ class GradioUI:
         transition_duration,
         video_quality,
         encoding_speed,
+        video_codec=None,
         progress=gr.Progress()
     ):
         """
         2단계: 대본으로 TTS 생성 + 영상 렌더링
         """
-        log_output = ""
+        log_lines = []  # 로그 버퍼 (줄 단위 append, yield 시에만 join)
 
         try:
             if not scripts_text or scripts_text.strip() == "":
-                log_output = self.log("❌ 대본이 없습니다. 먼저 '1단계: 대본 생성'을 실행하세요.", log_output)
-                yield log_output, None, None, None
+                self.log("❌ 대본이 없습니다. 먼저 '1단계: 대본 생성'을 실행하세요.", log_lines)
+                yield self.render_log(log_lines, full=True), None, None, None
                 return
 
             if pptx_file is None:
-                log_output = self.log("❌ PPT 파일이 없습니다.", log_output)
-                yield log_output, None, None, None
+                self.log("❌ PPT 파일이 없습니다.", log_lines)
+                yield self.render_log(log_lines, full=True), None, None, None
                 return
 
-            if not output_name or output_name.strip() == "":
-                output_name = "output_video"
+            # 파일명 정리 (정리 후 비어 있으면 기본 이름 사용)
+            output_name = _sanitize_output_name(output_name)
 
             # 대본 텍스트 파싱 (UI에서 수정된 대본 반영)
             scripts_data = []
@@ -1002,7 +2134,6 @@ class GradioUI:
                             "arrow_pointers": []
                         })
                     # 슬라이드 번호 추출
-                    import re
                     match = re.search(r'슬라이드\s*(\d+)', line)
                     if match:
                         current_slide = int(match.group(1))
@@ -1022,141 +2153,206 @@ class GradioUI:
                 })
 
             if not scripts_data:
-                log_output = self.log("❌ 대본 파싱 실패. 형식을 확인하세요.", log_output)
-                yield log_output, None, None, None
+                self.log("❌ 대본 파싱 실패. 형식을 확인하세요.", log_lines)
+                yield self.render_log(log_lines, full=True), None, None, None
                 return
 
-            log_output = self.log(f"📝 {len(scripts_data)}개 슬라이드 대본 확인", log_output)
+            self.log(f"📝 {len(scripts_data)}개 슬라이드 대본 확인", log_lines)
 
-            # 대본 저장 (수정된 버전)
-            scripts_json = config.META_DIR / "scripts.json"
-            with open(scripts_json, 'w', encoding='utf-8') as f:
-                json.dump(scripts_data, f, ensure_ascii=False, indent=2)
+            # 1단계에서 찾은 화살표 포인터(마커 위치 포함)는 대본 텍스트에 담기지 않으므로
+            # scripts.json을 덮어쓰기 전에 슬라이드 번호로 찾아 이어받음
+            try:
+                with open(self.scripts_json, 'r', encoding='utf-8') as f:
+                    previous_scripts = json.load(f)
+            except (OSError, ValueError):
+                previous_scripts = []
+            previous_arrows = {item.get("index"): item.get("arrow_pointers") or [] for item in previous_scripts}
+            for script_item in scripts_data:
+                script_item["arrow_pointers"] = previous_arrows.get(script_item["index"], [])
 
-            # TTS 생성
-            progress(0.3, desc="TTS 음성 생성 중...")
-            log_output = self.log("", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log(f"🔊 STEP 3: TTS 음성 생성 (음성: {voice_choice})", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            yield log_output, None, None, None
-
-            audio_meta_json = config.META_DIR / "audio_meta.json"
-            tts = TTSClient(
-                provider=config.TTS_PROVIDER,
-                api_key=config.OPENAI_API_KEY,
-                voice=voice_choice
+            # 결과 캐시 확인 (같은 파일 + 같은 대본 + 같은 설정이면 이전에 만든 영상 재사용)
+            video_codec = video_codec or config.VIDEO_CODEC
+            final_video_path = config.OUTPUT_DIR / f"{output_name}.mp4"
+            upload_path = Path(pptx_file.name if hasattr(pptx_file, 'name') else pptx_file)
+            cache_video, cache_scripts = self._result_cache_paths(
+                self._hash_file(upload_path),
+                (scripts_text, voice_choice, resolution_choice, enable_subtitles, subtitle_font_size,
+                 transition_effect, transition_duration, video_quality, encoding_speed, video_codec,
+                 [script_item["arrow_pointers"] for script_item in scripts_data])
             )
+            if cache_video.exists():
+                os.utime(cache_video)  # LRU 갱신
+                self._link_or_copy(cache_video, final_video_path)
+                progress(1.0, desc="완료! (캐시)")
+                self.log("⚡ 캐시 히트! 동일한 파일/대본/설정으로 만든 영상을 재사용합니다", log_lines)
+                self.log(f"  • 출력 파일: {final_video_path.name}", log_lines)
+                yield self.render_log(log_lines, full=True), str(final_video_path), None, None
+                return
 
-            audio_meta = tts.generate_audio(scripts_json, config.AUDIO_DIR, audio_meta_json)
-            total_duration = sum(item['duration'] for item in audio_meta)
-
-            log_output = self.log(f"✅ TTS 생성 완료: {len(audio_meta)}개 오디오 ({total_duration:.1f}초)", log_output)
-            yield log_output, None, None, None
-
-            # 자막 생성
-            if enable_subtitles:
-                progress(0.5, desc="자막 생성 중...")
-                log_output = self.log("", log_output)
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                log_output = self.log("📝 자막 생성 중...", log_output)
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                yield log_output, None, None, None
-
-                from app.modules.subtitle_generator import SubtitleGenerator
-                subtitle_gen = SubtitleGenerator()
-                srt_path = config.OUTPUT_DIR / f"{output_name}.srt"
-                subtitle_gen.generate_srt(scripts_data, audio_meta, srt_path)
-                log_output = self.log(f"✅ 자막 생성 완료: {srt_path.name}", log_output)
-
-            # 영상 렌더링
-            progress(0.6, desc="영상 렌더링 중...")
-            log_output = self.log("", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log(f"🎬 STEP 4: 영상 렌더링 ({resolution_choice})", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            yield log_output, None, None, None
-
-            from app.modules.ffmpeg_renderer import FFmpegRenderer
+            # 대본 저장 (수정된 버전)
+            scripts_json = self.scripts_json
+            _write_json(scripts_json, scripts_data)
 
             # 해상도 파싱
-            width, height = map(int, resolution_choice.split('x'))
+            width, height = _parse_resolution(resolution_choice)
 
             quality_map = {"high": 18, "medium": 23, "low": 28}
             crf = quality_map.get(video_quality, 23)
 
-            renderer = FFmpegRenderer(width=width, height=height, crf=crf, preset=encoding_speed)
-
-            log_output = self.log(f"  - 영상 품질: {video_quality} (CRF: {crf})", log_output)
-            log_output = self.log(f"  - 인코딩 속도: {encoding_speed}", log_output)
-            log_output = self.log(f"  - 전환 효과: {transition_effect} ({transition_duration}초)", log_output)
-            yield log_output, None, None, None
+            # TTS가 끝난 슬라이드부터 바로 클립을 만들 수 있도록 렌더러를 TTS 전에 준비
+            renderer = FFmpegRenderer(width=width, height=height, crf=crf, preset=encoding_speed, codec=video_codec)
 
             # 출력 경로 설정
-            slides_json = config.META_DIR / "slides.json"
-            final_video_path = config.OUTPUT_DIR / f"{output_name}.mp4"
+            slides_json = self.slides_json
             subtitle_file = config.OUTPUT_DIR / f"{output_name}.srt" if enable_subtitles else None
+            # 이전 결과가 캐시 영상과 하드링크로 묶여 있을 수 있으므로 덮어쓰기 전에 링크를 끊음
+            final_video_path.unlink(missing_ok=True)
 
-            success = renderer.render_video(
-                slides_json,
-                audio_meta_json,
-                config.SLIDES_IMG_DIR,
-                config.AUDIO_DIR,
-                config.CLIPS_DIR,
-                final_video_path,
-                scripts_json_path=scripts_json,
-                enable_keyword_marking=False,
-                transition_effect=transition_effect,
-                transition_duration=float(transition_duration),
-                subtitle_file=subtitle_file,
-                subtitle_font_size=int(subtitle_font_size)
-            )
+            # TTS 생성
+            progress(0.3, desc="TTS 음성 생성 중...")
+            self.log("", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log(f"🔊 STEP 3: TTS 음성 생성 (음성: {voice_choice})", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            yield self.render_log(log_lines), None, None, None
+
+            audio_meta_json = self.audio_meta_json
+            tts = self._get_tts_client(voice_choice)
+
+            with ThreadPoolExecutor(max_workers=config.TTS_CONCURRENCY) as tts_executor, \
+                    ThreadPoolExecutor(max_workers=1) as render_executor:
+                # 방금 파싱한 대본을 슬라이드별로 바로 제출하고, 끝나는 순서대로 슬라이드별 진행 표시
+                # (scripts.json은 외부 확인용으로만 저장)
+                tts_futures = {
+                    tts.submit_audio(tts_executor, script_item, config.AUDIO_DIR, audio_meta_json): script_item
+                    for script_item in scripts_data
+                }
+
+                # 화살표 마커 제거는 오디오와 무관하므로 TTS와 동시에 진행
+                # (렌더링과 같은 단일 스레드 executor에 먼저 넣어 렌더링은 마커 제거가 끝난 이미지로 시작)
+                marker_future = render_executor.submit(_remove_arrow_markers, scripts_data, config.SLIDES_IMG_DIR)
+
+                # 렌더링도 바로 시작: 렌더러가 슬라이드 순서대로 TTS Future를 기다리며
+                # 음성이 나온 슬라이드부터 클립을 인코딩 (자막은 전체 오디오 길이가 필요하므로 렌더링 후 따로 입힘)
+                render_future = render_executor.submit(
+                    renderer.render_video,
+                    slides_json,
+                    audio_meta_json,
+                    config.SLIDES_IMG_DIR,
+                    config.AUDIO_DIR,
+                    config.CLIPS_DIR,
+                    final_video_path,
+                    scripts_json_path=scripts_json,
+                    enable_keyword_marking=False,
+                    transition_effect=transition_effect,
+                    transition_duration=float(transition_duration),
+                    audio_meta=list(tts_futures),
+                    scripts=scripts_data,
+                    max_workers=config.RENDER_WORKERS
+                )
+
+                update_progress = self._throttle_progress(progress)
+                should_yield = self._throttle_yield()
+                audio_meta = []
+                for audio_info in tts.iter_audio(tts_futures):
+                    audio_meta.append(audio_info)
+                    status = "⚠️ 실패 (기본 길이 사용)" if audio_info.get("error") else f"{audio_info['duration']:.1f}초"
+                    self.log(f"  🔊 슬라이드 {audio_info['index']} 음성 완료: {status}", log_lines)
+                    update_progress(0.3 + 0.2 * len(audio_meta) / len(tts_futures),
+                                    desc=f"TTS 음성 생성 중... ({len(audio_meta)}/{len(tts_futures)})",
+                                    force=len(audio_meta) == len(tts_futures))
+                    if should_yield():
+                        yield self.render_log(log_lines), None, None, None
+                audio_meta = tts.save_audio_meta(audio_meta, audio_meta_json)
+                total_duration = sum(item['duration'] for item in audio_meta)
+
+                self.log(f"✅ TTS 생성 완료: {len(audio_meta)}개 오디오 ({total_duration:.1f}초)", log_lines)
+                yield self.render_log(log_lines), None, None, None
+
+                # 자막 생성 (영상 렌더링과 동시에 진행)
+                if enable_subtitles:
+                    progress(0.5, desc="자막 생성 중...")
+                    self.log("", log_lines)
+                    self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                    self.log("📝 자막 생성 중...", log_lines)
+                    self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                    yield self.render_log(log_lines), None, None, None
+
+                    subtitle_gen = SubtitleGenerator()
+                    subtitle_gen.generate_srt(
+                        _build_subtitle_timeline(audio_meta, transition_effect, float(transition_duration)), subtitle_file
+                    )
+                    self.log(f"✅ 자막 생성 완료: {subtitle_file.name}", log_lines)
+
+                # 영상 렌더링 (TTS와 함께 시작한 렌더링이 끝날 때까지 대기)
+                progress(0.6, desc="영상 렌더링 중...")
+                self.log("", log_lines)
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                self.log(f"🎬 STEP 4: 영상 렌더링 ({resolution_choice})", log_lines)
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                marker_removal_count = marker_future.result()
+                if marker_removal_count > 0:
+                    self.log(f"🧹 화살표 마커 {marker_removal_count}개 제거 완료 (영상에서 숨김)", log_lines)
+                self.log(f"  - 영상 품질: {video_quality} (CRF: {crf})", log_lines)
+                self.log(f"  - 인코딩 속도: {encoding_speed}", log_lines)
+                self.log(f"  - 비디오 인코더: {renderer.hw_encoder or 'libx264'} (선택: {video_codec})", log_lines)
+                self.log(f"  - 전환 효과: {transition_effect} ({transition_duration}초)", log_lines)
+                yield self.render_log(log_lines), None, None, None
+
+                success = self._wait_with_progress(render_future, progress, 0.6, "영상 렌더링 중...")
+
+            if success and subtitle_file is not None:
+                self._run_with_progress(
+                    progress, 0.95, "자막 입히는 중...", renderer.add_subtitles,
+                    final_video_path, subtitle_file, int(subtitle_font_size)
+                )
 
             final_video = final_video_path if success else None
 
             if not final_video or not final_video.exists():
-                log_output = self.log("❌ 영상 렌더링 실패", log_output)
-                yield log_output, None, None, None
+                self.log("❌ 영상 렌더링 실패", log_lines)
+                yield self.render_log(log_lines, full=True), None, None, None
                 return
 
+            # 다음에 같은 파일/대본/설정으로 요청하면 바로 재사용하도록 결과 캐시에 등록
+            self._store_result_cache(final_video, cache_video, cache_scripts, scripts_text)
+
             # 완료
             progress(1.0, desc="완료!")
             file_size_mb = final_video.stat().st_size / (1024 * 1024)
 
-            log_output = self.log("", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("✅ 변환 완료!", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("📊 최종 결과:", log_output)
-            log_output = self.log(f"  • 슬라이드 수: {len(scripts_data)}개", log_output)
-            log_output = self.log(f"  • 총 길이: {total_duration:.1f}초 ({total_duration/60:.1f}분)", log_output)
-            log_output = self.log(f"  • 해상도: {resolution_choice}", log_output)
-            log_output = self.log(f"  • 음성: {voice_choice}", log_output)
-            log_output = self.log(f"  • 파일 크기: {file_size_mb:.1f} MB", log_output)
-            log_output = self.log(f"  • 출력 파일: {final_video.name}", log_output)
-
-            yield log_output, str(final_video), None, None
+            self.log("", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("✅ 변환 완료!", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            self.log("📊 최종 결과:", log_lines)
+            self.log(f"  • 슬라이드 수: {len(scripts_data)}개", log_lines)
+            self.log(f"  • 총 길이: {total_duration:.1f}초 ({total_duration/60:.1f}분)", log_lines)
+            self.log(f"  • 해상도: {resolution_choice}", log_lines)
+            self.log(f"  • 음성: {voice_choice}", log_lines)
+            self.log(f"  • 파일 크기: {file_size_mb:.1f} MB", log_lines)
+            self.log(f"  • 출력 파일: {final_video.name}", log_lines)
+
+            yield self.render_log(log_lines, full=True), str(final_video), None, None
 
         except Exception as e:
             error_msg = f"\n\n❌ 오류 발생: {str(e)}"
-            log_output = self.log(error_msg, log_output)
-            import traceback
+            self.log(error_msg, log_lines)
             traceback.print_exc()
-            yield log_output, None, None, None
+            yield self.render_log(log_lines, full=True), None, None, None
 
     def convert_to_compatible_mp4(self, input_file, progress=gr.Progress()):
         """
         MP4 파일을 Windows 호환성 높은 형식으로 변환
         (핸드폰 카메라처럼 어디서든 재생 가능)
         """
-        import subprocess
-        log_output = ""
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
 
         try:
             if input_file is None:
-                log_output = self.log("❌ MP4 파일을 업로드해주세요.", log_output)
-                yield log_output, None
+                self.log("❌ MP4 파일을 업로드해주세요.", log_lines)
+                yield self.render_log(log_lines, full=True), None
                 return
 
             input_path = Path(input_file.name if hasattr(input_file, 'name') else input_file)
@@ -1165,21 +2361,20 @@ class GradioUI:
             # 출력 디렉토리 생성
             config.OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-            log_output = self.log("🔄 MP4 호환성 변환 시작", log_output)
-            log_output = self.log(f"  입력: {input_path.name}", log_output)
-            log_output = self.log(f"  출력: {output_path.name}", log_output)
-            log_output = self.log("", log_output)
+            self.log("🔄 MP4 호환성 변환 시작", log_lines)
+            self.log(f"  입력: {input_path.name}", log_lines)
+            self.log(f"  출력: {output_path.name}", log_lines)
+            self.log("", log_lines)
             progress(0.1, desc="변환 준비 중...")
-            yield log_output, None
 
-            log_output = self.log("📋 변환 설정:", log_output)
-            log_output = self.log("  • 코덱: H.264 (libx264)", log_output)
-            log_output = self.log("  • 프로파일: Main (호환성 최적)", log_output)
-            log_output = self.log("  • 레벨: 4.0 (1080p 지원)", log_output)
-            log_output = self.log("  • 픽셀 포맷: yuv420p (표준)", log_output)
-            log_output = self.log("  • faststart: 활성화 (빠른 재생)", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None
+            self.log("📋 변환 설정:", log_lines)
+            self.log("  • 코덱: H.264 (libx264)", log_lines)
+            self.log("  • 프로파일: Main (호환성 최적)", log_lines)
+            self.log("  • 레벨: 4.0 (1080p 지원)", log_lines)
+            self.log("  • 픽셀 포맷: yuv420p (표준)", log_lines)
+            self.log("  • faststart: 활성화 (빠른 재생)", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None
 
             # FFmpeg 변환 명령어 (핸드폰 카메라 수준 호환성)
             cmd = [
@@ -1199,9 +2394,9 @@ class GradioUI:
                 str(output_path)
             ]
 
-            log_output = self.log("⏳ FFmpeg 변환 중...", log_output)
+            self.log("⏳ FFmpeg 변환 중...", log_lines)
             progress(0.3, desc="변환 중...")
-            yield log_output, None
+            yield self.render_log(log_lines), None
 
             result = subprocess.run(
                 cmd,
@@ -1210,8 +2405,8 @@ class GradioUI:
             )
 
             if result.returncode != 0:
-                log_output = self.log(f"❌ 변환 실패: {result.stderr[:200]}", log_output)
-                yield log_output, None
+                self.log(f"❌ 변환 실패: {result.stderr[:200]}", log_lines)
+                yield self.render_log(log_lines, full=True), None
                 return
 
             progress(1.0, desc="완료!")
@@ -1220,23 +2415,22 @@ class GradioUI:
             input_size = input_path.stat().st_size / (1024 * 1024)
             output_size = output_path.stat().st_size / (1024 * 1024)
 
-            log_output = self.log("", log_output)
-            log_output = self.log("✅ 변환 완료!", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("📊 결과:", log_output)
-            log_output = self.log(f"  • 원본 크기: {input_size:.1f} MB", log_output)
-            log_output = self.log(f"  • 변환 크기: {output_size:.1f} MB", log_output)
-            log_output = self.log(f"  • 출력 파일: {output_path.name}", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("🎉 이제 Windows Media Player에서도 재생됩니다!", log_output)
+            self.log("", log_lines)
+            self.log("✅ 변환 완료!", log_lines)
+            self.log("", log_lines)
+            self.log("📊 결과:", log_lines)
+            self.log(f"  • 원본 크기: {input_size:.1f} MB", log_lines)
+            self.log(f"  • 변환 크기: {output_size:.1f} MB", log_lines)
+            self.log(f"  • 출력 파일: {output_path.name}", log_lines)
+            self.log("", log_lines)
+            self.log("🎉 이제 Windows Media Player에서도 재생됩니다!", log_lines)
 
-            yield log_output, str(output_path)
+            yield self.render_log(log_lines, full=True), str(output_path)
 
         except Exception as e:
-            log_output = self.log(f"❌ 오류: {str(e)}", log_output)
-            import traceback
+            self.log(f"❌ 오류: {str(e)}", log_lines)
             traceback.print_exc()
-            yield log_output, None
+            yield self.render_log(log_lines, full=True), None
 
     # ============================================================
     # MP4 자막 모드 함수들
@@ -1273,7 +2467,6 @@ class GradioUI:
 
     def get_file_size_mb(self, file_path):
         """파일 크기를 MB 단위로 반환"""
-        import os
         return os.path.getsize(file_path) / (1024 * 1024)
 
     def split_audio_into_chunks(self, audio_path, output_dir, chunk_duration=600):
@@ -1288,7 +2481,6 @@ class GradioUI:
         Returns:
             list: [(청크파일경로, 시작시간), ...] 형태의 리스트
         """
-        from pathlib import Path
 
         total_duration = self.get_audio_duration(audio_path)
         if total_duration == 0:
@@ -1337,10 +2529,8 @@ class GradioUI:
         Returns:
             transcript 객체 또는 None (실패 시)
         """
-        from openai import OpenAI
-        import time
 
-        client = OpenAI(api_key=config.OPENAI_API_KEY)
+        client = self._get_openai_client()
 
         last_error = None
         for attempt in range(max_retries):
@@ -1385,7 +2575,6 @@ class GradioUI:
         Returns:
             transcript 객체 (segments 속성 포함)
         """
-        from pathlib import Path
 
         audio_path = Path(audio_path)
         duration = self.get_audio_duration(audio_path)
@@ -1469,9 +2658,8 @@ class GradioUI:
             segments: 자막 세그먼트 리스트
             batch_size: 한 번에 처리할 자막 수 (기본값: 10)
         """
-        import anthropic
 
-        client = anthropic.Anthropic(api_key=config.ANTHROPIC_API_KEY)
+        client = self._get_anthropic_client()
 
         all_corrected_segments = []
         total_batches = (len(segments) + batch_size - 1) // batch_size
@@ -1527,7 +2715,6 @@ class GradioUI:
                 response_text = response.content[0].text
                 lines = response_text.strip().split("\n")
 
-                import re
                 for line in lines:
                     match = re.match(r'\d+\.\s*(.+)', line)
                     if match:
@@ -1578,9 +2765,8 @@ class GradioUI:
 
     def correct_subtitles_with_gpt(self, segments, glossary=None):
         """GPT를 사용하여 자막 교정 (음절 수 유지, 오타만 수정)"""
-        from openai import OpenAI
 
-        client = OpenAI(api_key=config.OPENAI_API_KEY)
+        client = self._get_openai_client()
 
         # 전체 텍스트 추출
         full_text = "\n".join([f"[{i}] {seg.get('text', '')}" for i, seg in enumerate(segments)])
@@ -1622,7 +2808,6 @@ class GradioUI:
             for seg in segments:
                 corrected_segments.append(seg.copy())
 
-            import re
             for line in corrected_text.split("\n"):
                 match = re.match(r'\[(\d+)\]\s*(.+)', line.strip())
                 if match:
@@ -1642,7 +2827,6 @@ class GradioUI:
         - 편집창: 원본 Whisper 세그먼트 유지
         - formatted_text: 최대 2줄로 줄바꿈 (ASS용)
         """
-        import textwrap
 
         formatted_segments = []
 
@@ -1760,7 +2944,6 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
     def burn_subtitles_to_video(self, video_path, ass_path, output_path):
         """자막을 영상에 합성 (하드코딩) - GPU 인코딩 지원"""
-        import os
 
         # FFmpeg ass 필터에서 Windows 경로 처리
         ass_path_str = str(ass_path)
@@ -1791,8 +2974,6 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
     def add_opening_closing(self, video_path, output_path, opening_image=None, closing_image=None, duration=3, fade_duration=1):
         """오프닝/클로징 이미지를 영상 앞뒤에 추가 (페이드 효과) - GPU 인코딩 지원"""
-        import os
-        import tempfile
 
         try:
             # GPU/CPU 인코더 선택
@@ -1924,9 +3105,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
             # concat으로 합치기
             if len(videos_to_concat) == 1:
-                # 오프닝/클로징 둘 다 실패한 경우
-                import shutil
-                shutil.copy(str(main_video), str(output_path))
+                # 오프닝/클로징 둘 다 실패한 경우 (같은 파일시스템이면 하드링크로 복사 생략)
+                self._link_or_copy(main_video, output_path)
                 return True, "원본 영상 사용"
 
             # concat 파일 생성
@@ -1977,8 +3157,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
         # 이미 목표 해상도 이상이면 스킵
         if height >= target_height:
-            # 그냥 복사
-            shutil.copy(input_path, output_path)
+            # 그냥 복사 (같은 파일시스템이면 하드링크로 복사 생략)
+            self._link_or_copy(input_path, output_path)
             return True, f"이미 {height}p (업스케일 불필요)"
 
         # 업스케일 비율 계산
@@ -2013,12 +3193,12 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         자막 모드 Step 1: 음성 추출 → STT → 맞춤법 교정
         결과: 원본 자막 + 교정된 자막 텍스트박스로 표시
         """
-        log_output = ""
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
 
         try:
             if input_file is None:
-                log_output = self.log("❌ MP4 파일을 업로드해주세요.", log_output)
-                yield log_output, None, None, "", "", "", gr.update(interactive=False)
+                self.log("❌ MP4 파일을 업로드해주세요.", log_lines)
+                yield self.render_log(log_lines, full=True), None, None, "", "", "", gr.update(interactive=False)
                 return
 
             input_path = Path(input_file)
@@ -2031,9 +3211,9 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             normalized_video = temp_dir / "normalized_input.mp4"
 
             # Step 0: 타임스탬프 정렬 (싱크 문제 방지)
-            log_output = self.log("⏱️ Step 0: 타임스탬프 정렬 중...", log_output)
+            self.log("⏱️ Step 0: 타임스탬프 정렬 중...", log_lines)
             progress(0.05, desc="타임스탬프 정렬 중...")
-            yield log_output, None, None, "", "", "", gr.update(interactive=False)
+            yield self.render_log(log_lines), None, None, "", "", "", gr.update(interactive=False)
 
             # 코딩왕자 추천: 모든 작업 전에 타임스탬프를 0으로 정렬
             normalize_cmd = [
@@ -2047,47 +3227,45 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             normalize_result = subprocess.run(normalize_cmd, capture_output=True, text=True, encoding='utf-8', errors='replace')
 
             if normalize_result.returncode == 0 and normalized_video.exists():
-                log_output = self.log("  ✓ 타임스탬프 정렬 완료 (0 기준)", log_output)
+                self.log("  ✓ 타임스탬프 정렬 완료 (0 기준)", log_lines)
                 working_video = normalized_video
             else:
-                log_output = self.log("  ⚠️ 정렬 스킵 (원본 사용)", log_output)
+                self.log("  ⚠️ 정렬 스킵 (원본 사용)", log_lines)
                 working_video = input_path
 
-            yield log_output, None, None, "", "", "", gr.update(interactive=False)
 
             # Step 1: 오디오 추출 (정렬된 영상 기준)
-            log_output = self.log("🎵 Step 1: 오디오 추출 중...", log_output)
+            self.log("🎵 Step 1: 오디오 추출 중...", log_lines)
             progress(0.1, desc="오디오 추출 중...")
-            yield log_output, None, None, "", "", "", gr.update(interactive=False)
+            yield self.render_log(log_lines), None, None, "", "", "", gr.update(interactive=False)
 
             if not self.extract_audio_from_video(working_video, audio_path):
-                log_output = self.log("❌ 오디오 추출 실패", log_output)
-                yield log_output, None, None, "", "", "", gr.update(interactive=False)
+                self.log("❌ 오디오 추출 실패", log_lines)
+                yield self.render_log(log_lines, full=True), None, None, "", "", "", gr.update(interactive=False)
                 return
 
-            log_output = self.log("  ✓ 오디오 추출 완료", log_output)
-            yield log_output, None, None, "", "", "", gr.update(interactive=False)
+            self.log("  ✓ 오디오 추출 완료", log_lines)
+            yield self.render_log(log_lines), None, None, "", "", "", gr.update(interactive=False)
 
             # Step 2: Whisper STT
-            log_output = self.log("", log_output)
-            log_output = self.log("🎤 Step 2: 음성 인식 중 (OpenAI Whisper)...", log_output)
+            self.log("", log_lines)
+            self.log("🎤 Step 2: 음성 인식 중 (OpenAI Whisper)...", log_lines)
 
             # 오디오 파일 정보 확인
             audio_duration = self.get_audio_duration(audio_path)
             audio_size_mb = self.get_file_size_mb(audio_path)
-            log_output = self.log(f"  📁 오디오: {audio_duration:.1f}초 ({audio_size_mb:.1f}MB)", log_output)
+            self.log(f"  📁 오디오: {audio_duration:.1f}초 ({audio_size_mb:.1f}MB)", log_lines)
 
             # 긴 파일인 경우 청크 처리 안내
             if audio_duration > 600 or audio_size_mb > 20:
-                import math
                 chunk_count = math.ceil(audio_duration / 600)
-                log_output = self.log(f"  📦 긴 오디오 파일 감지 - {chunk_count}개 청크로 분할 처리", log_output)
-                log_output = self.log("  (각 청크별로 처리하므로 시간이 걸릴 수 있습니다)", log_output)
+                self.log(f"  📦 긴 오디오 파일 감지 - {chunk_count}개 청크로 분할 처리", log_lines)
+                self.log("  (각 청크별로 처리하므로 시간이 걸릴 수 있습니다)", log_lines)
             else:
-                log_output = self.log("  (이 단계는 영상 길이에 따라 시간이 걸릴 수 있습니다)", log_output)
+                self.log("  (이 단계는 영상 길이에 따라 시간이 걸릴 수 있습니다)", log_lines)
 
             progress(0.3, desc="음성 인식 중...")
-            yield log_output, None, None, "", "", "", gr.update(interactive=False)
+            yield self.render_log(log_lines), None, None, "", "", "", gr.update(interactive=False)
 
             transcript = self.transcribe_with_whisper(audio_path)
             segments = transcript.segments if hasattr(transcript, 'segments') else []
@@ -2105,8 +3283,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                         "text": seg.text if hasattr(seg, 'text') else ""
                     })
 
-            log_output = self.log(f"  ✓ {len(segments_list)}개 자막 세그먼트 추출됨", log_output)
-            yield log_output, None, None, "", "", "", gr.update(interactive=False)
+            self.log(f"  ✓ {len(segments_list)}개 자막 세그먼트 추출됨", log_lines)
+            yield self.render_log(log_lines), None, None, "", "", "", gr.update(interactive=False)
 
             # 원본 텍스트를 그대로 사용 (사용자가 직접 편집)
             for seg in segments_list:
@@ -2140,76 +3318,76 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
             progress(1.0, desc="준비 완료")
 
-            log_output = self.log("", log_output)
-            log_output = self.log("=" * 50, log_output)
-            log_output = self.log("✅ 자막 추출 완료!", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("오른쪽에서 자막을 직접 수정할 수 있습니다.", log_output)
-            log_output = self.log("수정 완료 후 'Step 2' 버튼을 눌러주세요.", log_output)
-            log_output = self.log("=" * 50, log_output)
+            self.log("", log_lines)
+            self.log("=" * 50, log_lines)
+            self.log("✅ 자막 추출 완료!", log_lines)
+            self.log("", log_lines)
+            self.log("오른쪽에서 자막을 직접 수정할 수 있습니다.", log_lines)
+            self.log("수정 완료 후 'Step 2' 버튼을 눌러주세요.", log_lines)
+            self.log("=" * 50, log_lines)
 
             # 정렬된 영상 경로 반환 (싱크 일치 보장)
             # GPT 교정은 아직 실행 안 됨 - 빈 문자열
             gpt_corrected_textbox = ""
-            yield log_output, str(working_video), str(segments_file), original_textbox, corrected_textbox, gpt_corrected_textbox, gr.update(interactive=True)
+            yield self.render_log(log_lines, full=True), str(working_video), str(segments_file), original_textbox, corrected_textbox, gpt_corrected_textbox, gr.update(interactive=True)
 
         except Exception as e:
             error_str = str(e)
-            import traceback
             traceback.print_exc()
 
             # OpenAI 서버 에러 (500, 502, 503)
             if "500" in error_str or "502" in error_str or "503" in error_str:
-                log_output = self.log("❌ OpenAI 서버 오류가 발생했습니다.", log_output)
-                log_output = self.log("   (3회 재시도 후에도 실패)", log_output)
-                log_output = self.log("", log_output)
-                log_output = self.log("💡 해결 방법:", log_output)
-                log_output = self.log("   1. OpenAI 서버 상태 확인: https://status.openai.com", log_output)
-                log_output = self.log("   2. 잠시 후 다시 시도해주세요", log_output)
-                log_output = self.log("   3. 오디오 파일이 25MB 이하인지 확인", log_output)
+                self.log("❌ OpenAI 서버 오류가 발생했습니다.", log_lines)
+                self.log("   (3회 재시도 후에도 실패)", log_lines)
+                self.log("", log_lines)
+                self.log("💡 해결 방법:", log_lines)
+                self.log("   1. OpenAI 서버 상태 확인: https://status.openai.com", log_lines)
+                self.log("   2. 잠시 후 다시 시도해주세요", log_lines)
+                self.log("   3. 오디오 파일이 25MB 이하인지 확인", log_lines)
             # OpenAI API 키 오류
             elif "api_key" in error_str.lower() or "authentication" in error_str.lower() or "401" in error_str:
-                log_output = self.log("❌ OpenAI API 키 오류", log_output)
-                log_output = self.log("", log_output)
-                log_output = self.log("💡 .env 파일에서 OPENAI_API_KEY를 확인해주세요.", log_output)
+                self.log("❌ OpenAI API 키 오류", log_lines)
+                self.log("", log_lines)
+                self.log("💡 .env 파일에서 OPENAI_API_KEY를 확인해주세요.", log_lines)
             # 파일 크기 제한 오류
             elif "413" in error_str or "too large" in error_str.lower():
-                log_output = self.log("❌ 오디오 파일이 너무 큽니다.", log_output)
-                log_output = self.log("", log_output)
-                log_output = self.log("💡 Whisper API는 25MB 이하 파일만 지원합니다.", log_output)
-                log_output = self.log("   더 짧은 영상을 사용하거나 영상을 분할해주세요.", log_output)
+                self.log("❌ 오디오 파일이 너무 큽니다.", log_lines)
+                self.log("", log_lines)
+                self.log("💡 Whisper API는 25MB 이하 파일만 지원합니다.", log_lines)
+                self.log("   더 짧은 영상을 사용하거나 영상을 분할해주세요.", log_lines)
             # 기타 오류
             else:
-                log_output = self.log(f"❌ 오류: {error_str}", log_output)
+                self.log(f"❌ 오류: {error_str}", log_lines)
 
-            yield log_output, None, None, "", "", "", gr.update(interactive=False)
+            yield self.render_log(log_lines, full=True), None, None, "", "", "", gr.update(interactive=False)
 
     def process_gpt_correction(self, segments_file_state, glossary, previous_log=""):
         """GPT 교정 버튼 클릭 처리"""
-        log_output = previous_log
+        log_prefix = previous_log or ""  # 이전 단계 로그 (yield 시 한 번만 이어 붙임)
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
 
         try:
             if not segments_file_state:
-                log_output = self.log("❌ 먼저 Step 1을 실행하세요.", log_output)
-                return "", log_output
+                self.log("❌ 먼저 Step 1을 실행하세요.", log_lines)
+                return "", log_prefix + self.render_log(log_lines, full=True)
 
             # 세그먼트 로드
             with open(segments_file_state, "r", encoding="utf-8") as f:
                 segments = json.load(f)
 
-            log_output = self.log("", log_output)
-            log_output = self.log("🔧 GPT 자막 교정 중...", log_output)
+            self.log("", log_lines)
+            self.log("🔧 GPT 자막 교정 중...", log_lines)
 
             # GPT 교정 실행
             corrected_segments, error = self.correct_subtitles_with_gpt(segments, glossary)
 
             if error:
-                log_output = self.log(f"  ⚠️ GPT 오류: {error}", log_output)
-                return "", log_output
+                self.log(f"  ⚠️ GPT 오류: {error}", log_lines)
+                return "", log_prefix + self.render_log(log_lines, full=True)
 
             # 교정된 수 카운트
             corrected_count = sum(1 for seg in corrected_segments if seg.get("gpt_corrected", "") != seg.get("text", ""))
-            log_output = self.log(f"  ✓ {corrected_count}개 자막 교정됨", log_output)
+            self.log(f"  ✓ {corrected_count}개 자막 교정됨", log_lines)
 
             # 교정 결과 저장 (Step 2에서 사용)
             corrected_file = Path(segments_file_state).parent / "segments_gpt_corrected.json"
@@ -2223,11 +3401,11 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 text = seg.get("gpt_corrected", seg.get("text", ""))
                 corrected_lines.append(f"{start_str} {text}")
 
-            return "\n".join(corrected_lines), log_output
+            return "\n".join(corrected_lines), log_prefix + self.render_log(log_lines, full=True)
 
         except Exception as e:
-            log_output = self.log(f"❌ GPT 교정 오류: {str(e)}", log_output)
-            return "", log_output
+            self.log(f"❌ GPT 교정 오류: {str(e)}", log_lines)
+            return "", log_prefix + self.render_log(log_lines, full=True)
 
     def process_subtitle_mode_step2(self, video_path_state, segments_file_state, upscale_target, previous_log="",
                                      subtitle_original="", subtitle_editor="", subtitle_corrected="", subtitle_choice="편집",
@@ -2236,19 +3414,19 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         자막 모드 Step 2: 자막 합성 → 오프닝/클로징 추가 → 미리보기 제공
         선택된 자막(원본/편집/교정)을 사용하여 처리
         """
-        import re
 
         # 이전 로그 유지
-        log_output = previous_log if previous_log else ""
-        log_output = self.log("", log_output)
-        log_output = self.log("━" * 50, log_output)
-        log_output = self.log("🎬 Step 2 시작: 자막 합성", log_output)
-        log_output = self.log("━" * 50, log_output)
+        log_prefix = previous_log or ""  # 이전 단계 로그 (yield 시 한 번만 이어 붙임)
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
+        self.log("", log_lines)
+        self.log("━" * 50, log_lines)
+        self.log("🎬 Step 2 시작: 자막 합성", log_lines)
+        self.log("━" * 50, log_lines)
 
         try:
             if not video_path_state or not segments_file_state:
-                log_output = self.log("❌ 먼저 Step 1을 완료해주세요.", log_output)
-                yield log_output, None, gr.update(interactive=False)
+                self.log("❌ 먼저 Step 1을 완료해주세요.", log_lines)
+                yield log_prefix + self.render_log(log_lines, full=True), None, gr.update(interactive=False)
                 return
 
             input_path = Path(video_path_state)
@@ -2264,8 +3442,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 "교정": subtitle_corrected
             }
             selected_text = choice_map.get(subtitle_choice, subtitle_editor)
-            log_output = self.log(f"📝 적용할 자막: [{subtitle_choice}]", log_output)
-            yield log_output, None, gr.update(interactive=False)
+            self.log(f"📝 적용할 자막: [{subtitle_choice}]", log_lines)
+            yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
             # Textbox에서 선택된 자막 파싱하여 적용
             if selected_text and selected_text.strip():
@@ -2285,18 +3463,22 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 with open(segments_file_state, "w", encoding="utf-8") as f:
                     json.dump(segments, f, ensure_ascii=False, indent=2)
 
-                log_output = self.log(f"  ✓ [{subtitle_choice}] 자막 적용 완료", log_output)
-                yield log_output, None, gr.update(interactive=False)
+                self.log(f"  ✓ [{subtitle_choice}] 자막 적용 완료", log_lines)
+                yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
             temp_dir = config.TEMP_DIR / "subtitle_mode"
             ass_path = temp_dir / "subtitles.ass"
             cropped_path = temp_dir / "cropped_video.mp4"
             subtitled_path = temp_dir / "subtitled_video.mp4"
+            # 이전 실행 결과가 최종 출력과 하드링크로 공유될 수 있으므로
+            # FFmpeg가 제자리에서 덮어쓰지 않도록 임시 결과 파일을 먼저 삭제
+            for stale_path in (subtitled_path, temp_dir / "final_with_intro.mp4"):
+                stale_path.unlink(missing_ok=True)
 
             # Step 1: 크롭 및 스케일 적용 (검은 바 제거) - 자막 합성 전에 먼저 수행
-            log_output = self.log("✂️ Step 1: 크롭 및 스케일 적용 중...", log_output)
+            self.log("✂️ Step 1: 크롭 및 스케일 적용 중...", log_lines)
             progress(0.1, desc="크롭 및 스케일 적용 중...")
-            yield log_output, None, gr.update(interactive=False)
+            yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
             renderer = FFmpegRenderer()
             # 자동 감지로 크롭 (영상마다 다른 레이아웃 대응)
@@ -2309,48 +3491,46 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             )
 
             if crop_success and cropped_path.exists():
-                log_output = self.log("  ✓ 크롭 완료 (자동 감지)", log_output)
+                self.log("  ✓ 크롭 완료 (자동 감지)", log_lines)
                 video_for_subtitle = cropped_path
             else:
-                log_output = self.log("  ⚠️ 크롭 스킵 (원본 사용)", log_output)
+                self.log("  ⚠️ 크롭 스킵 (원본 사용)", log_lines)
                 video_for_subtitle = input_path
 
-            yield log_output, None, gr.update(interactive=False)
 
             # Step 2: ASS 자막 생성
-            log_output = self.log("", log_output)
-            log_output = self.log("📝 Step 2: ASS 자막 파일 생성 중...", log_output)
+            self.log("", log_lines)
+            self.log("📝 Step 2: ASS 자막 파일 생성 중...", log_lines)
             progress(0.3, desc="자막 파일 생성 중...")
-            yield log_output, None, gr.update(interactive=False)
+            yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
             self.generate_ass_subtitles(segments, ass_path)
-            log_output = self.log("  ✓ 자막 파일 생성 완료 (페이드 효과 적용)", log_output)
-            yield log_output, None, gr.update(interactive=False)
+            self.log("  ✓ 자막 파일 생성 완료 (페이드 효과 적용)", log_lines)
 
             # Step 3: 자막 합성 (크롭된 영상에 합성)
-            log_output = self.log("", log_output)
-            log_output = self.log("🎬 Step 3: 영상에 자막 합성 중...", log_output)
-            log_output = self.log("  (영상 길이에 따라 시간이 걸립니다)", log_output)
+            self.log("", log_lines)
+            self.log("🎬 Step 3: 영상에 자막 합성 중...", log_lines)
+            self.log("  (영상 길이에 따라 시간이 걸립니다)", log_lines)
             progress(0.5, desc="자막 합성 중...")
-            yield log_output, None, gr.update(interactive=False)
+            yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
             success, msg = self.burn_subtitles_to_video(video_for_subtitle, ass_path, subtitled_path)
 
             if not success:
-                log_output = self.log(f"❌ 자막 합성 실패: {msg}", log_output)
-                yield log_output, None, gr.update(interactive=False)
+                self.log(f"❌ 자막 합성 실패: {msg}", log_lines)
+                yield log_prefix + self.render_log(log_lines, full=True), None, gr.update(interactive=False)
                 return
 
-            log_output = self.log("  ✓ 자막 합성 완료", log_output)
-            yield log_output, None, gr.update(interactive=False)
+            self.log("  ✓ 자막 합성 완료", log_lines)
+            yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
             # Step 4: 오프닝/클로징 합성
             final_video_path = subtitled_path
             if opening_image or closing_image:
-                log_output = self.log("", log_output)
-                log_output = self.log("🎬 Step 4: 오프닝/클로징 합성 중...", log_output)
+                self.log("", log_lines)
+                self.log("🎬 Step 4: 오프닝/클로징 합성 중...", log_lines)
                 progress(0.8, desc="오프닝/클로징 합성 중...")
-                yield log_output, None, gr.update(interactive=False)
+                yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
                 final_video_path = temp_dir / "final_with_intro.mp4"
                 success, msg = self.add_opening_closing(
@@ -2363,15 +3543,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 )
 
                 if success:
-                    log_output = self.log("  ✓ 오프닝/클로징 합성 완료", log_output)
+                    self.log("  ✓ 오프닝/클로징 합성 완료", log_lines)
                 else:
-                    log_output = self.log(f"  ⚠️ 오프닝/클로징 합성 실패: {msg}", log_output)
-                    log_output = self.log("  (자막만 적용된 영상으로 계속합니다)", log_output)
+                    self.log(f"  ⚠️ 오프닝/클로징 합성 실패: {msg}", log_lines)
+                    self.log("  (자막만 적용된 영상으로 계속합니다)", log_lines)
                     final_video_path = subtitled_path
 
-                yield log_output, None, gr.update(interactive=False)
-
-            yield log_output, None, gr.update(interactive=False)
+            yield log_prefix + self.render_log(log_lines), None, gr.update(interactive=False)
 
             # 미리보기 경로 저장
             preview_info = temp_dir / "preview_info.json"
@@ -2383,40 +3561,40 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
             progress(1.0, desc="미리보기 준비 완료")
 
-            log_output = self.log("", log_output)
-            log_output = self.log("=" * 50, log_output)
-            log_output = self.log("✅ 자막 합성 완료! 미리보기를 확인하세요.", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("미리보기 확인 후 '업스케일 및 최종 저장' 버튼을", log_output)
-            log_output = self.log("눌러 최종 영상을 생성하세요.", log_output)
-            log_output = self.log("=" * 50, log_output)
+            self.log("", log_lines)
+            self.log("=" * 50, log_lines)
+            self.log("✅ 자막 합성 완료! 미리보기를 확인하세요.", log_lines)
+            self.log("", log_lines)
+            self.log("미리보기 확인 후 '업스케일 및 최종 저장' 버튼을", log_lines)
+            self.log("눌러 최종 영상을 생성하세요.", log_lines)
+            self.log("=" * 50, log_lines)
 
-            yield log_output, str(final_video_path), gr.update(interactive=True)
+            yield log_prefix + self.render_log(log_lines, full=True), str(final_video_path), gr.update(interactive=True)
 
         except Exception as e:
-            log_output = self.log(f"❌ 오류: {str(e)}", log_output)
-            import traceback
+            self.log(f"❌ 오류: {str(e)}", log_lines)
             traceback.print_exc()
-            yield log_output, None, gr.update(interactive=False)
+            yield log_prefix + self.render_log(log_lines, full=True), None, gr.update(interactive=False)
 
     def process_subtitle_mode_step3(self, upscale_target, previous_log="", progress=gr.Progress()):
         """
         자막 모드 Step 3: 업스케일링 및 최종 저장
         """
         # 이전 로그 유지 (전체 과정 추적 가능)
-        log_output = previous_log if previous_log else ""
-        log_output = self.log("", log_output)
-        log_output = self.log("━" * 50, log_output)
-        log_output = self.log("📈 Step 3 시작: 업스케일 및 최종 저장", log_output)
-        log_output = self.log("━" * 50, log_output)
+        log_prefix = previous_log or ""  # 이전 단계 로그 (yield 시 한 번만 이어 붙임)
+        log_lines = []  # 로그 버퍼 (줄 단위 append, 반환 시 한 번만 join)
+        self.log("", log_lines)
+        self.log("━" * 50, log_lines)
+        self.log("📈 Step 3 시작: 업스케일 및 최종 저장", log_lines)
+        self.log("━" * 50, log_lines)
 
         try:
             temp_dir = config.TEMP_DIR / "subtitle_mode"
             preview_info_path = temp_dir / "preview_info.json"
 
             if not preview_info_path.exists():
-                log_output = self.log("❌ 먼저 자막 합성을 완료해주세요.", log_output)
-                yield log_output, None
+                self.log("❌ 먼저 자막 합성을 완료해주세요.", log_lines)
+                yield log_prefix + self.render_log(log_lines, full=True), None
                 return
 
             with open(preview_info_path, "r", encoding="utf-8") as f:
@@ -2425,49 +3603,47 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             subtitled_path = Path(preview_info["subtitled_path"])
 
             # 출력 파일명 생성
-            import time
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             output_path = config.OUTPUT_DIR / f"subtitled_{timestamp}.mp4"
 
             # 업스케일링
             target_height = int(upscale_target.replace("p", ""))
 
-            log_output = self.log(f"📈 업스케일링: 목표 {upscale_target}...", log_output)
+            self.log(f"📈 업스케일링: 목표 {upscale_target}...", log_lines)
             progress(0.3, desc="업스케일링 중...")
-            yield log_output, None
+            yield log_prefix + self.render_log(log_lines), None
 
             success, msg = self.upscale_video(subtitled_path, output_path, target_height)
 
             if not success:
-                log_output = self.log(f"❌ 업스케일 실패: {msg}", log_output)
-                yield log_output, None
+                self.log(f"❌ 업스케일 실패: {msg}", log_lines)
+                yield log_prefix + self.render_log(log_lines, full=True), None
                 return
 
-            log_output = self.log(f"  ✓ {msg}", log_output)
+            self.log(f"  ✓ {msg}", log_lines)
 
             # 파일 크기
             output_size = output_path.stat().st_size / (1024 * 1024)
 
             progress(1.0, desc="완료!")
 
-            log_output = self.log("", log_output)
-            log_output = self.log("=" * 50, log_output)
-            log_output = self.log("🎉 최종 영상 생성 완료!", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log(f"  • 출력 파일: {output_path.name}", log_output)
-            log_output = self.log(f"  • 파일 크기: {output_size:.1f} MB", log_output)
-            log_output = self.log(f"  • 해상도: {upscale_target}", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("Windows Media Player에서도 재생됩니다!", log_output)
-            log_output = self.log("=" * 50, log_output)
+            self.log("", log_lines)
+            self.log("=" * 50, log_lines)
+            self.log("🎉 최종 영상 생성 완료!", log_lines)
+            self.log("", log_lines)
+            self.log(f"  • 출력 파일: {output_path.name}", log_lines)
+            self.log(f"  • 파일 크기: {output_size:.1f} MB", log_lines)
+            self.log(f"  • 해상도: {upscale_target}", log_lines)
+            self.log("", log_lines)
+            self.log("Windows Media Player에서도 재생됩니다!", log_lines)
+            self.log("=" * 50, log_lines)
 
-            yield log_output, str(output_path)
+            yield log_prefix + self.render_log(log_lines, full=True), str(output_path)
 
         except Exception as e:
-            log_output = self.log(f"❌ 오류: {str(e)}", log_output)
-            import traceback
+            self.log(f"❌ 오류: {str(e)}", log_lines)
             traceback.print_exc()
-            yield log_output, None
+            yield log_prefix + self.render_log(log_lines, full=True), None
 
     def convert_ppt_to_video_router(
         self,
@@ -2487,6 +3663,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         transition_duration,
         video_quality,
         encoding_speed,
+        video_codec=None,
         progress=gr.Progress()
     ):
         """
@@ -2551,6 +3728,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 transition_duration=transition_duration,
                 video_quality=video_quality,
                 encoding_speed=encoding_speed,
+                video_codec=video_codec,
                 progress=progress
             ):
                 # 기존 모드는 (log, video, scripts) 반환 -> (log, video, None, None, scripts)로 확장
@@ -2561,6 +3739,89 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 else:
                     yield result, None, None, None, ""
 
+    def _hash_file(self, file_path, chunk_size=1 << 20):
+        """파일 내용을 청크 단위로 읽어 sha256 해시 객체 반환"""
+        hasher = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                hasher.update(chunk)
+        return hasher
+
+    def _ingest_upload(self, src, dst, chunk_size=4 << 20):
+        """
+        업로드 파일을 입력 디렉토리로 가져오면서 sha256 해시 계산
+
+        같은 파일시스템이면 하드링크로 데이터 복사 없이 가져오고,
+        아니면 청크 단위로 복사하면서 동시에 해시를 계산 (파일을 두 번 읽지 않음)
+
+        Returns:
+            sha256 해시 객체 (결과 캐시 키로 재사용)
+        """
+        src, dst = Path(src), Path(dst)
+        if src.resolve() == dst.resolve():
+            return self._hash_file(dst)
+
+        if dst.exists():
+            dst.unlink()
+        try:
+            os.link(src, dst)
+            return self._hash_file(dst)
+        except OSError:
+            hasher = hashlib.sha256()
+            with open(src, 'rb') as fi, open(dst, 'wb') as fo:
+                while chunk := fi.read(chunk_size):
+                    hasher.update(chunk)
+                    fo.write(chunk)
+            shutil.copystat(src, dst)
+            return hasher
+
+    def _link_or_copy(self, src, dst):
+        """같은 파일시스템이면 하드링크, 아니면 복사 (기존 대상 파일은 교체)"""
+        src, dst = Path(src), Path(dst)
+        if dst.exists():
+            dst.unlink()
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    def _result_cache_paths(self, file_hash, options):
+        """
+        결과 캐시 경로 계산
+
+        Args:
+            file_hash: 업로드 파일의 sha256 해시 객체
+            options: 결과 영상에 영향을 주는 설정값 튜플 (음성, 해상도 등)
+
+        Returns:
+            (캐시 영상 경로, 캐시 대본 경로)
+        """
+        hasher = file_hash.copy()
+        for option in options:
+            hasher.update(b"\0")
+            hasher.update(str(option).encode("utf-8"))
+        key = hasher.hexdigest()[:16]
+        cache_video = config.OUTPUT_DIR / f"cache_{key}.mp4"
+        return cache_video, cache_video.with_suffix(".txt")
+
+    def _store_result_cache(self, final_video, cache_video, cache_scripts, scripts_formatted):
+        """완성된 영상을 캐시에 등록하고 오래된 캐시 정리"""
+        try:
+            self._link_or_copy(final_video, cache_video)
+            cache_scripts.write_text(scripts_formatted, encoding="utf-8")
+
+            # LRU 정리: 최근 사용(mtime) 순으로 RESULT_CACHE_MAX_ENTRIES개만 유지
+            cached = sorted(
+                config.OUTPUT_DIR.glob("cache_*.mp4"),
+                key=lambda p: p.stat().st_mtime,
+                reverse=True
+            )
+            for old in cached[RESULT_CACHE_MAX_ENTRIES:]:
+                old.unlink(missing_ok=True)
+                old.with_suffix(".txt").unlink(missing_ok=True)
+        except OSError as e:
+            print(f"⚠️  결과 캐시 저장 실패: {e}")
+
     def convert_ppt_to_video(
         self,
         pptx_file,
@@ -2577,6 +3838,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         transition_duration,
         video_quality,
         encoding_speed,
+        video_codec=None,
         progress=gr.Progress()
     ):
         """
@@ -2586,37 +3848,34 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             total_duration_minutes: 전체 영상 목표 길이 (분)
             enable_text_animation: 텍스트 애니메이션 사용 여부
         """
-        log_output = ""
+        log_lines = []  # 로그 버퍼 (줄 단위 append, yield 시에만 join)
         scripts_formatted = ""  # 대본 표시용
+        ocr_executor, ocr_futures = None, {}  # 슬라이드 OCR 프로세스 풀 (finally에서 정리)
 
         try:
             # 의존성 체크
-            log_output = self.log("🔍 시스템 의존성 체크 중...", log_output)
+            self.log("🔍 시스템 의존성 체크 중...", log_lines)
             issues = self.check_dependencies()
 
             if issues:
                 for issue in issues:
-                    log_output = self.log(issue, log_output)
-                log_output = self.log("", log_output)
-                log_output = self.log("⚠️  일부 기능이 제한될 수 있습니다", log_output)
-                log_output = self.log("", log_output)
-                yield log_output, None, scripts_formatted
+                    self.log(issue, log_lines)
+                self.log("", log_lines)
+                self.log("⚠️  일부 기능이 제한될 수 있습니다", log_lines)
+                self.log("", log_lines)
+                yield self.render_log(log_lines), None, scripts_formatted
             else:
-                log_output = self.log("✅ 모든 의존성이 정상입니다", log_output)
-                log_output = self.log("", log_output)
-                yield log_output, None, scripts_formatted
+                self.log("✅ 모든 의존성이 정상입니다", log_lines)
+                self.log("", log_lines)
+                yield self.render_log(log_lines), None, scripts_formatted
 
             if pptx_file is None:
-                log_output = self.log("❌ PPT 파일을 업로드해주세요.", log_output)
-                yield log_output, None, scripts_formatted
+                self.log("❌ PPT 파일을 업로드해주세요.", log_lines)
+                yield self.render_log(log_lines, full=True), None, scripts_formatted
                 return
 
-            if not output_name or output_name.strip() == "":
-                output_name = "output_video"
-
-            # 파일명 정리
-            output_name = "".join(c for c in output_name if c.isalnum() or c in (' ', '_', '-'))
-            output_name = output_name.strip().replace(' ', '_')
+            # 파일명 정리 (정리 후 비어 있으면 기본 이름 사용)
+            output_name = _sanitize_output_name(output_name)
 
             # 영상 길이를 숫자로 변환
             try:
@@ -2624,75 +3883,103 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             except (ValueError, TypeError):
                 total_duration_minutes = 5.0  # 기본값
 
-            # 업로드된 파일 복사
+            # 업로드된 파일 가져오기 (하드링크 우선, 해시는 결과 캐시에서 재사용)
             pptx_path = config.INPUT_DIR / Path(pptx_file.name).name
-            shutil.copy(pptx_file.name, pptx_path)
+            pptx_hash = self._ingest_upload(pptx_file.name, pptx_path)
 
             # 해상도 파싱
-            width, height = map(int, resolution_choice.split('x'))
+            width, height = _parse_resolution(resolution_choice)
 
             # 출력 경로 설정
-            slides_json = config.META_DIR / "slides.json"
-            scripts_json = config.META_DIR / "scripts.json"
-            audio_meta_json = config.META_DIR / "audio_meta.json"
+            slides_json = self.slides_json
+            scripts_json = self.scripts_json
+            audio_meta_json = self.audio_meta_json
             final_video = config.OUTPUT_DIR / f"{output_name}.mp4"
 
+            # 결과 캐시 확인 (같은 파일 + 같은 설정이면 이전 결과 재사용)
+            cache_video, cache_scripts = self._result_cache_paths(
+                pptx_hash,
+                (voice_choice, resolution_choice, custom_request, total_duration_minutes,
+                 enable_keyword_marking, keyword_mark_style, enable_subtitles, subtitle_font_size,
+                 transition_effect, transition_duration, video_quality, encoding_speed, video_codec)
+            )
+            if cache_video.exists():
+                os.utime(cache_video)  # LRU 갱신
+                self._link_or_copy(cache_video, final_video)
+                if cache_scripts.exists():
+                    scripts_formatted = cache_scripts.read_text(encoding="utf-8")
+                progress(1.0, desc="완료! (캐시)")
+                self.log("⚡ 캐시 히트! 동일한 파일/설정으로 만든 영상을 재사용합니다", log_lines)
+                self.log(f"  • 출력 파일: {final_video.name}", log_lines)
+                yield self.render_log(log_lines, full=True), str(final_video), scripts_formatted
+                return
+
             # ===== STEP 1: 파일 파싱 (PPT/PDF) =====
             file_ext = pptx_path.suffix.lower()
             file_type = "PDF" if file_ext == ".pdf" else "PPT"
 
             progress(0.05, desc=f"{file_type} 파싱 중...")
-            log_output = self.log("", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log(f"📄 STEP 1: {file_type} 파싱", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
+            self.log("", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log(f"📄 STEP 1: {file_type} 파싱", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
+
+            # PPT → 이미지 변환 (PPTX만 해당)
+            # LibreOffice 변환은 오래 걸리는 외부 프로세스라 백그라운드에서 먼저 시작하고,
+            # 텍스트 파싱과 맥락 분석(STEP 2)을 진행한 뒤 슬라이드 이미지가 필요한 시점에 기다림
+            image_future = None
+            image_executor = None
+            if file_ext == ".pptx":
+                image_executor = ThreadPoolExecutor(max_workers=1)
+                image_future = image_executor.submit(convert_pptx_to_images, pptx_path, config.SLIDES_IMG_DIR)
+                self.log("🖼️  PPT → PNG 이미지 변환 시작 (백그라운드)", log_lines)
 
             # 파일 확장자에 따라 적절한 Parser 선택
             if file_ext == ".pdf":
                 # PDF 파일 처리
                 parser = PDFParser(str(pptx_path))
-                slides = parser.parse(slides_json, config.SLIDES_IMG_DIR)
+                # 영상 해상도로 바로 렌더링 (렌더링 단계에서 다시 스케일할 필요 없음)
+                slides = parser.parse(slides_json, config.SLIDES_IMG_DIR, width, height)
                 self.current_pdf_path = str(pptx_path)  # 키워드 마킹용 PDF 경로 저장
-                log_output = self.log(f"✅ PDF 파싱 완료: {len(slides)}개 페이지", log_output)
+                self.log(f"✅ PDF 파싱 완료: {len(slides)}개 페이지", log_lines)
             else:
                 # PPTX 파일 처리
                 parser = PPTParser(str(pptx_path))
                 slides = parser.parse(slides_json, config.SLIDES_IMG_DIR)
                 self.current_pdf_path = None  # PPT는 PDF 경로 없음
-                log_output = self.log(f"✅ PPT 파싱 완료: {len(slides)}개 슬라이드", log_output)
+                self.log(f"✅ PPT 파싱 완료: {len(slides)}개 슬라이드", log_lines)
 
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
 
-            # PPT → 이미지 변환 (PPTX만 해당)
-            if file_ext == ".pptx":
-                progress(0.1, desc="PPT → 이미지 변환 중...")
-                log_output = self.log("🖼️  PPT → PNG 이미지 변환 중...", log_output)
-                yield log_output, None, scripts_formatted
+            # ===== STEP 2: 전체 맥락 분석 (이미지 변환과 동시에 진행) =====
+            progress(0.15, desc="전체 맥락 분석 중...")
+            context_analysis, context_log = self.analyze_ppt_context(slides, progress)
+            self.log(context_log.rstrip("\n"), log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
 
+            # 슬라이드 이미지가 필요한 대본 생성(OCR/키워드 마킹) 전에 변환 완료 대기
+            if image_future is not None:
+                progress(0.18, desc="PPT → 이미지 변환 마무리 중...")
                 try:
-                    convert_pptx_to_images(pptx_path, config.SLIDES_IMG_DIR)
-                    log_output = self.log("✅ 이미지 변환 완료", log_output)
+                    self._wait_with_progress(image_future, progress, 0.18, "PPT → 이미지 변환 마무리 중...")
+                    self.log("✅ 이미지 변환 완료", log_lines)
                 except Exception as e:
-                    log_output = self.log(f"⚠️  이미지 변환 실패: {str(e)}", log_output)
-                    log_output = self.log("", log_output)
-                    log_output = self.log("💡 해결 방법:", log_output)
-                    log_output = self.log("  1. LibreOffice를 설치하세요", log_output)
-                    log_output = self.log("     https://www.libreoffice.org/download/download/", log_output)
-                    yield log_output, None, scripts_formatted
+                    self.log(f"⚠️  이미지 변환 실패: {str(e)}", log_lines)
+                    self.log("", log_lines)
+                    self.log("💡 해결 방법:", log_lines)
+                    self.log("  1. LibreOffice를 설치하세요", log_lines)
+                    self.log("     https://www.libreoffice.org/download/download/", log_lines)
+                finally:
+                    image_executor.shutdown()
             else:
                 # PDF는 이미 파싱 단계에서 이미지로 변환됨
-                log_output = self.log("✅ PDF는 이미 이미지로 변환됨", log_output)
+                self.log("✅ PDF는 이미 이미지로 변환됨", log_lines)
 
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
-
-            # ===== STEP 2: 전체 맥락 분석 =====
-            progress(0.15, desc="전체 맥락 분석 중...")
-            context_analysis, log_output = self.analyze_ppt_context(slides, progress)
-            yield log_output, None, scripts_formatted
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
 
             # 각 슬라이드당 시간 계산 (TTS pause_duration 고려)
             PAUSE_DURATION = 0.7  # TTS에서 슬라이드당 추가되는 무음 시간
@@ -2701,22 +3988,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             speech_duration = total_duration_seconds - pause_total  # 실제 대본 시간
             slides_per_duration = speech_duration / len(slides)  # 슬라이드당 대본 시간
 
-            log_output = self.log("", log_output)
-            log_output = self.log("⏱️  영상 시간 계획:", log_output)
-            log_output = self.log(f"  - 전체 목표 시간: {total_duration_minutes}분 ({total_duration_seconds}초)", log_output)
-            log_output = self.log(f"  - 슬라이드 수: {len(slides)}개", log_output)
-            log_output = self.log(f"  - 슬라이드 간 무음: {PAUSE_DURATION}초 × {len(slides)} = {pause_total:.1f}초", log_output)
-            log_output = self.log(f"  - 슬라이드당 대본 시간: {slides_per_duration:.1f}초", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
+            self.log("", log_lines)
+            self.log("⏱️  영상 시간 계획:", log_lines)
+            self.log(f"  - 전체 목표 시간: {total_duration_minutes}분 ({total_duration_seconds}초)", log_lines)
+            self.log(f"  - 슬라이드 수: {len(slides)}개", log_lines)
+            self.log(f"  - 슬라이드 간 무음: {PAUSE_DURATION}초 × {len(slides)} = {pause_total:.1f}초", log_lines)
+            self.log(f"  - 슬라이드당 대본 시간: {slides_per_duration:.1f}초", log_lines)
+            self.log("", log_lines)
 
             # ===== STEP 3: AI 대본 생성 (상세 버전) =====
             progress(0.2, desc="AI 대본 생성 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("🤖 STEP 2: AI 대본 생성 (Claude 사고 과정 포함)", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("🤖 STEP 2: AI 대본 생성 (Claude 사고 과정 포함)", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
 
             scripts_data = []
 
@@ -2725,23 +4011,69 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             if hasattr(self, 'current_pdf_path'):
                 pdf_file_path = self.current_pdf_path
 
+            # 슬라이드 OCR을 프로세스 풀에서 미리 시작 (아래 Claude 요청과 동시에 진행)
+            needs_ocr = (enable_keyword_marking and pdf_file_path is None) or bool(self.parse_arrow_pointers(custom_request))
+            ocr_executor, ocr_futures = self._submit_slide_ocr(slides, needs_ocr, log_lines)
+
+            # 배치 모드: 여러 슬라이드 대본을 한 번의 요청으로 미리 받아둠
+            # (응답에서 누락된 슬라이드는 아래 슬라이드별 처리에서 단건 요청으로 보완)
+            batch_responses = {}  # {슬라이드 번호: 응답 텍스트}
+
+            # Message Batches API: 전체 슬라이드를 하나의 배치 작업으로 제출하고 완료까지 폴링
+            if config.LLM_USE_BATCH_API and len(slides) >= config.LLM_BATCH_API_MIN_SLIDES:
+                for _ in self._run_message_batch(
+                    slides, context_analysis, slides_per_duration, custom_request, progress, log_lines, batch_responses
+                ):
+                    yield self.render_log(log_lines), None, scripts_formatted
+
+            # 슬라이드/배치 완료 로그는 0.2초 간격으로 묶어서 화면에 보냄
+            should_yield = self._throttle_yield()
+
+            # Message Batches API 결과가 없으면 묶음 요청을 스트리밍으로 시작 (슬라이드 블록 도착 즉시 처리)
+            streamed_responses = {}  # {슬라이드 번호: Future(응답 블록 텍스트 또는 None)}
+            if not batch_responses:
+                streamed_responses = self._submit_script_batches(
+                    slides, context_analysis, slides_per_duration, custom_request, log_lines
+                )
+                if streamed_responses:
+                    yield self.render_log(log_lines), None, scripts_formatted
+
+            # 대본-TTS 파이프라인: 슬라이드 대본이 나오는 즉시 TTS를 시작해
+            # 대본 생성(Claude)과 음성 합성(OpenAI)이 겹쳐서 진행되도록 함
+            tts = self._get_tts_client(voice_choice)
+            tts_executor = ThreadPoolExecutor(max_workers=config.TTS_CONCURRENCY)
+            tts_futures = {}  # {Future: 스크립트 딕셔너리}
+
             # 병렬 처리를 위한 스레드 안전 변수들
             results_lock = threading.Lock()
             completed_count = [0]  # 리스트로 감싸서 클로저에서 수정 가능하게
             all_results = {}  # {slide_index: result_dict}
             all_logs = {}  # {slide_index: log_string}
 
+            # 완성된 대본을 한 줄씩 바로 기록 (중단되더라도 그때까지의 대본이 남음, 완료 후 scripts.json으로 대체)
+            partial_scripts_path = scripts_json.with_name("scripts.partial.ndjson")
+
             def process_slide(slide_info):
                 """개별 슬라이드 처리 함수 (스레드에서 실행)"""
                 i, slide = slide_info
                 slide_image_path = config.SLIDES_IMG_DIR / f"slide_{slide['index']:03d}.png"
 
-                # 각 스레드가 자체 KeywordMarker 인스턴스 생성 (스레드 안전)
-                thread_marker = KeywordMarker(use_ocr=True)
-
                 # 스레드별 독립 로그
                 thread_log = ""
 
+                # 프로세스 풀에서 미리 돌린 OCR 결과 (실패하면 None → 스레드에서 직접 OCR)
+                ocr_boxes = None
+                if i in ocr_futures:
+                    try:
+                        ocr_boxes = ocr_futures[i].result()
+                    except Exception as e:
+                        print(f"⚠️  슬라이드 {i + 1} OCR 프로세스 실패: {e}")
+
+                # 배치 응답 스트림에서 이 슬라이드 블록이 끝날 때까지 대기 (실패/누락이면 None → 개별 요청)
+                response_text = batch_responses.get(i + 1)
+                if response_text is None and (i + 1) in streamed_responses:
+                    response_text = streamed_responses[i + 1].result()
+
                 script, keywords, keyword_overlays, highlight, arrow_pointers, thread_log = self.generate_script_with_thinking(
                     slide,
                     context_analysis,
@@ -2756,7 +4088,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     page_num=i,
                     enable_keyword_marking=enable_keyword_marking,
                     keyword_mark_style=keyword_mark_style,
-                    keyword_marker=thread_marker
+                    response_text=response_text,
+                    ocr_boxes=ocr_boxes
                 )
 
                 result = {
@@ -2768,61 +4101,72 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     "arrow_pointers": arrow_pointers
                 }
 
+                # 대본이 준비됐으므로 바로 TTS 제출 (나머지 슬라이드 대본 생성과 동시 진행)
+                tts_future = tts.submit_audio(tts_executor, result, config.AUDIO_DIR, audio_meta_json)
+
                 # 스레드 안전하게 결과 저장
                 with results_lock:
                     all_results[i] = result
                     all_logs[i] = thread_log
+                    tts_futures[tts_future] = result
                     completed_count[0] += 1
+                    _append_ndjson(partial_scripts_file, result)
 
                 return i, result
 
-            # 병렬 처리 (최대 4개 워커)
-            max_workers = min(4, len(slides))
-            log_output = self.log(f"⚡ 병렬 처리 시작 (워커: {max_workers}개, 슬라이드: {len(slides)}개)", log_output)
-            yield log_output, None, scripts_formatted
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # 모든 슬라이드 처리 작업 제출
-                futures = {
-                    executor.submit(process_slide, (i, slide)): i
-                    for i, slide in enumerate(slides)
-                }
-
-                # 완료되는 순서대로 진행상황 업데이트
-                for future in as_completed(futures):
-                    slide_idx, result = future.result()
-                    progress_pct = 0.2 + (0.4 * completed_count[0] / len(slides))
-                    progress(progress_pct, desc=f"대본 생성 중... ({completed_count[0]}/{len(slides)})")
-                    log_output = self.log(f"  ✓ 슬라이드 {slide_idx + 1} 완료", log_output)
-                    yield log_output, None, scripts_formatted
+            # 병렬 처리 (동시 요청 수는 config.LLM_CONCURRENCY로 제한)
+            max_workers = min(config.LLM_CONCURRENCY, len(slides))
+            self.log(f"⚡ 병렬 처리 시작 (워커: {max_workers}개, 슬라이드: {len(slides)}개)", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
+
+            update_progress = self._throttle_progress(progress)
+            with open(partial_scripts_path, 'wb') as partial_scripts_file:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # 모든 슬라이드 처리 작업 제출
+                    futures = {
+                        executor.submit(process_slide, (i, slide)): i
+                        for i, slide in enumerate(slides)
+                    }
+
+                    # 완료되는 순서대로 진행상황 업데이트 (진행률 전송은 초당 최대 10회)
+                    for future in as_completed(futures):
+                        slide_idx, result = future.result()
+                        progress_pct = 0.2 + (0.4 * completed_count[0] / len(slides))
+                        update_progress(progress_pct, desc=f"대본 생성 중... ({completed_count[0]}/{len(slides)})",
+                                        force=completed_count[0] == len(slides))
+                        self.log(f"  ✓ 슬라이드 {slide_idx + 1} 완료", log_lines)
+                        if should_yield():
+                            yield self.render_log(log_lines), None, scripts_formatted
+
+            # 모든 슬라이드가 OCR 결과를 받아갔으므로 워커 프로세스 종료
+            self._shutdown_slide_ocr(ocr_executor, ocr_futures)
 
             # 결과를 슬라이드 순서대로 정렬하여 scripts_data에 추가
             for i in range(len(slides)):
                 scripts_data.append(all_results[i])
 
             # 모든 로그 병합 (슬라이드 순서대로)
-            log_output = self.log("", log_output)
-            log_output = self.log("📋 상세 처리 로그:", log_output)
+            self.log("", log_lines)
+            self.log("📋 상세 처리 로그:", log_lines)
             for i in range(len(slides)):
                 if i in all_logs and all_logs[i]:
-                    log_output = self.log(all_logs[i], log_output)
-            yield log_output, None, scripts_formatted
+                    self.log(all_logs[i], log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
 
-            # 대본 저장
-            with open(scripts_json, 'w', encoding='utf-8') as f:
-                json.dump(scripts_data, f, ensure_ascii=False, indent=2)
+            # 대본 저장 (전체 저장이 끝났으므로 중간 기록 파일은 삭제)
+            _write_json(scripts_json, scripts_data)
+            partial_scripts_path.unlink(missing_ok=True)
 
-            log_output = self.log("", log_output)
-            log_output = self.log(f"💾 대본 저장 완료: {scripts_json}", log_output)
-            log_output = self.log(f"  - 총 {len(scripts_data)}개 대본 저장", log_output)
+            self.log("", log_lines)
+            self.log(f"💾 대본 저장 완료: {scripts_json}", log_lines)
+            self.log(f"  - 총 {len(scripts_data)}개 대본 저장", log_lines)
             # 첫 번째 대본 미리보기 (TTS가 실제로 읽을 내용)
             if scripts_data:
-                first_script_preview = scripts_data[0]["script"][:80]
-                log_output = self.log(f"  - 첫 번째 대본: {first_script_preview}...", log_output)
+                self.log(f"  - 첫 번째 대본: {_preview(scripts_data[0]['script'], 80)}", log_lines)
                 first_keywords = scripts_data[0].get("keywords", [])
                 if first_keywords:
-                    log_output = self.log(f"  - 첫 번째 키워드: {[k['text'] for k in first_keywords]}", log_output)
-            log_output = self.log("", log_output)
+                    self.log(f"  - 첫 번째 키워드: {[k['text'] for k in first_keywords]}", log_lines)
+            self.log("", log_lines)
 
             # 대본 포맷팅 (UI 표시용)
             scripts_formatted = ""
@@ -2830,34 +4174,41 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 scripts_formatted += f"━━━ 슬라이드 {i+1} ━━━\n"
                 scripts_formatted += f"{script_item.get('script', '')}\n\n"
 
-            yield log_output, None, scripts_formatted, scripts_formatted
+            yield self.render_log(log_lines), None, scripts_formatted, scripts_formatted
 
             # ===== STEP 4: TTS 생성 =====
             progress(0.6, desc="TTS 음성 생성 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log(f"🔊 STEP 3: TTS 음성 생성 (음성: {voice_choice})", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
-
-            tts = TTSClient(
-                provider=config.TTS_PROVIDER,
-                api_key=config.OPENAI_API_KEY,
-                voice=voice_choice
-            )
-
-            audio_meta = tts.generate_audio(
-                scripts_json,
-                config.AUDIO_DIR,
-                audio_meta_json
-            )
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log(f"🔊 STEP 3: TTS 음성 생성 (음성: {voice_choice})", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
+
+            # 화살표 마커 제거는 오디오와 무관하므로 TTS 결과를 기다리는 동안 백그라운드에서 진행
+            marker_executor = ThreadPoolExecutor(max_workers=1)
+            marker_future = marker_executor.submit(_remove_arrow_markers, scripts_data, config.SLIDES_IMG_DIR)
+            marker_executor.shutdown(wait=False)
+
+            # 대본 생성 중에 이미 제출된 TTS 결과를 모음 (남은 작업만 기다리며 슬라이드별로 진행 표시)
+            audio_meta = []
+            for audio_info in tts.iter_audio(tts_futures):
+                audio_meta.append(audio_info)
+                status = "⚠️ 실패 (기본 길이 사용)" if audio_info.get("error") else f"{audio_info['duration']:.1f}초"
+                self.log(f"  🔊 슬라이드 {audio_info['index']} 음성 완료: {status}", log_lines)
+                update_progress(0.6 + 0.1 * len(audio_meta) / len(tts_futures),
+                                desc=f"TTS 음성 생성 중... ({len(audio_meta)}/{len(tts_futures)})",
+                                force=len(audio_meta) == len(tts_futures))
+                if should_yield():
+                    yield self.render_log(log_lines), None, scripts_formatted
+            audio_meta = tts.save_audio_meta(audio_meta, audio_meta_json)
+            tts_executor.shutdown()
 
             total_duration = sum(item['duration'] for item in audio_meta)
-            log_output = self.log(f"✅ TTS 생성 완료: {len(audio_meta)}개 오디오 ({total_duration:.1f}초)", log_output)
-            log_output = self.log("", log_output)
+            self.log(f"✅ TTS 생성 완료: {len(audio_meta)}개 오디오 ({total_duration:.1f}초)", log_lines)
+            self.log("", log_lines)
 
             # TTS 생성 후 키워드 타이밍을 실제 TTS 길이로 재조정
-            log_output = self.log("⏱️  키워드 타이밍 재조정 (실제 TTS 길이 기준):", log_output)
+            self.log("⏱️  키워드 타이밍 재조정 (실제 TTS 길이 기준):", log_lines)
             timing_adjusted = False
             for i, script_item in enumerate(scripts_data):
                 if i >= len(audio_meta):
@@ -2877,54 +4228,33 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 # 항상 실제 TTS 길이를 기준으로 재계산 (더 정확)
                 if abs(actual_duration - estimated_duration) > 1.0:  # 1초 이상 차이
                     timing_adjusted = True
-                    log_output = self.log(f"  슬라이드 {i+1}: 예상 {estimated_duration:.1f}초 → 실제 {actual_duration:.1f}초", log_output)
-
-                    # 키워드 타이밍 재계산 (실제 TTS 길이 기반)
-                    for kw_overlay in keyword_overlays:
-                        if not kw_overlay.get('found'):
-                            continue
-
-                        keyword_text = kw_overlay['keyword']
-                        old_timing = kw_overlay['timing']
-
-                        # 대본에서 키워드 위치 찾기 (글자 수 기반)
-                        keyword_pos = script_text.find(keyword_text)
-                        if keyword_pos >= 0:
-                            # 글자 수 기반 타이밍 계산 (실제 TTS 길이 사용)
-                            total_chars = len(script_text)
-                            chars_before = keyword_pos
-
-                            # 글자 비율로 타이밍 계산
-                            char_ratio = chars_before / max(total_chars, 1)
-                            new_timing = char_ratio * actual_duration
+                    self.log(f"  슬라이드 {i+1}: 예상 {estimated_duration:.1f}초 → 실제 {actual_duration:.1f}초", log_lines)
 
-                            # TTS가 해당 단어를 말한 직후 마킹 표시 (0.5초 딜레이)
-                            MARKING_DELAY = 0.5
-                            new_timing = new_timing + MARKING_DELAY
-
-                            # 타이밍 업데이트
-                            kw_overlay['timing'] = new_timing
-                            log_output = self.log(f"    - '{keyword_text}': {old_timing:.1f}초 → {new_timing:.1f}초 (글자 {chars_before}/{total_chars})", log_output)
+                    # 키워드 타이밍 재계산 (실제 TTS 길이 기반, 글자 위치 비례)
+                    total_chars = len(script_text)
+                    for keyword_text, old_timing, new_timing, chars_before in _retime_keyword_overlays(
+                        script_text, keyword_overlays, actual_duration
+                    ):
+                        self.log(f"    - '{keyword_text}': {old_timing:.1f}초 → {new_timing:.1f}초 (글자 {chars_before}/{total_chars})", log_lines)
 
             if timing_adjusted:
                 # 재조정된 타이밍으로 scripts.json 업데이트
-                with open(scripts_json, 'w', encoding='utf-8') as f:
-                    json.dump(scripts_data, f, ensure_ascii=False, indent=2)
-                log_output = self.log(f"  ✓ 타이밍 재조정 완료 및 저장", log_output)
+                _write_json(scripts_json, scripts_data)
+                self.log(f"  ✓ 타이밍 재조정 완료 및 저장", log_lines)
             else:
-                log_output = self.log(f"  ✓ 타이밍 조정 불필요 (예상과 실제 길이 유사)", log_output)
+                self.log(f"  ✓ 타이밍 조정 불필요 (예상과 실제 길이 유사)", log_lines)
 
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
 
             # ===== STEP 4.5: 자막 생성 (선택적) =====
             subtitle_file = None
             if enable_subtitles:
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                log_output = self.log("📝 자막 생성 중...", log_output)
-                log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-                log_output = self.log("", log_output)
-                yield log_output, None, scripts_formatted
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                self.log("📝 자막 생성 중...", log_lines)
+                self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+                self.log("", log_lines)
+                yield self.render_log(log_lines), None, scripts_formatted
 
                 try:
                     subtitle_generator = SubtitleGenerator()
@@ -2935,101 +4265,44 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     # - 비디오와 오디오 모두 crossfade로 겹침
                     # - 각 클립이 transition_duration만큼 겹침
                     # - 자막도 이에 맞춰 타이밍 조정 필요
-                    subtitle_data = []
-                    current_time = 0.0
-
-                    for i, item in enumerate(audio_meta):
-                        clip_duration = item.get("duration", 0.0)
-
-                        # 전환 효과로 인한 실제 duration 조정
-                        # 첫 번째 클립은 뒷부분만, 마지막 클립은 앞부분만, 중간은 양쪽 다 겹침
-                        if transition_effect != "none" and transition_duration > 0:
-                            if i == 0:
-                                # 첫 번째: 뒷부분 절반만 겹침
-                                effective_duration = clip_duration - (transition_duration / 2)
-                            elif i == len(audio_meta) - 1:
-                                # 마지막: 앞부분 절반만 겹침
-                                effective_duration = clip_duration - (transition_duration / 2)
-                            else:
-                                # 중간: 양쪽 다 겹침
-                                effective_duration = clip_duration - transition_duration
-                        else:
-                            effective_duration = clip_duration
-
-                        subtitle_data.append({
-                            "script": item.get("script", ""),
-                            "start_time": current_time,
-                            "duration": max(0.5, effective_duration)  # 최소 0.5초
-                        })
-
-                        # 다음 자막 시작 시간 계산
-                        if transition_effect != "none" and transition_duration > 0 and i < len(audio_meta) - 1:
-                            # 전환 효과: 겹치는 부분 제외
-                            current_time += clip_duration - transition_duration
-                        else:
-                            current_time += clip_duration
+                    subtitle_data = _build_subtitle_timeline(audio_meta, transition_effect, transition_duration)
 
                     success = subtitle_generator.generate_srt(subtitle_data, subtitle_file)
 
                     if success:
-                        log_output = self.log(f"✅ 자막 생성 완료: {subtitle_file.name}", log_output)
+                        self.log(f"✅ 자막 생성 완료: {subtitle_file.name}", log_lines)
                         # 자막 데이터 통계 출력
                         total_subtitle_chars = sum(len(item.get("script", "")) for item in subtitle_data)
-                        log_output = self.log(f"  - 슬라이드 수: {len(subtitle_data)}개", log_output)
-                        log_output = self.log(f"  - 총 글자 수: {total_subtitle_chars}자", log_output)
+                        self.log(f"  - 슬라이드 수: {len(subtitle_data)}개", log_lines)
+                        self.log(f"  - 총 글자 수: {total_subtitle_chars}자", log_lines)
                     else:
-                        log_output = self.log("⚠️  자막 생성 실패, 자막 없이 진행합니다", log_output)
+                        self.log("⚠️  자막 생성 실패, 자막 없이 진행합니다", log_lines)
                         subtitle_file = None
 
-                    log_output = self.log("", log_output)
-                    yield log_output, None, scripts_formatted
+                    self.log("", log_lines)
+                    yield self.render_log(log_lines), None, scripts_formatted
 
                 except Exception as e:
-                    log_output = self.log(f"⚠️  자막 생성 중 오류: {str(e)}", log_output)
-                    log_output = self.log("→ 자막 없이 진행합니다", log_output)
-                    log_output = self.log("", log_output)
+                    self.log(f"⚠️  자막 생성 중 오류: {str(e)}", log_lines)
+                    self.log("→ 자막 없이 진행합니다", log_lines)
+                    self.log("", log_lines)
                     subtitle_file = None
-                    yield log_output, None, scripts_formatted
+                    yield self.render_log(log_lines), None, scripts_formatted
 
             # ===== STEP 5: 영상 렌더링 =====
             progress(0.75, desc="영상 렌더링 중...")
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log(f"🎬 STEP 4: 영상 렌더링 ({resolution_choice})", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            yield log_output, None, scripts_formatted
-
-            # 화살표 마커(★1, ★2 등) 영역을 슬라이드 이미지에서 제거
-            # (영상에서 마커가 보이지 않도록)
-            marker_removal_count = 0
-            for script_item in scripts_data:
-                arrow_pointers = script_item.get("arrow_pointers", [])
-                if arrow_pointers:
-                    slide_idx = script_item.get("index", 0)
-                    slide_path = config.SLIDES_IMG_DIR / f"slide_{slide_idx:03d}.png"
-
-                    if slide_path.exists():
-                        bboxes = []
-                        for arrow in arrow_pointers:
-                            bbox = arrow.get("marker_bbox")
-                            if bbox:
-                                bboxes.append(bbox)
-
-                        if bboxes:
-                            # KeywordMarker를 사용하여 마커 제거 (인페인팅)
-                            temp_marker = KeywordMarker(use_ocr=False)
-                            temp_marker.remove_markers_from_image(
-                                str(slide_path),
-                                bboxes,
-                                output_path=str(slide_path),  # 원본 덮어쓰기
-                                method="inpaint"
-                            )
-                            marker_removal_count += len(bboxes)
-
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log(f"🎬 STEP 4: 영상 렌더링 ({resolution_choice})", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            yield self.render_log(log_lines), None, scripts_formatted
+
+            # TTS와 함께 진행한 화살표 마커 제거 결과 (렌더링 전에 반드시 끝나 있어야 함)
+            marker_removal_count = marker_future.result()
             if marker_removal_count > 0:
-                log_output = self.log(f"🧹 화살표 마커 {marker_removal_count}개 제거 완료 (영상에서 숨김)", log_output)
-                log_output = self.log("", log_output)
-                yield log_output, None, scripts_formatted
+                self.log(f"🧹 화살표 마커 {marker_removal_count}개 제거 완료 (영상에서 숨김)", log_lines)
+                self.log("", log_lines)
+                yield self.render_log(log_lines), None, scripts_formatted
 
             # 영상 품질 매핑 (CRF: 낮을수록 고품질)
             quality_map = {"high": 18, "medium": 23, "low": 28}
@@ -3038,20 +4311,27 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             # 인코딩 속도 매핑
             preset_value = encoding_speed  # "fast", "medium", "slow"
 
-            log_output = self.log(f"  - 영상 품질: {video_quality} (CRF: {crf_value})", log_output)
-            log_output = self.log(f"  - 인코딩 속도: {encoding_speed}", log_output)
-            log_output = self.log(f"  - 전환 효과: {transition_effect} ({transition_duration}초)", log_output)
-            log_output = self.log("", log_output)
-
             renderer = FFmpegRenderer(
                 width=width,
                 height=height,
                 fps=config.VIDEO_FPS,
                 preset=preset_value,
-                crf=crf_value
+                crf=crf_value,
+                codec=video_codec or config.VIDEO_CODEC
             )
 
-            success = renderer.render_video(
+            self.log(f"  - 영상 품질: {video_quality} (CRF: {crf_value})", log_lines)
+            self.log(f"  - 인코딩 속도: {encoding_speed}", log_lines)
+            self.log(f"  - 비디오 인코더: {renderer.hw_encoder or 'libx264'}", log_lines)
+            self.log(f"  - 전환 효과: {transition_effect} ({transition_duration}초)", log_lines)
+            self.log("", log_lines)
+
+            # 기존 출력 파일은 결과 캐시와 하드링크로 공유될 수 있으므로
+            # 덮어쓰기 전에 링크를 끊어 캐시 원본이 손상되지 않게 함
+            final_video.unlink(missing_ok=True)
+
+            success = self._run_with_progress(
+                progress, 0.75, "영상 렌더링 중...", renderer.render_video,
                 slides_json,
                 audio_meta_json,
                 config.SLIDES_IMG_DIR,
@@ -3063,17 +4343,22 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 transition_effect=transition_effect,
                 transition_duration=transition_duration,
                 subtitle_file=subtitle_file,  # 자막 파일 (선택적)
-                subtitle_font_size=int(subtitle_font_size)  # 자막 크기
+                subtitle_font_size=int(subtitle_font_size),  # 자막 크기
+                # 각 단계 결과를 메모리로 전달 (JSON 파일 재파싱 생략)
+                slides=slides,
+                audio_meta=audio_meta,
+                scripts=scripts_data,
+                max_workers=config.RENDER_WORKERS
             )
 
             if not success:
-                log_output = self.log("❌ 영상 렌더링 실패", log_output)
-                log_output = self.log("", log_output)
-                log_output = self.log("💡 가능한 원인:", log_output)
-                log_output = self.log("  1. 슬라이드 이미지 파일이 없음", log_output)
-                log_output = self.log("  2. FFmpeg 설치 필요", log_output)
-                log_output = self.log("  3. 파일 권한 문제", log_output)
-                yield log_output, None, scripts_formatted
+                self.log("❌ 영상 렌더링 실패", log_lines)
+                self.log("", log_lines)
+                self.log("💡 가능한 원인:", log_lines)
+                self.log("  1. 슬라이드 이미지 파일이 없음", log_lines)
+                self.log("  2. FFmpeg 설치 필요", log_lines)
+                self.log("  3. 파일 권한 문제", log_lines)
+                yield self.render_log(log_lines, full=True), None, scripts_formatted
                 return
 
             # 완료
@@ -3081,44 +4366,49 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
             file_size_mb = final_video.stat().st_size / (1024 * 1024)
 
-            log_output = self.log("", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("✅ 변환 완료!", log_output)
-            log_output = self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_output)
-            log_output = self.log("", log_output)
-            log_output = self.log("📊 최종 결과:", log_output)
-            log_output = self.log(f"  • 슬라이드 수: {len(slides)}개", log_output)
-            log_output = self.log(f"  • 총 길이: {total_duration:.1f}초 ({total_duration/60:.1f}분)", log_output)
-            log_output = self.log(f"  • 해상도: {resolution_choice}", log_output)
-            log_output = self.log(f"  • 음성: {voice_choice}", log_output)
-            log_output = self.log(f"  • 파일 크기: {file_size_mb:.1f} MB", log_output)
-            log_output = self.log(f"  • 출력 파일: {final_video.name}", log_output)
+            self.log("", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("✅ 변환 완료!", log_lines)
+            self.log("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━", log_lines)
+            self.log("", log_lines)
+            self.log("📊 최종 결과:", log_lines)
+            self.log(f"  • 슬라이드 수: {len(slides)}개", log_lines)
+            self.log(f"  • 총 길이: {total_duration:.1f}초 ({total_duration/60:.1f}분)", log_lines)
+            self.log(f"  • 해상도: {resolution_choice}", log_lines)
+            self.log(f"  • 음성: {voice_choice}", log_lines)
+            self.log(f"  • 파일 크기: {file_size_mb:.1f} MB", log_lines)
+            self.log(f"  • 출력 파일: {final_video.name}", log_lines)
+
+            # 결과 캐시 등록 (다음에 같은 입력이면 즉시 반환)
+            self._store_result_cache(final_video, cache_video, cache_scripts, scripts_formatted)
 
             # 목표 시간 vs 실제 시간 검증
             target_seconds = total_duration_minutes * 60
             difference = total_duration - target_seconds
             difference_percent = (difference / target_seconds) * 100
 
-            log_output = self.log("", log_output)
-            log_output = self.log("⏱️  시간 검증:", log_output)
-            log_output = self.log(f"  • 목표: {total_duration_minutes}분 ({target_seconds}초)", log_output)
-            log_output = self.log(f"  • 실제: {total_duration/60:.1f}분 ({total_duration:.1f}초)", log_output)
+            self.log("", log_lines)
+            self.log("⏱️  시간 검증:", log_lines)
+            self.log(f"  • 목표: {total_duration_minutes}분 ({target_seconds}초)", log_lines)
+            self.log(f"  • 실제: {total_duration/60:.1f}분 ({total_duration:.1f}초)", log_lines)
             if abs(difference) < 10:
-                log_output = self.log(f"  ✓ 목표 시간에 근접합니다 (차이: {difference:+.1f}초)", log_output)
+                self.log(f"  ✓ 목표 시간에 근접합니다 (차이: {difference:+.1f}초)", log_lines)
             elif difference > 0:
-                log_output = self.log(f"  ⚠️ 목표보다 {difference:.1f}초 깁니다 ({difference_percent:+.1f}%)", log_output)
+                self.log(f"  ⚠️ 목표보다 {difference:.1f}초 깁니다 ({difference_percent:+.1f}%)", log_lines)
             else:
-                log_output = self.log(f"  ⚠️ 목표보다 {abs(difference):.1f}초 짧습니다 ({difference_percent:.1f}%)", log_output)
+                self.log(f"  ⚠️ 목표보다 {abs(difference):.1f}초 짧습니다 ({difference_percent:.1f}%)", log_lines)
 
-            yield log_output, str(final_video), scripts_formatted
+            yield self.render_log(log_lines, full=True), str(final_video), scripts_formatted
 
         except Exception as e:
             error_msg = f"\n\n❌ 오류 발생: {str(e)}\n\n상세 정보는 터미널을 확인하세요."
-            log_output = self.log(error_msg, log_output)
+            self.log(error_msg, log_lines)
             print(f"Error: {e}")
-            import traceback
             traceback.print_exc()
-            yield log_output, None, scripts_formatted
+            yield self.render_log(log_lines, full=True), None, scripts_formatted
+        finally:
+            # 오류로 중단돼도 OCR 워커 프로세스가 남지 않도록 정리
+            self._shutdown_slide_ocr(ocr_executor, ocr_futures)
 
     def create_interface(self):
         """Gradio 인터페이스 생성"""
@@ -3134,6 +4424,11 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             font-size: 13px;
             line-height: 1.6;
         }
+        /* 진행 로그는 고정 높이에서 브라우저가 직접 스크롤 (줄바꿈 재계산/자동 높이 조정 없음) */
+        #progress-log textarea {
+            white-space: pre;
+            overflow: auto;
+        }
         """
 
         with gr.Blocks(css=custom_css, title="PPT to Video Converter") as demo:
@@ -3227,7 +4522,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     )
 
                     resolution_choice = gr.Dropdown(
-                        choices=["1920x1080", "1280x720", "3840x2160"],
+                        choices=list(_RESOLUTIONS),
                         value="1920x1080",
                         label="해상도",
                         info="1080p 권장"
@@ -3300,6 +4595,14 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                         info="fast = 빠르지만 큰 파일, slow = 느리지만 작은 파일"
                     )
 
+                    codec_choices = available_video_codecs()
+                    video_codec = gr.Dropdown(
+                        choices=list(codec_choices),
+                        value=config.VIDEO_CODEC if config.VIDEO_CODEC in codec_choices else "auto",
+                        label="비디오 인코더",
+                        info="auto = GPU 하드웨어 인코더(NVENC/QSV/VideoToolbox) 자동 선택, 없으면 libx264"
+                    )
+
                     gr.Markdown("---")
                     gr.Markdown("### 🚀 단계별 실행")
 
@@ -3310,19 +4613,28 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 with gr.Column(scale=1):
                     gr.Markdown("### 📥 진행 상황 (Claude의 사고 과정)")
 
+                    # 스트리밍 중 매 업데이트마다 높이 재계산/복사 버튼 상태 갱신이 없도록 높이를 고정하고,
+                    # 복사는 별도 버튼에서 브라우저 JS로만 처리 (서버 왕복 없음)
                     progress_output = gr.Textbox(
                         label="상세 로그",
                         lines=25,
-                        max_lines=30,
-                        elem_classes=["output-text"],
-                        show_copy_button=True
+                        max_lines=25,
+                        elem_id="progress-log",
+                        elem_classes=["output-text"]
+                    )
+                    copy_log_btn = gr.Button("📋 로그 복사", size="sm")
+                    copy_log_btn.click(
+                        fn=None,
+                        js="() => { navigator.clipboard.writeText(document.querySelector('#progress-log textarea').value); }"
                     )
 
                     # 출력 영역
                     with gr.Row():
                         with gr.Column(visible=True) as video_output_col:
+                            # 렌더러가 H.264/yuv420p/+faststart MP4를 내보내므로 형식을 mp4로 고정해 후처리 변환이 일어나지 않게 함
                             video_output = gr.Video(
                                 label="완성된 영상 (MP4)",
+                                format="mp4",
                                 autoplay=False
                             )
 
@@ -3352,17 +4664,11 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                             )
 
                     # PPT 업로드 시 슬라이드 개수 분석 및 영상 길이 옵션 업데이트
-                    def update_duration_options(pptx_file):
-                        """PPT 업로드 시 슬라이드 개수에 따라 영상 길이 옵션 업데이트"""
-                        slide_count = self.count_slides(pptx_file)
-                        choices, value, info = self.get_available_durations(slide_count)
-
-                        return gr.Dropdown(choices=choices, value=value, info=info), slide_count
-
                     pptx_input.change(
-                        fn=update_duration_options,
+                        fn=partial(_update_duration_options, self),
                         inputs=[pptx_input],
-                        outputs=[total_duration, slide_count_state]
+                        outputs=[total_duration, slide_count_state],
+                        concurrency_limit=None  # 가벼운 작업이라 렌더링 대기열과 무관하게 바로 실행
                     )
 
                     # 변환 모드 변경 시 리액턴트 출력 형식 표시/숨김
@@ -3374,7 +4680,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     conversion_mode.change(
                         fn=update_reactant_options,
                         inputs=[conversion_mode],
-                        outputs=[reactant_output_format]
+                        outputs=[reactant_output_format],
+                        concurrency_limit=None
                     )
 
                     # 출력 형식 변경 시 출력 컬럼 전환
@@ -3388,13 +4695,15 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     conversion_mode.change(
                         fn=update_output_columns,
                         inputs=[conversion_mode, reactant_output_format],
-                        outputs=[video_output_col, html_output_col]
+                        outputs=[video_output_col, html_output_col],
+                        concurrency_limit=None
                     )
 
                     reactant_output_format.change(
                         fn=update_output_columns,
                         inputs=[conversion_mode, reactant_output_format],
-                        outputs=[video_output_col, html_output_col]
+                        outputs=[video_output_col, html_output_col],
+                        concurrency_limit=None
                     )
 
                     # 1단계: 대본 생성 버튼 이벤트
@@ -3427,9 +4736,12 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                             transition_effect,
                             transition_duration,
                             video_quality,
-                            encoding_speed
+                            encoding_speed,
+                            video_codec
                         ],
-                        outputs=[progress_output, video_output, zip_download, html_preview]
+                        outputs=[progress_output, video_output, zip_download, html_preview],
+                        concurrency_limit=1,
+                        concurrency_id="render_queue"
                     )
 
                 # ============================================================
@@ -3576,14 +4888,18 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                         inputs=[video_path_state, segments_file_state, subtitle_upscale_target, subtitle_log,
                                 subtitle_original, subtitle_editor, subtitle_corrected, subtitle_choice,
                                 opening_image, closing_image],
-                        outputs=[subtitle_log, subtitle_preview, subtitle_step3_btn]
+                        outputs=[subtitle_log, subtitle_preview, subtitle_step3_btn],
+                        concurrency_limit=1,
+                        concurrency_id="render_queue"
                     )
 
                     # Step 3: 업스케일 및 최종 저장 (이전 로그 유지)
                     subtitle_step3_btn.click(
                         fn=self.process_subtitle_mode_step3,
                         inputs=[subtitle_upscale_target, subtitle_log],
-                        outputs=[subtitle_log, subtitle_final_output]
+                        outputs=[subtitle_log, subtitle_final_output],
+                        concurrency_limit=1,
+                        concurrency_id="render_queue"
                     )
 
                 # ============================================================
@@ -3619,7 +4935,9 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     convert_mp4_btn.click(
                         fn=self.convert_to_compatible_mp4,
                         inputs=[mp4_input],
-                        outputs=[mp4_progress, mp4_output]
+                        outputs=[mp4_progress, mp4_output],
+                        concurrency_limit=1,
+                        concurrency_id="render_queue"
                     )
 
             # ============================================================
@@ -3651,6 +4969,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 def main():
     """메인 함수: Gradio UI 실행"""
 
+    # 이벤트 루프는 Gradio가 띄우는 uvicorn이 고름 (loop="auto": uvloop가 설치되어 있으면 자동으로 사용)
+
     # API 키 확인
     if not config.ANTHROPIC_API_KEY or config.ANTHROPIC_API_KEY == "":
         print("⚠️  경고: ANTHROPIC_API_KEY가 설정되지 않았습니다.")
@@ -3666,24 +4986,37 @@ def main():
     ui = GradioUI()
     demo = ui.create_interface()
 
-    print("=" * 60)
-    print("🚀 PPT to Video Converter - Gradio UI (상세 버전)")
-    print("=" * 60)
-    print()
+    if config.DEBUG:
+        print("=" * 60)
+        print("🚀 PPT to Video Converter - Gradio UI (상세 버전)")
+        print("=" * 60)
+        print()
     print("브라우저에서 http://localhost:7863 으로 접속하세요")
     print("종료하려면 Ctrl+C를 누르세요")
     print()
 
+    # 진행 로그는 이미 화면(progress_output)으로 스트리밍되므로 요청마다 찍히는 접근 로그는 끔
+    # (DEBUG=true면 Gradio/uvicorn 로그를 그대로 출력)
+    if not config.DEBUG:
+        logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+
     # Gradio 앱 실행
     # Queue 활성화: 긴 작업(TTS, 렌더링) 처리 시 웹소켓 연결 유지
+    # 모든 세션이 같은 작업 폴더(slides/audio/clips, meta/*.json)를 공유하므로 변환 작업은 이벤트마다 1개씩 처리 (Gradio 기본값)
+    # FFmpeg 렌더링 버튼들은 "render_queue" 하나로 묶어 버튼이 달라도 한 번에 하나만 인코딩하고,
+    # 업로드/옵션 변경 같은 가벼운 이벤트는 제한 없이 바로 처리
+    # (핸들러는 동기 제너레이터라 Gradio 워커 스레드에서 실행되어 이벤트 루프를 막지 않음)
     demo.queue(max_size=20)
 
+    # 서버가 뜨는 동안 FFmpeg/LibreOffice 콜드 스타트를 백그라운드에서 미리 처리
+    threading.Thread(target=_warmup, name="warmup", daemon=True).start()
+
     demo.launch(
         server_name="0.0.0.0",
         server_port=7863,
         share=False,
         show_error=True,
-        quiet=False
+        quiet=not config.DEBUG
     )
 
 